@@ -4,12 +4,15 @@ Flask server for LLM Contracts Validator Frontend
 Provides API endpoints to validate LLM outputs using the actual llm-contracts library
 """
 
-import os
+import hashlib
+import io
 import json
-import tempfile
+import os
 import sys
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, request, jsonify, send_from_directory, stream_with_context
 from flask_cors import CORS
 import yaml
 
@@ -18,7 +21,9 @@ sys.path.append(str(Path(__file__).resolve().parent.parent))
 
 # Import llm-contracts library
 from llm_contracts import contracts
-from llm_contracts.core.validator import ValidationError
+from llm_contracts.core.schema import SchemaError
+from llm_contracts.core.rules import RuleError
+from llm_contracts.core.validator import Contract, ValidationError
 
 app = Flask(__name__, static_folder='.')
 CORS(app)  # Enable CORS for all routes
@@ -33,6 +38,105 @@ def serve_static(path):
     """Serve static files"""
     return send_from_directory('.', path)
 
+class ContractCache:
+    """
+    LRU cache of compiled contracts keyed on a hash of the schema text
+    
+    Clients usually send the same schema with every request, so it is
+    parsed and compiled once and reused until evicted. Contracts are
+    immutable, so one can serve concurrent requests.
+    """
+    
+    def __init__(self, maxsize=128):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, schema_yaml):
+        """Return the compiled contract for schema text, compiling it if needed"""
+        key = hashlib.sha256(schema_yaml.encode('utf-8')).hexdigest()
+        
+        with self._lock:
+            contract = self._entries.get(key)
+            if contract is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return contract
+            self.misses += 1
+        
+        # Compiled outside the lock; schemas that fail to compile aren't cached
+        contract = _compile_schema(schema_yaml)
+        
+        with self._lock:
+            if self.maxsize > 0:
+                self._entries[key] = contract
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        
+        return contract
+    
+    def info(self):
+        """Return hit, miss and eviction counts and the current size"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'maxsize': self.maxsize,
+                'currsize': len(self._entries)
+            }
+
+def _compile_schema(schema_yaml):
+    """Compile the schema text sent by the client, without touching disk"""
+    try:
+        return Contract.from_schema(schema_yaml)
+    except (SchemaError, RuleError) as e:
+        raise ValidationError(f"Validation setup failed: {str(e)}")
+
+# Maximum number of compiled schemas kept; 0 disables caching
+contract_cache = ContractCache(int(os.environ.get('LLM_CONTRACTS_CACHE_SIZE', '128')))
+
+def _parse_output(output):
+    """Parse output as JSON if possible, otherwise keep it as text"""
+    try:
+        return json.loads(output)
+    except (json.JSONDecodeError, TypeError):
+        return output
+
+def _read_ndjson_batch(stream):
+    """
+    Read a schema and outputs from an NDJSON request body
+    
+    The first line is an object with the schema; every following
+    non-blank line is one output, written as it would be in the outputs
+    list of a JSON request (lines that aren't JSON are taken as text).
+    Lines are read as they are consumed.
+    
+    Returns:
+    - (schema_yaml, iterator of outputs)
+    """
+    lines = (line for line in stream if line.strip())
+    try:
+        header = json.loads(next(lines))
+    except StopIteration:
+        header = None
+    except json.JSONDecodeError:
+        raise ValueError('First line must be a JSON object with the schema')
+    
+    if not isinstance(header, dict):
+        return None, iter(())
+    return header.get('schema'), (_parse_ndjson_output(line) for line in lines)
+
+def _parse_ndjson_output(line):
+    """Parse one NDJSON output line like an item of a JSON outputs list"""
+    output = _parse_output(line.decode('utf-8').rstrip('\r\n'))
+    return _parse_output(output) if isinstance(output, str) else output
+
 @app.route('/api/validate', methods=['POST'])
 def validate():
     """
@@ -58,28 +162,98 @@ def validate():
             }), 400
         
         # Parse output as JSON if possible
-        try:
-            output_data = json.loads(output)
-        except (json.JSONDecodeError, TypeError):
-            output_data = output
-        
-        # Write schema to temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as temp_schema:
-            temp_schema.write(schema_yaml)
-            schema_path = temp_schema.name
-        
-        try:
-            # Validate using the actual llm-contracts library
-            result = contracts.validate(output_data, schema_path)
+        output_data = _parse_output(output)
+        
+        # Validate using the actual llm-contracts library
+        result = contracts.validate(output_data, contract_cache.get(schema_yaml))
+        
+        return jsonify({
+            'success': True,
+            'is_valid': result.is_valid,
+            'errors': result.errors
+        })
             
+    except ValidationError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e),
+            'errors': e.errors if hasattr(e, 'errors') else []
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Error: {str(e)}'
+        }), 500
+
+@app.route('/api/validate/batch', methods=['POST'])
+def validate_batch():
+    """
+    Validate many LLM outputs against one schema
+    
+    The schema is compiled once for the whole batch.
+    
+    Expects either a JSON body:
+    - schema: Schema in YAML format
+    - outputs: List of LLM outputs (strings or JSON)
+    - stream: Whether to stream results back as NDJSON (optional)
+    
+    or an NDJSON body (Content-Type: application/x-ndjson) whose first
+    line is {"schema": ...} and every following line one output; outputs
+    are read from the request as they are validated.
+    
+    Returns:
+    - results: One {index, is_valid, errors} per output, in input order
+    - total, passed: Number of outputs and of valid outputs
+    
+    With stream (or ?stream=1, or Accept: application/x-ndjson), each
+    result is written as an NDJSON line as soon as it is ready. An error
+    after streaming has started ends the stream with a
+    {"success": false, "message": ...} line.
+    """
+    try:
+        if request.mimetype == 'application/x-ndjson':
+            schema_yaml, outputs = _read_ndjson_batch(request.stream)
+            stream = True
+        else:
+            data = request.json
+            schema_yaml = data.get('schema')
+            outputs = data.get('outputs')
+            stream = bool(data.get('stream'))
+            if not isinstance(outputs, list):
+                return jsonify({
+                    'success': False,
+                    'message': 'outputs must be a list'
+                }), 400
+            outputs = (_parse_output(output) for output in outputs)
+        
+        stream = (
+            stream
+            or request.args.get('stream') in ('1', 'true')
+            or request.accept_mimetypes.best == 'application/x-ndjson'
+        )
+        
+        if not schema_yaml:
             return jsonify({
-                'success': True,
-                'is_valid': result.is_valid,
-                'errors': result.errors
-            })
-        finally:
-            # Clean up temporary file
-            os.unlink(schema_path)
+                'success': False,
+                'message': 'Missing schema'
+            }), 400
+        
+        # Compiled once (or taken from the cache) for the whole batch
+        results = contract_cache.get(schema_yaml).validate_many(outputs)
+        
+        if stream:
+            return Response(
+                stream_with_context(_stream_results(results)),
+                mimetype='application/x-ndjson'
+            )
+        
+        items = [_batch_item(index, result) for index, result in enumerate(results)]
+        return jsonify({
+            'success': True,
+            'results': items,
+            'total': len(items),
+            'passed': sum(item['is_valid'] for item in items)
+        })
             
     except ValidationError as e:
         return jsonify({
@@ -87,12 +261,33 @@ def validate():
             'message': str(e),
             'errors': e.errors if hasattr(e, 'errors') else []
         }), 400
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 400
     except Exception as e:
         return jsonify({
             'success': False,
             'message': f'Error: {str(e)}'
         }), 500
 
+def _batch_item(index, result):
+    """Describe one result of a batch"""
+    return {
+        'index': index,
+        'is_valid': result.is_valid,
+        'errors': result.errors
+    }
+
+def _stream_results(results):
+    """Yield each batch result as an NDJSON line as soon as it is ready"""
+    try:
+        for index, result in enumerate(results):
+            yield json.dumps(_batch_item(index, result)) + '\n'
+    except Exception as e:
+        yield json.dumps({'success': False, 'message': str(e)}) + '\n'
+
 @app.route('/api/generate-report', methods=['POST'])
 def generate_report():
     """
@@ -119,42 +314,26 @@ def generate_report():
             }), 400
         
         # Parse output as JSON if possible
-        try:
-            output_data = json.loads(output)
-        except (json.JSONDecodeError, TypeError):
-            output_data = output
-        
-        # Write schema to temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as temp_schema:
-            temp_schema.write(schema_yaml)
-            schema_path = temp_schema.name
-        
-        # Create temporary file for report
-        with tempfile.NamedTemporaryFile(mode='w', suffix=f'.{"html" if report_format == "html" else "md"}', delete=False) as temp_report:
-            report_path = temp_report.name
-        
-        try:
-            # Generate report using the actual llm-contracts library
-            result = contracts.validate_and_report(
-                output_data, 
-                schema_path, 
-                report_path, 
-                report_format
-            )
-            
-            # Read the generated report
-            with open(report_path, 'r', encoding='utf-8') as f:
-                report_content = f.read()
-            
-            return jsonify({
-                'success': True,
-                'is_valid': result.is_valid,
-                'report': report_content
-            })
-        finally:
-            # Clean up temporary files
-            os.unlink(schema_path)
-            os.unlink(report_path)
+        output_data = _parse_output(output)
+        
+        # Generate report in memory using the actual llm-contracts library
+        report = io.BytesIO() if report_format == 'html' else io.StringIO()
+        result = contracts.validate_and_report(
+            output_data, 
+            contract_cache.get(schema_yaml), 
+            report, 
+            report_format
+        )
+        
+        report_content = report.getvalue()
+        if isinstance(report_content, bytes):
+            report_content = report_content.decode('utf-8')
+        
+        return jsonify({
+            'success': True,
+            'is_valid': result.is_valid,
+            'report': report_content
+        })
             
     except Exception as e:
         return jsonify({
@@ -162,5 +341,19 @@ def generate_report():
             'message': f'Error: {str(e)}'
         }), 500
 
+@app.route('/api/metrics', methods=['GET'])
+def metrics():
+    """
+    Report server metrics
+    
+    Returns:
+    - contract_cache: Hits, misses and evictions of the compiled schema
+      cache, with its maximum and current size
+    """
+    return jsonify({
+        'success': True,
+        'contract_cache': contract_cache.info()
+    })
+
 if __name__ == '__main__':
     app.run(debug=True, port=5000) 
\ No newline at end of file
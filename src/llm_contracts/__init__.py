@@ -1,27 +1,74 @@
 """LLM Output Validation, Linting, and Assertion Layer."""
 
-from importlib import metadata
-
-try:
-    __version__ = metadata.version("llm-contracts")
-except metadata.PackageNotFoundError:
-    __version__ = "unknown"
-
-from .core.validator import validate_output, ValidationError, ValidationResult
-from .core.schema import SchemaError
-from .core.rules import RuleError
-from .reports.html_generator import generate_html_report
-from .reports.markdown_generator import generate_markdown_report
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_exports
+# Imported eagerly: importing the ``llm_contracts.contracts`` submodule
+# would otherwise leave it, not the singleton, bound to this name
 from .contracts import contracts
 
+if TYPE_CHECKING:
+    from .core.validator import validate_output, Contract, ValidationError, ValidationResult
+    from .core.jsonl import validate_jsonl
+    from .core.violations import Violation
+    from .core.schema import SchemaError
+    from .core.rules import RuleError
+    from .reports.html_generator import generate_html_report
+    from .reports.markdown_generator import generate_markdown_report
+    from .reports.summary import ValidationSummary, generate_summary_report, summarize
+
 __all__ = [
     "contracts",  # New branded API
     "validate_output",  # Backward compatibility
+    "validate_jsonl",
+    "Contract",
     "ValidationError", 
     "ValidationResult",
+    "Violation",
     "SchemaError",
     "RuleError",
     "generate_html_report",
     "generate_markdown_report",
+    "generate_summary_report",
+    "summarize",
+    "ValidationSummary",
     "__version__",
-] 
\ No newline at end of file
+]
+
+# Everything else is imported on first access, so that importing the
+# package doesn't load jsonschema, YAML or the report generators until
+# they are needed
+_getattr, _dir = lazy_exports(__name__, {
+    "validate_output": ".core.validator",
+    "Contract": ".core.validator",
+    "ValidationError": ".core.validator",
+    "ValidationResult": ".core.validator",
+    "validate_jsonl": ".core.jsonl",
+    "Violation": ".core.violations",
+    "SchemaError": ".core.schema",
+    "RuleError": ".core.rules",
+    "generate_html_report": ".reports.html_generator",
+    "generate_markdown_report": ".reports.markdown_generator",
+    "generate_summary_report": ".reports.summary",
+    "summarize": ".reports.summary",
+    "ValidationSummary": ".reports.summary",
+})
+
+# Looked up from the package metadata on first access
+__version__: str
+
+
+def __getattr__(name: str) -> object:
+    if name == "__version__":
+        global __version__
+        from importlib import metadata
+        try:
+            __version__ = metadata.version("llm-contracts")
+        except metadata.PackageNotFoundError:
+            __version__ = "unknown"
+        return __version__
+    return _getattr(name)
+
+
+def __dir__() -> list:
+    return sorted(set(_dir()) | {"__version__"})
@@ -0,0 +1,45 @@
+"""Public names imported on first access rather than with the package."""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    module_name: str,
+    exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build a module's ``__getattr__`` and ``__dir__`` for lazily imported names.
+
+    The first access to an exported name imports the module defining it
+    and stores the value on the module, so later accesses are ordinary
+    attribute lookups.
+
+    Args:
+        module_name: ``__name__`` of the module exporting the names
+        exports: Maps each name to the module defining it, relative to
+            the exporting module's package (e.g. ``".core.validator"``)
+
+    Returns:
+        (__getattr__, __dir__) functions to assign in the module
+
+    Example:
+        >>> __getattr__, __dir__ = lazy_exports(__name__, {
+        ...     "generate_html_report": ".reports.html_generator",
+        ... })
+    """
+    module = sys.modules[module_name]
+
+    def __getattr__(name: str) -> Any:
+        source = exports.get(name)
+        if source is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(source, module.__package__), name)
+        setattr(module, name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(module)) | set(exports))
+
+    return __getattr__, __dir__
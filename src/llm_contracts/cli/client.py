@@ -0,0 +1,182 @@
+"""Client for a running ``llm-validate serve`` validation server."""
+
+import json
+import os
+import socket
+import stat
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Union
+
+# Environment variable naming the server's socket
+SOCKET_ENV = "LLM_VALIDATE_SOCKET"
+
+
+def default_socket_path() -> str:
+    """
+    Return the socket path the server listens on and clients look for.
+
+    ``$LLM_VALIDATE_SOCKET`` if set, otherwise a per-user socket in
+    ``$XDG_RUNTIME_DIR``, or in a private per-user directory inside the
+    temporary directory, which other users share.
+    """
+    path = os.environ.get(SOCKET_ENV)
+    if path:
+        return path
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, f"llm-validate-{_user()}.sock")
+    return os.path.join(fallback_socket_directory(), "server.sock")
+
+
+def fallback_socket_directory() -> str:
+    """Return the private directory for the socket when there is no runtime directory."""
+    return os.path.join(tempfile.gettempdir(), f"llm-validate-{_user()}")
+
+
+def ensure_private_directory(directory: Union[str, Path]) -> None:
+    """
+    Create a directory only the current user can access, or check an existing one.
+
+    Raises:
+        RuntimeError: If the path exists but isn't a directory owned by
+            the current user, or is accessible to anyone else
+    """
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+
+    info = os.lstat(directory)
+    if (
+        not stat.S_ISDIR(info.st_mode)
+        or info.st_uid != os.getuid()
+        or stat.S_IMODE(info.st_mode) & 0o077
+    ):
+        raise RuntimeError(
+            f"{directory} must be a directory owned by the current user "
+            f"and inaccessible to others"
+        )
+
+
+def _user() -> str:
+    return str(os.getuid()) if hasattr(os, "getuid") else os.getlogin()
+
+
+def _is_private_socket(socket_path: Union[str, Path]) -> bool:
+    """Check that a socket belongs to the current user and only they can use it."""
+    try:
+        info = os.lstat(socket_path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISSOCK(info.st_mode)
+        and info.st_uid == os.getuid()
+        and stat.S_IMODE(info.st_mode) == 0o600
+    )
+
+
+class ServerError(Exception):
+    """Raised when the validation server rejects a request or goes away."""
+
+
+class RemoteResult(NamedTuple):
+    """Validation result as reported by the server."""
+
+    is_valid: bool
+    errors: List[str]
+
+
+class ServerClient:
+    """
+    Connection to a validation server.
+
+    Requests and responses are single lines of JSON, answered in order.
+
+    Example:
+        >>> client = ServerClient.connect(default_socket_path())
+        >>> if client is not None:
+        ...     with client:
+        ...         result = client.validate_file('schema.yaml', 'output.json')
+    """
+
+    def __init__(self, sock: socket.socket):
+        self._socket = sock
+        self._file = sock.makefile("rwb")
+        # Whether any schema used so far sets ``strict: true``
+        self.strict = False
+
+    @classmethod
+    def connect(cls, socket_path: Union[str, Path]) -> Optional["ServerClient"]:
+        """
+        Connect to the server listening on a Unix socket.
+
+        The socket is only trusted if it is owned by the current user and
+        has mode 0600, as the server creates it; anything else could be
+        another user answering with forged results.
+
+        Returns:
+            Connected client, or None if no trusted server is listening there
+        """
+        if not hasattr(socket, "AF_UNIX") or not _is_private_socket(socket_path):
+            return None
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            # Stale socket file left behind by a server that has exited
+            sock.close()
+            return None
+        return cls(sock)
+
+    def request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send one request and wait for its response.
+
+        Raises:
+            ServerError: If the server reports an error or closes the connection
+        """
+        try:
+            self._file.write(json.dumps(request).encode("utf-8") + b"\n")
+            self._file.flush()
+            line = self._file.readline()
+        except OSError as e:
+            raise ServerError(f"Lost connection to validation server: {e}")
+
+        if not line:
+            raise ServerError("Validation server closed the connection")
+
+        response: Dict[str, Any] = json.loads(line)
+        if "error" in response:
+            raise ServerError(response["error"])
+        return response
+
+    def validate_file(
+        self,
+        schema_path: Union[str, Path],
+        output_file: Union[str, Path]
+    ) -> RemoteResult:
+        """
+        Have the server read and validate an output file.
+
+        Paths are made absolute first, since the server may run in a
+        different working directory.
+        """
+        response = self.request({
+            "schema": os.path.abspath(schema_path),
+            "path": os.path.abspath(output_file),
+        })
+        self.strict = self.strict or response["strict"]
+        return RemoteResult(response["valid"], response["errors"])
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._file.close()
+        self._socket.close()
+
+    def __enter__(self) -> "ServerClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
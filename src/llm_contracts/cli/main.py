@@ -1,17 +1,64 @@
 """Command-line interface for llm-contracts."""
 
+import functools
+import glob
+import itertools
 import json
+import os
+import signal
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import (
+    TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple,
+    Union, cast
+)
 
 import click
 
-from ..core.validator import validate_output, ValidationError
+from .client import RemoteResult, ServerClient, ServerError, default_socket_path
+
+# The validator is imported on first use, so forwarding to a running
+# server doesn't pay for loading it
+if TYPE_CHECKING:
+    from ..core.validator import Contract, ValidationResult
+
+_Result = Union["ValidationResult", RemoteResult]
+
+
+class _DefaultCommandGroup(click.Group):
+    """
+    Command group that runs ``validate`` unless another command is named.
+    
+    Keeps ``llm-validate output.json --schema schema.yaml`` working
+    alongside subcommands such as ``llm-validate serve``. No arguments,
+    or only a help option, show the group's help with every command.
+    """
+    
+    def parse_args(self, ctx: click.Context, args: List[str]) -> List[str]:
+        if args and args[0] not in self.commands and args[0] not in ctx.help_option_names:
+            args = ["validate"] + list(args)
+        return super().parse_args(ctx, args)
+
+
+@click.group(
+    cls=_DefaultCommandGroup,
+    context_settings={"help_option_names": ["-h", "--help"]}
+)
+def main() -> None:
+    """
+    Validate LLM output against a schema.
+    
+    Runs the validate command unless the first argument names another
+    command, so "llm-validate output.json --schema schema.yaml" is the
+    same as "llm-validate validate output.json --schema schema.yaml".
+    To validate a file named like a command, write it as "./serve", or
+    give the options first and put "--" before it:
+    "llm-validate --schema schema.yaml -- serve".
+    """
 
 
-@click.command()
-@click.argument("output_file", type=click.Path(exists=True, path_type=Path))
+@main.command()
+@click.argument("paths", nargs=-1, required=True)
 @click.option(
     "--schema", 
     "-s", 
@@ -39,72 +86,445 @@ from ..core.validator import validate_output, ValidationError
 @click.option(
     "--md-report",
     type=click.Path(path_type=Path),
-    help="Generate Markdown report file"
+    help="Generate Markdown report file (single output file only)"
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of worker processes for multiple files (default: CPU count)"
 )
-def main(
-    output_file: Path,
+@click.option(
+    "--jsonl",
+    is_flag=True,
+    help="Read each file as JSON Lines and validate every record"
+)
+@click.option(
+    "--field",
+    help="Field of each JSONL record holding the output (dotted path)"
+)
+@click.option(
+    "--output",
+    "-o",
+    "results_file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write JSONL results to this file instead of stdout"
+)
+@click.option(
+    "--server/--no-server",
+    default=True,
+    help="Forward to a running 'llm-validate serve' if there is one"
+)
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(path_type=Path),
+    help="Socket of the validation server (default: $LLM_VALIDATE_SOCKET)"
+)
+def validate(
+    paths: Tuple[str, ...],
     schema: Path,
     output_format: str,
     strict: bool,
     html_report: Optional[Path] = None,
-    md_report: Optional[Path] = None
+    md_report: Optional[Path] = None,
+    jobs: Optional[int] = None,
+    jsonl: bool = False,
+    field: Optional[str] = None,
+    results_file: Optional[Path] = None,
+    server: bool = True,
+    socket_path: Optional[Path] = None
 ) -> None:
     """
     Validate LLM output against a schema.
     
-    OUTPUT_FILE: Path to the file containing LLM output to validate
+    PATHS: Files containing LLM output to validate, directories to
+    validate every file in (recursively), or glob patterns
+    
+    With --jsonl, every line of every file is a record to validate, and
+    one JSON result per record is written to stdout or --output.
+    
+    While 'llm-validate serve' is running, validations without reports,
+    --jsonl or --jobs are forwarded to it, skipping schema loading here.
     """
+    if (field or results_file) and not jsonl:
+        raise click.UsageError("--field and --output require --jsonl")
+    
+    output_files = _expand_paths(paths)
+    single_file = len(paths) == 1 and Path(paths[0]).is_file() and not jsonl
+    
+    if md_report and not single_file:
+        raise click.UsageError(
+            "--md-report supports a single output file; use --html-report for many"
+        )
+    
+    client = None
+    if server and not (html_report or md_report or jsonl or jobs):
+        client = ServerClient.connect(socket_path or default_socket_path())
+    
+    validate_file: Callable[[Path], _Result]
+    validate_files: Callable[[Iterator[Path]], Iterable[Tuple[Path, _Result]]]
     try:
-        # Read output file
-        with open(output_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Try to parse as JSON, fallback to text
-        try:
-            output_data = json.loads(content)
-        except json.JSONDecodeError:
-            output_data = content
-        
-        # Validate output
-        result = validate_output(output_data, schema)
+        if client is not None:
+            # The server keeps the compiled schema warm between runs
+            validate_file = functools.partial(client.validate_file, schema)
+            validate_files = functools.partial(_forward_files, client, schema)
+        else:
+            # Load and compile the schema once for every file
+            from ..core.validator import _resolve_contract
+            contract = _resolve_contract(schema)
+            strict = strict or contract.strict
+            validate_file = functools.partial(_validate_file, contract)
+            validate_files = functools.partial(_validate_files, contract, jobs=jobs)
         
-        # Output results
-        if output_format == "json":
-            _output_json(result, output_file, schema)
+        if single_file:
+            output_file = next(output_files)
+            result = validate_file(output_file)
+            
+            # Output results
+            if output_format == "json":
+                _output_json(result, output_file, schema)
+            else:
+                _output_text(result, output_file, schema)
+            results: Iterable[_Result] = [result]
+        elif jsonl:
+            results = _validate_jsonl_files(
+                contract, output_files, field, results_file, jobs
+            )
         else:
-            _output_text(result, output_file, schema)
+            results = _echo_results(validate_files(output_files), schema, output_format)
+        
+        totals = _Totals(results)
         
-        # Generate HTML report if requested
+        # Generate HTML report if requested; results stream through it.
+        # Runs with reports are never forwarded, so every result is local
         if html_report:
             from ..reports.html_generator import generate_html_report
-            generate_html_report(result, str(html_report), str(schema))
+            generate_html_report(
+                cast(Iterable["ValidationResult"], totals), str(html_report), str(schema)
+            )
             click.echo(f"📄 HTML report generated: {html_report}")
+        else:
+            totals.consume()
         
         # Generate Markdown report if requested
         if md_report:
             from ..reports.markdown_generator import generate_markdown_report
             from ..core.schema import load_schema
             schema_content = load_schema(schema)
-            generate_markdown_report(result, str(md_report), str(schema), schema_content)
+            generate_markdown_report(
+                cast("ValidationResult", result), str(md_report), str(schema),
+                schema_content
+            )
             click.echo(f"📝 Markdown report generated: {md_report}")
         
+        if client is not None:
+            strict = strict or client.strict
+        
         # Exit with error code if validation failed and strict mode is enabled
-        if strict and not result.is_valid:
+        if strict and totals.failed:
             sys.exit(1)
             
-    except ValidationError as e:
-        click.echo(f"Validation error: {e.message}", err=True)
-        if e.errors:
-            for error in e.errors:
-                click.echo(f"  - {error}", err=True)
+    except ServerError as e:
+        click.echo(f"Validation error: {e}", err=True)
         sys.exit(1)
     except Exception as e:
-        click.echo(f"Unexpected error: {str(e)}", err=True)
+        from ..core.validator import ValidationError
+        if isinstance(e, ValidationError):
+            click.echo(f"Validation error: {e.message}", err=True)
+            for error in e.errors:
+                click.echo(f"  - {error}", err=True)
+        else:
+            click.echo(f"Unexpected error: {str(e)}", err=True)
         sys.exit(1)
+    finally:
+        if client is not None:
+            client.close()
+
+
+@main.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(path_type=Path),
+    help="Unix socket to listen on (default: $LLM_VALIDATE_SOCKET)"
+)
+@click.option(
+    "--stdio",
+    is_flag=True,
+    help="Answer requests on stdin/stdout instead of a socket"
+)
+def serve(socket_path: Optional[Path], stdio: bool) -> None:
+    """
+    Keep schemas compiled and validate requests from other processes.
+    
+    Requests and responses are JSON objects, one per line. A request
+    names a schema file and either an output file or the output itself:
+    
+    \b
+        {"id": 1, "schema": "/abs/schema.yaml", "path": "/abs/output.json"}
+        {"id": 2, "schema": "/abs/schema.yaml", "output": {"name": "A"}}
+    
+    Each is answered with its "valid", "errors", "error_count" and
+    "strict", or with an "error" message. Schemas are reloaded when their
+    files change. Relative paths are resolved against the server's
+    working directory.
+    
+    While listening on the default socket, 'llm-validate' commands run by
+    the same user forward their validations here.
+    """
+    from .server import serve_stream, serve_unix
+    # Load the validator before the first request arrives
+    from ..core import validator  # noqa: F401
+    
+    if stdio:
+        serve_stream(_handle_request, sys.stdin.buffer, sys.stdout.buffer)
+        return
+    
+    socket_path = socket_path or Path(default_socket_path())
+    # Stop cleanly, removing the socket, when terminated
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    click.echo(f"Listening on {socket_path}", err=True)
+    try:
+        serve_unix(_handle_request, socket_path)
+    except RuntimeError as e:
+        raise click.ClickException(str(e))
+    except KeyboardInterrupt:
+        pass
+
+
+def _handle_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate one server request with the (cached) contract it names."""
+    from ..core.validator import ValidationError, _resolve_contract
+    
+    if "schema" not in request or ("path" in request) == ("output" in request):
+        raise ValueError("Request needs a 'schema' and either a 'path' or an 'output'")
+    
+    try:
+        contract = _resolve_contract(request["schema"])
+    except ValidationError as e:
+        raise ValueError(e.message)
+    
+    if "path" in request:
+        result = _validate_file_safely(contract, Path(request["path"]))
+    else:
+        result = contract._evaluate(request["output"])
+    
+    errors = result.errors
+    return {
+        "valid": result.is_valid,
+        "errors": errors,
+        "error_count": len(errors),
+        "strict": contract.strict,
+    }
+
+
+def _expand_paths(paths: Tuple[str, ...]) -> Iterator[Path]:
+    """
+    Check every path argument, then lazily list the files they name.
+    
+    Raises:
+        click.BadParameter: If a path doesn't exist and matches no files
+    """
+    sources = []
+    for raw in paths:
+        path = Path(raw)
+        if path.exists():
+            sources.append(path)
+        elif glob.has_magic(raw):
+            matches = sorted(glob.glob(raw, recursive=True))
+            if not matches:
+                raise click.BadParameter(
+                    f"Pattern '{raw}' does not match any files.", param_hint="PATHS"
+                )
+            sources.extend(Path(match) for match in matches)
+        else:
+            raise click.BadParameter(
+                f"Path '{raw}' does not exist.", param_hint="PATHS"
+            )
+    return _iter_files(sources)
+
+
+def _iter_files(sources: List[Path]) -> Iterator[Path]:
+    for source in sources:
+        if source.is_dir():
+            yield from sorted(p for p in source.rglob("*") if p.is_file())
+        else:
+            yield source
+
+
+def _validate_file(contract: "Contract", output_file: Path) -> "ValidationResult":
+    """Read one output file and validate it, without applying strict mode."""
+    # Read output file
+    with open(output_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    # Try to parse as JSON, fallback to text
+    try:
+        output_data = json.loads(content)
+    except json.JSONDecodeError:
+        output_data = content
+    
+    return contract._evaluate(output_data)
+
+
+def _validate_file_safely(contract: "Contract", output_file: Path) -> "ValidationResult":
+    """Validate one of many files, reporting an unreadable file as a failure."""
+    try:
+        return _validate_file(contract, output_file)
+    except (OSError, UnicodeDecodeError) as e:
+        from ..core.validator import ValidationResult
+        return ValidationResult(False, [f"Could not read file: {e}"])
+
+
+def _validate_files(
+    contract: "Contract",
+    output_files: Iterator[Path],
+    jobs: Optional[int]
+) -> Iterator[Tuple[Path, "ValidationResult"]]:
+    """
+    Validate many files in a worker pool.
+    
+    Files are read in the workers; results come back in input order.
+    """
+    workers = jobs if jobs is not None else (os.cpu_count() or 1)
+    paths, output_files = itertools.tee(output_files)
+    
+    if workers > 1:
+        from ..core.batch import map_ordered
+        results = map_ordered(
+            contract, _validate_file_safely, output_files, workers, chunksize=16
+        )
+    else:
+        results = (_validate_file_safely(contract, path) for path in output_files)
+    
+    return zip(paths, results)
+
+
+def _forward_files(
+    client: ServerClient,
+    schema_file: Path,
+    output_files: Iterator[Path]
+) -> Iterator[Tuple[Path, RemoteResult]]:
+    """Have the server validate many files, one after another."""
+    for output_file in output_files:
+        yield output_file, client.validate_file(schema_file, output_file)
+
+
+def _echo_results(
+    results: Iterable[Tuple[Path, _Result]],
+    schema_file: Path,
+    output_format: str
+) -> Iterator[_Result]:
+    """Echo each file's result as it arrives, then the totals."""
+    total = failed = 0
+    json_results = []
+    
+    if output_format == "text":
+        click.echo(f"Validating against {schema_file}")
+        click.echo()
+    
+    for output_file, result in results:
+        total += 1
+        failed += not result.is_valid
+        if output_format == "json":
+            json_results.append(_json_result(result, output_file, schema_file))
+        else:
+            click.echo(f"{'✅' if result.is_valid else '❌'} {output_file}")
+            for error in result.errors:
+                click.echo(f"    - {error}")
+        yield result
+    
+    if output_format == "json":
+        click.echo(json.dumps({
+            "schema_file": str(schema_file),
+            "total": total,
+            "passed": total - failed,
+            "failed": failed,
+            "results": json_results,
+        }, indent=2))
+    else:
+        click.echo()
+        click.echo(f"Validated {total} files: {total - failed} passed, {failed} failed")
+
+
+def _validate_jsonl_files(
+    contract: "Contract",
+    output_files: Iterator[Path],
+    field: Optional[str],
+    results_file: Optional[Path],
+    jobs: Optional[int]
+) -> Iterator["ValidationResult"]:
+    """
+    Validate every record of JSON Lines files, writing a JSON result per line.
+    
+    Records are read and validated one at a time (in a worker pool when
+    there is more than one worker), so memory stays flat however large
+    the files are.
+    """
+    from ..core.jsonl import iter_lines, validate_record
+    
+    workers = jobs if jobs is not None else (os.cpu_count() or 1)
+    task = functools.partial(validate_record, field=field)
+    records, sources = itertools.tee(
+        (output_file, line)
+        for output_file in output_files
+        for line in iter_lines(output_file)
+    )
+    lines = (line for _, line in records)
+    
+    if workers > 1:
+        from ..core.batch import map_ordered
+        results = map_ordered(contract, task, lines, workers)
+    else:
+        results = (task(contract, line) for line in lines)
+    
+    total = failed = 0
+    out = open(results_file, 'w', encoding='utf-8') if results_file else sys.stdout
+    try:
+        for (output_file, (number, _)), result in zip(sources, results):
+            total += 1
+            failed += not result.is_valid
+            errors = result.errors
+            out.write(json.dumps({
+                "output_file": str(output_file),
+                "line": number,
+                "valid": result.is_valid,
+                "errors": errors,
+                "error_count": len(errors)
+            }) + "\n")
+            yield result
+    finally:
+        if results_file:
+            out.close()
+    
+    click.echo(
+        f"Validated {total} records: {total - failed} passed, {failed} failed",
+        err=True
+    )
+
+
+class _Totals:
+    """Pass results through once, counting the ones that failed."""
+    
+    def __init__(self, results: Iterable[_Result]):
+        self._results = results
+        self.failed = 0
+    
+    def consume(self) -> None:
+        for _ in self:
+            pass
+    
+    def __iter__(self) -> Iterator[_Result]:
+        for result in self._results:
+            if not result.is_valid:
+                self.failed += 1
+            yield result
 
 
 def _output_text(
-    result: "ValidationResult", 
+    result: _Result, 
     output_file: Path, 
     schema_file: Path
 ) -> None:
@@ -123,20 +543,30 @@ def _output_text(
 
 
 def _output_json(
-    result: "ValidationResult", 
+    result: _Result, 
     output_file: Path, 
     schema_file: Path
 ) -> None:
     """Output validation results in JSON format."""
-    output_data = {
+    output_data = _json_result(result, output_file, schema_file)
+    
+    click.echo(json.dumps(output_data, indent=2))
+
+
+def _json_result(
+    result: _Result, 
+    output_file: Path, 
+    schema_file: Path
+) -> Dict[str, Any]:
+    """Describe one file's validation result as JSON-serializable data."""
+    errors = result.errors
+    return {
         "valid": result.is_valid,
         "output_file": str(output_file),
         "schema_file": str(schema_file),
-        "errors": result.errors,
-        "error_count": len(result.errors)
+        "errors": errors,
+        "error_count": len(errors)
     }
-    
-    click.echo(json.dumps(output_data, indent=2))
 
 
 if __name__ == "__main__":
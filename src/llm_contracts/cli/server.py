@@ -0,0 +1,137 @@
+"""Line-delimited JSON transport for ``llm-validate serve``."""
+
+import io
+import json
+import os
+import socketserver
+import stat
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Union
+
+from .client import ServerClient, ensure_private_directory, fallback_socket_directory
+
+# Turns one request into its response; exceptions become error responses
+Handler = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+def respond(handle: Handler, line: bytes) -> bytes:
+    """
+    Answer one request line with one response line.
+
+    The request's ``id``, if any, is copied into the response. Invalid
+    requests and exceptions raised by ``handle`` are reported as
+    ``{"error": message}`` so one bad request never stops the server.
+    """
+    try:
+        request = json.loads(line)
+        if not isinstance(request, dict):
+            raise ValueError("request must be a JSON object")
+    except ValueError as e:
+        return _encode({"error": f"Invalid request: {e}"})
+
+    try:
+        response = handle(request)
+    except Exception as e:
+        response = {"error": str(e)}
+
+    if "id" in request:
+        response["id"] = request["id"]
+    return _encode(response)
+
+
+def serve_stream(
+    handle: Handler,
+    reader: Union[BinaryIO, io.BufferedIOBase],
+    writer: Union[BinaryIO, io.BufferedIOBase]
+) -> None:
+    """Answer requests read from a stream until it ends, flushing each response."""
+    for line in reader:
+        if line.strip():
+            writer.write(respond(handle, line))
+            writer.flush()
+
+
+def serve_unix(handle: Handler, socket_path: Union[str, Path]) -> None:
+    """
+    Answer requests on a Unix socket until interrupted.
+
+    The socket is removed when the server stops.
+
+    Raises:
+        RuntimeError: If another server is already listening on the socket
+    """
+    server = unix_server(handle, socket_path)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if _is_own_socket(socket_path):
+            os.unlink(socket_path)
+
+
+def unix_server(
+    handle: Handler,
+    socket_path: Union[str, Path]
+) -> socketserver.BaseServer:
+    """
+    Bind a server answering requests on a Unix socket, one thread per connection.
+
+    The socket is only accessible to the current user, since the server
+    reads any file a client names. A missing directory for it, and the
+    default directory in the shared temporary directory, are created or
+    checked to be private. A socket file left behind by a server that is
+    no longer running is replaced; anything else at the path is left alone.
+
+    Raises:
+        RuntimeError: If Unix sockets aren't supported, the socket's
+            directory isn't private, another server is already listening
+            on the socket, or the path is taken by something other than
+            a socket owned by the current user
+    """
+    if not hasattr(socketserver, "ThreadingUnixStreamServer"):
+        raise RuntimeError("Unix sockets are not supported on this platform; use --stdio")
+
+    socket_path = str(socket_path)
+    directory = os.path.dirname(os.path.abspath(socket_path))
+    if directory == fallback_socket_directory() or not os.path.exists(directory):
+        ensure_private_directory(directory)
+    if os.path.lexists(socket_path):
+        if not _is_own_socket(socket_path):
+            raise RuntimeError(
+                f"{socket_path} exists and is not a socket owned by the current user"
+            )
+        client = ServerClient.connect(socket_path)
+        if client is not None:
+            client.close()
+            raise RuntimeError(f"A server is already listening on {socket_path}")
+        os.unlink(socket_path)
+
+    class _RequestHandler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            try:
+                serve_stream(handle, self.rfile, self.wfile)
+            except ConnectionError:
+                # Client went away mid-response
+                pass
+
+    # Create the socket file readable and writable by its owner only
+    umask = os.umask(0o177)
+    try:
+        server = socketserver.ThreadingUnixStreamServer(socket_path, _RequestHandler)
+    finally:
+        os.umask(umask)
+    server.daemon_threads = True
+    return server
+
+
+def _is_own_socket(socket_path: Union[str, Path]) -> bool:
+    """Return True if the path is a socket owned by the current user."""
+    try:
+        info = os.lstat(socket_path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(info.st_mode) and info.st_uid == os.getuid()
+
+
+def _encode(response: Dict[str, Any]) -> bytes:
+    return json.dumps(response).encode("utf-8") + b"\n"
@@ -1,29 +1,83 @@
 """Main contracts API for llm-contracts."""
 
-from typing import Any, Dict, Union, Optional
+from typing import (
+    IO, TYPE_CHECKING, Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, Union,
+    Optional
+)
 from pathlib import Path
 
-from .core.validator import validate_output, ValidationResult, ValidationError
-from .reports.html_generator import generate_html_report
-from .reports.markdown_generator import generate_markdown_report
+from .core.validator import (
+    validate_output,
+    Contract,
+    ValidationResult,
+    ValidationError,
+    _resolve_contract,
+)
+from .core.jsonl import validate_jsonl
+from .core.aio import (
+    OFFLOAD_THRESHOLD,
+    acompile,
+    avalidate_many,
+    avalidate_output,
+)
+from ._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from .reports.html_generator import generate_html_report
+    from .reports.markdown_generator import generate_markdown_report
+    from .reports.summary import ValidationSummary
 
 
 class Contracts:
     """Main contracts API for LLM output validation and linting."""
     
+    def compile(
+        self, 
+        schema_path: Union[str, Path],
+        *,
+        all_errors: Optional[bool] = None,
+        fail_fast: Optional[bool] = None
+    ) -> Contract:
+        """
+        Load and compile a schema once for repeated validation.
+        
+        Args:
+            schema_path: Path to YAML schema file
+            all_errors: Report every JSON schema violation by default
+            fail_fast: Stop at the first error by default
+            
+        Returns:
+            Compiled Contract with a ``validate(data)`` method
+            
+        Example:
+            >>> from llm_contracts import contracts
+            >>> contract = contracts.compile('schema.yaml')
+            >>> result = contract.validate(data)
+        """
+        return Contract.compile(
+            schema_path, all_errors=all_errors, fail_fast=fail_fast
+        )
+    
     def validate(
         self, 
         data: Union[str, Dict[str, Any]], 
-        schema_path: Union[str, Path],
-        custom_validator: Optional[callable] = None
+        schema_path: Union[str, Path, Dict[str, Any], Contract],
+        custom_validator: Optional[callable] = None,
+        *,
+        all_errors: Optional[bool] = None,
+        fail_fast: Optional[bool] = None
     ) -> ValidationResult:
         """
         Validate LLM output against a schema.
         
         Args:
             data: Data to validate (JSON string, dict, or text)
-            schema_path: Path to YAML schema file
+            schema_path: Path to YAML schema file, schema dictionary,
+                or a compiled Contract
             custom_validator: Optional custom validation function
+            all_errors: Report every JSON schema violation with its path
+            fail_fast: Stop at the first error of any kind
             
         Returns:
             ValidationResult with validation status and errors
@@ -34,21 +88,232 @@ class Contracts:
             >>> print(f"Valid: {result.is_valid}")
         """
         # For now, ignore custom_validator until we implement it
-        return validate_output(data, schema_path)
+        return validate_output(
+            data, schema_path, all_errors=all_errors, fail_fast=fail_fast
+        )
+    
+    def validate_many(
+        self,
+        outputs: Iterable[Union[str, Dict[str, Any]]],
+        schema: Union[str, Path, Dict[str, Any], Contract],
+        *,
+        all_errors: Optional[bool] = None,
+        fail_fast: Optional[bool] = None,
+        workers: Optional[int] = None,
+        executor: str = "process",
+        chunksize: int = 64
+    ) -> Iterator[ValidationResult]:
+        """
+        Validate many outputs against one schema.
+        
+        The schema is loaded and compiled once, up front; results are
+        produced lazily so arbitrarily large iterables use constant memory.
+        Pass ``workers`` to spread the batch over several processes.
+        
+        Args:
+            outputs: Iterable of outputs (JSON strings, dicts, or text)
+            schema: Path to YAML schema file, schema dictionary,
+                or a compiled Contract
+            all_errors: Report every JSON schema violation with its path
+            fail_fast: Stop each validation at its first error
+            workers: Number of parallel workers (default: validate in-process)
+            executor: "process" or "thread" pool when workers is given
+            chunksize: Number of outputs sent to a worker at a time
+            
+        Returns:
+            Iterator of ValidationResult, one per output, in input order
+            
+        Example:
+            >>> from llm_contracts import contracts
+            >>> for result in contracts.validate_many(outputs, 'schema.yaml'):
+            ...     print(result.is_valid)
+        """
+        contract = _resolve_contract(schema)
+        return contract.validate_many(
+            outputs,
+            all_errors=all_errors,
+            fail_fast=fail_fast,
+            workers=workers,
+            executor=executor,
+            chunksize=chunksize
+        )
+    
+    def validate_jsonl(
+        self,
+        path: Union[str, Path],
+        schema: Union[str, Path, Dict[str, Any], Contract],
+        *,
+        field: Optional[str] = None,
+        all_errors: Optional[bool] = None,
+        fail_fast: Optional[bool] = None,
+        workers: Optional[int] = None,
+        executor: str = "process",
+        chunksize: int = 64
+    ) -> Iterator[ValidationResult]:
+        """
+        Validate every record of a JSON Lines file against one schema.
+        
+        Records are read and decoded one at a time, so files of any size
+        use constant memory.
+        
+        Args:
+            path: Path to the JSON Lines file
+            schema: Path to YAML schema file, schema dictionary,
+                or a compiled Contract
+            field: Dotted key of the output in each record (e.g.
+                ``"response.text"``); the whole record is validated if omitted
+            all_errors: Report every JSON schema violation with its path
+            fail_fast: Stop each validation at its first error
+            workers: Number of parallel workers (default: validate in-process)
+            executor: "process" or "thread" pool when workers is given
+            chunksize: Number of records sent to a worker at a time
+            
+        Returns:
+            Iterator of ValidationResult, one per non-blank line, in file order
+            
+        Example:
+            >>> from llm_contracts import contracts
+            >>> results = contracts.validate_jsonl('completions.jsonl', 'schema.yaml',
+            ...                                    field='completion')
+            >>> failed = sum(not result.is_valid for result in results)
+        """
+        return validate_jsonl(
+            path,
+            schema,
+            field=field,
+            all_errors=all_errors,
+            fail_fast=fail_fast,
+            workers=workers,
+            executor=executor,
+            chunksize=chunksize
+        )
+    
+    async def acompile(
+        self,
+        schema_path: Union[str, Path],
+        *,
+        all_errors: Optional[bool] = None,
+        fail_fast: Optional[bool] = None,
+        executor: Optional["Executor"] = None
+    ) -> Contract:
+        """
+        Load and compile a schema without blocking the event loop.
+        
+        Args:
+            schema_path: Path to YAML schema file
+            all_errors: Report every JSON schema violation by default
+            fail_fast: Stop at the first error by default
+            executor: Executor for the file I/O (default: the loop's)
+            
+        Returns:
+            Compiled Contract
+            
+        Example:
+            >>> contract = await contracts.acompile('schema.yaml')
+        """
+        return await acompile(
+            schema_path, all_errors=all_errors, fail_fast=fail_fast, executor=executor
+        )
+    
+    async def avalidate(
+        self,
+        data: Union[str, Dict[str, Any]],
+        schema_path: Union[str, Path, Dict[str, Any], Contract],
+        *,
+        all_errors: Optional[bool] = None,
+        fail_fast: Optional[bool] = None,
+        offload_threshold: Optional[int] = OFFLOAD_THRESHOLD,
+        executor: Optional["Executor"] = None
+    ) -> ValidationResult:
+        """
+        Validate LLM output from asyncio code without blocking the loop.
+        
+        Schema files are loaded in the executor; outputs of at least
+        ``offload_threshold`` characters are validated there too.
+        
+        Args:
+            data: Data to validate (JSON string, dict, or text)
+            schema_path: Path to YAML schema file, schema dictionary,
+                or a compiled Contract
+            all_errors: Report every JSON schema violation with its path
+            fail_fast: Stop at the first error of any kind
+            offload_threshold: Minimum output size in characters to
+                validate in the executor; 0 always offloads, None never does
+            executor: Executor to use (default: the loop's)
+            
+        Returns:
+            ValidationResult with validation status and errors
+            
+        Example:
+            >>> from llm_contracts import contracts
+            >>> result = await contracts.avalidate(data, 'schema.yaml')
+        """
+        return await avalidate_output(
+            data,
+            schema_path,
+            all_errors=all_errors,
+            fail_fast=fail_fast,
+            offload_threshold=offload_threshold,
+            executor=executor
+        )
+    
+    def avalidate_many(
+        self,
+        outputs: Union[Iterable[Any], AsyncIterable[Any]],
+        schema: Union[str, Path, Dict[str, Any], Contract],
+        *,
+        all_errors: Optional[bool] = None,
+        fail_fast: Optional[bool] = None,
+        offload_threshold: Optional[int] = OFFLOAD_THRESHOLD,
+        executor: Optional["Executor"] = None
+    ) -> AsyncIterator[ValidationResult]:
+        """
+        Validate many outputs against one schema from asyncio code.
+        
+        Args:
+            outputs: Iterable or async iterable of outputs
+            schema: Path to YAML schema file, schema dictionary,
+                or a compiled Contract
+            all_errors: Report every JSON schema violation with its path
+            fail_fast: Stop each validation at its first error
+            offload_threshold: As for ``avalidate()``
+            executor: As for ``avalidate()``
+            
+        Returns:
+            Async iterator of ValidationResult, one per output, in input order
+            
+        Example:
+            >>> async for result in contracts.avalidate_many(stream, contract):
+            ...     print(result.is_valid)
+        """
+        return avalidate_many(
+            outputs,
+            schema,
+            all_errors=all_errors,
+            fail_fast=fail_fast,
+            offload_threshold=offload_threshold,
+            executor=executor
+        )
     
     def lint(
         self,
         data: Union[str, Dict[str, Any]],
-        schema_path: Union[str, Path],
-        custom_validator: Optional[callable] = None
+        schema_path: Union[str, Path, Dict[str, Any], Contract],
+        custom_validator: Optional[callable] = None,
+        *,
+        all_errors: Optional[bool] = None,
+        fail_fast: Optional[bool] = None
     ) -> ValidationResult:
         """
         Lint LLM output for content quality and style issues.
         
         Args:
             data: Data to lint (JSON string, dict, or text)
-            schema_path: Path to YAML schema file with linting rules
+            schema_path: Path to YAML schema file with linting rules,
+                schema dictionary, or a compiled Contract
             custom_validator: Optional custom validation function
+            all_errors: Report every JSON schema violation with its path
+            fail_fast: Stop at the first error of any kind
             
         Returns:
             ValidationResult with linting status and issues
@@ -59,13 +324,15 @@ class Contracts:
             >>> print(f"Lint passed: {result.is_valid}")
         """
         # For now, ignore custom_validator until we implement it
-        return validate_output(data, schema_path)
+        return validate_output(
+            data, schema_path, all_errors=all_errors, fail_fast=fail_fast
+        )
     
     def generate_report(
         self,
         result: ValidationResult,
-        output_path: str,
-        schema_path: str,
+        output_path: Union[str, Path, IO],
+        schema_path: Union[str, Path, Dict[str, Any], Contract],
         format: str = "html",
         schema_content: Optional[Dict[str, Any]] = None
     ) -> None:
@@ -74,8 +341,10 @@ class Contracts:
         
         Args:
             result: Validation result from validate() or lint()
-            output_path: Path for the report file
-            schema_path: Path to schema file for reference
+            output_path: Path for the report file, or a file object to
+                write it to (binary and seekable for HTML, text for Markdown)
+            schema_path: Path to schema file for reference, or the
+                in-memory schema (dictionary or Contract)
             format: Report format ("html" or "markdown")
             schema_content: Optional schema content for rule references
             
@@ -85,17 +354,38 @@ class Contracts:
             >>> contracts.generate_report(result, 'report.html', 'schema.yaml', 'html')
         """
         if format.lower() == "html":
+            from .reports.html_generator import generate_html_report
             generate_html_report(result, output_path, schema_path)
         elif format.lower() in ["md", "markdown"]:
+            from .reports.markdown_generator import generate_markdown_report
             generate_markdown_report(result, output_path, schema_path, schema_content)
         else:
             raise ValueError(f"Unsupported format: {format}. Use 'html' or 'markdown'")
     
+    def summarize(self, results: Iterable[ValidationResult]) -> "ValidationSummary":
+        """
+        Compute per-rule and per-field failure statistics over many results.
+        
+        Args:
+            results: Validation results, e.g. from validate_many()
+            
+        Returns:
+            ValidationSummary with failure counts, pass rates, the most
+            frequent failures and co-failure counts
+            
+        Example:
+            >>> from llm_contracts import contracts
+            >>> summary = contracts.summarize(contracts.validate_many(outputs, 'schema.yaml'))
+            >>> summary.pass_rate
+        """
+        from .reports.summary import summarize
+        return summarize(results)
+    
     def validate_and_report(
         self,
         data: Union[str, Dict[str, Any]],
-        schema_path: Union[str, Path],
-        report_path: Optional[str] = None,
+        schema_path: Union[str, Path, Dict[str, Any], Contract],
+        report_path: Optional[Union[str, Path, IO]] = None,
         report_format: str = "html",
         custom_validator: Optional[callable] = None
     ) -> ValidationResult:
@@ -104,8 +394,10 @@ class Contracts:
         
         Args:
             data: Data to validate
-            schema_path: Path to schema file
-            report_path: Optional path for report file
+            schema_path: Path to YAML schema file, schema dictionary,
+                or a compiled Contract
+            report_path: Optional path for report file, or a file object
+                as for generate_report()
             report_format: Report format ("html" or "markdown")
             custom_validator: Optional custom validation function
             
@@ -118,10 +410,14 @@ class Contracts:
             ...     data, 'schema.yaml', 'report.html', 'html'
             ... )
         """
-        result = self.validate(data, schema_path)
+        # Compile once so an in-memory schema isn't parsed again for the report
+        contract = _resolve_contract(schema_path)
+        result = self.validate(data, contract)
         
         if report_path:
-            self.generate_report(result, report_path, str(schema_path), report_format)
+            if contract.source is None:
+                schema_path = contract
+            self.generate_report(result, report_path, schema_path, report_format)
         
         return result
 
@@ -132,9 +428,17 @@ contracts = Contracts()
 # Export main functions for backward compatibility
 __all__ = [
     "contracts",
+    "Contract",
     "validate_output",  # Backward compatibility
     "generate_html_report",  # Backward compatibility
     "generate_markdown_report",  # Backward compatibility
     "ValidationResult",
     "ValidationError"
-] 
\ No newline at end of file
+]
+
+
+# Report generators are imported when a report is first generated
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "generate_html_report": ".reports.html_generator",
+    "generate_markdown_report": ".reports.markdown_generator",
+})
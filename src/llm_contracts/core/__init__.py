@@ -1,13 +1,66 @@
 """Core validation functionality."""
 
-from .validator import validate_output, ValidationError, ValidationResult
-from .schema import SchemaError
-from .rules import RuleError
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .validator import validate_output, Contract, ValidationError, ValidationResult
+    from .schema import (
+        SchemaError,
+        SchemaCacheInfo,
+        clear_schema_cache,
+        configure_schema_cache,
+        parse_schema,
+        schema_cache_info,
+    )
+    from .rules import RuleError, RulePlan, compile_rules
+    from .aio import acompile, avalidate_many, avalidate_output
+    from .streaming import StreamValidator
+    from .jsonl import validate_jsonl
+    from .violations import Violation
 
 __all__ = [
     "validate_output",
+    "Contract",
     "ValidationError",
     "ValidationResult", 
+    "Violation",
     "SchemaError",
+    "SchemaCacheInfo",
+    "clear_schema_cache",
+    "configure_schema_cache",
+    "parse_schema",
+    "schema_cache_info",
     "RuleError",
-] 
\ No newline at end of file
+    "RulePlan",
+    "compile_rules",
+    "acompile",
+    "avalidate_output",
+    "avalidate_many",
+    "StreamValidator",
+    "validate_jsonl",
+]
+
+# Imported on first access; see llm_contracts/__init__.py
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "validate_output": ".validator",
+    "Contract": ".validator",
+    "ValidationError": ".validator",
+    "ValidationResult": ".validator",
+    "Violation": ".violations",
+    "SchemaError": ".schema",
+    "SchemaCacheInfo": ".schema",
+    "clear_schema_cache": ".schema",
+    "configure_schema_cache": ".schema",
+    "parse_schema": ".schema",
+    "schema_cache_info": ".schema",
+    "RuleError": ".rules",
+    "RulePlan": ".rules",
+    "compile_rules": ".rules",
+    "acompile": ".aio",
+    "avalidate_output": ".aio",
+    "avalidate_many": ".aio",
+    "StreamValidator": ".streaming",
+    "validate_jsonl": ".jsonl",
+})
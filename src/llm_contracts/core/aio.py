@@ -0,0 +1,190 @@
+"""Validation from asyncio code without blocking the event loop."""
+
+import functools
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING, Any, AsyncIterable, AsyncIterator, Dict, Iterable, Optional, Union
+)
+
+from .validator import Contract, ValidationResult, _resolve_contract
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+# asyncio is imported inside the coroutines below: they only run once an
+# event loop, and so asyncio, is loaded, and synchronous users of the
+# package shouldn't pay for importing it.
+
+# Outputs with at least this many characters of text are validated in an
+# executor by default; smaller ones are cheaper to validate inline than
+# the hop to another thread.
+OFFLOAD_THRESHOLD = 64 * 1024
+
+
+async def acompile(
+    schema_path: Union[str, Path],
+    *,
+    all_errors: Optional[bool] = None,
+    fail_fast: Optional[bool] = None,
+    executor: Optional["Executor"] = None,
+) -> Contract:
+    """
+    Load and compile a schema in an executor.
+
+    Args:
+        schema_path: Path to YAML schema file
+        all_errors: Report every JSON schema violation by default
+        fail_fast: Stop at the first error by default
+        executor: Executor for the file I/O (default: the loop's)
+
+    Returns:
+        Compiled Contract
+    """
+    import asyncio
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor,
+        functools.partial(
+            Contract.compile, schema_path, all_errors=all_errors, fail_fast=fail_fast
+        ),
+    )
+
+
+async def avalidate_output(
+    output: Union[str, Dict[str, Any]],
+    schema: Union[str, Path, Dict[str, Any], Contract],
+    *,
+    all_errors: Optional[bool] = None,
+    fail_fast: Optional[bool] = None,
+    offload_threshold: Optional[int] = OFFLOAD_THRESHOLD,
+    executor: Optional["Executor"] = None,
+) -> ValidationResult:
+    """
+    Validate LLM output without blocking the event loop.
+
+    A schema path is loaded in the executor, so file I/O never runs on
+    the loop; pass a compiled Contract to skip that step entirely. The
+    validation itself runs inline for small outputs and in the executor
+    for outputs of at least ``offload_threshold`` characters.
+
+    Args:
+        output: The LLM output to validate (JSON string, dict, or text)
+        schema: Path to YAML schema file, schema dictionary,
+            or a compiled Contract
+        all_errors: Report every JSON schema violation with its path
+        fail_fast: Stop at the first error of any kind
+        offload_threshold: Minimum size in characters to validate in the
+            executor; 0 always offloads, None never does
+        executor: Executor for schema loading and offloaded validation
+            (default: the loop's)
+
+    Returns:
+        ValidationResult with validation status and any errors
+
+    Raises:
+        ValidationError: If the schema cannot be loaded, or validation
+            fails and strict mode is enabled
+    """
+    contract = await _aresolve_contract(schema, executor)
+    return await _avalidate(
+        contract, output, all_errors, fail_fast, offload_threshold, executor
+    )
+
+
+async def avalidate_many(
+    outputs: Union[Iterable[Any], AsyncIterable[Any]],
+    schema: Union[str, Path, Dict[str, Any], Contract],
+    *,
+    all_errors: Optional[bool] = None,
+    fail_fast: Optional[bool] = None,
+    offload_threshold: Optional[int] = OFFLOAD_THRESHOLD,
+    executor: Optional["Executor"] = None,
+) -> AsyncIterator[ValidationResult]:
+    """
+    Validate many outputs against one schema without blocking the loop.
+
+    The schema is resolved once, on first iteration. Control returns to
+    the event loop after every output, so a long batch of small outputs
+    doesn't starve other tasks.
+
+    Args:
+        outputs: Iterable or async iterable of outputs
+        schema: Path to YAML schema file, schema dictionary,
+            or a compiled Contract
+        all_errors: Report every JSON schema violation with its path
+        fail_fast: Stop each validation at its first error
+        offload_threshold: As for ``avalidate_output``
+        executor: As for ``avalidate_output``
+
+    Yields:
+        One ValidationResult per output, in input order
+    """
+    import asyncio
+    contract = await _aresolve_contract(schema, executor)
+
+    if isinstance(outputs, AsyncIterable):
+        async for output in outputs:
+            yield await _avalidate(
+                contract, output, all_errors, fail_fast, offload_threshold, executor
+            )
+    else:
+        for output in outputs:
+            yield await _avalidate(
+                contract, output, all_errors, fail_fast, offload_threshold, executor
+            )
+            await asyncio.sleep(0)
+
+
+async def _aresolve_contract(
+    schema: Union[str, Path, Dict[str, Any], Contract],
+    executor: Optional["Executor"],
+) -> Contract:
+    if isinstance(schema, Contract):
+        return schema
+    import asyncio
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, _resolve_contract, schema)
+
+
+async def _avalidate(
+    contract: Contract,
+    output: Any,
+    all_errors: Optional[bool],
+    fail_fast: Optional[bool],
+    offload_threshold: Optional[int],
+    executor: Optional["Executor"],
+) -> ValidationResult:
+    if offload_threshold is not None and _size_reaches(output, offload_threshold):
+        import asyncio
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor,
+            functools.partial(
+                contract.validate, output, all_errors=all_errors, fail_fast=fail_fast
+            ),
+        )
+    return contract.validate(output, all_errors=all_errors, fail_fast=fail_fast)
+
+
+def _size_reaches(output: Any, threshold: int) -> bool:
+    """Return True if output holds at least ``threshold`` characters of text."""
+    if threshold <= 0:
+        return True
+    if isinstance(output, (str, bytes)):
+        return len(output) >= threshold
+
+    # Parsed JSON: count string leaves, stopping as soon as the answer is known
+    total = 0
+    stack = [output]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            total += len(value)
+            if total >= threshold:
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.keys())
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
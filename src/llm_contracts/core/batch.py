@@ -0,0 +1,162 @@
+"""Parallel batch validation."""
+
+import functools
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, TypeVar
+
+from .validator import Contract, ValidationResult
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+EXECUTORS = ("process", "thread")
+
+# Contract installed in each worker process by _init_worker
+_worker_contract: Optional[Contract] = None
+
+
+def map_ordered(
+    contract: Contract,
+    task: Callable[[Contract, _T], _R],
+    items: Iterable[_T],
+    workers: int,
+    executor: str = "process",
+    chunksize: int = 64,
+) -> Iterator[_R]:
+    """
+    Apply ``task(contract, item)`` to items in a worker pool, in order.
+
+    With the process executor the contract is sent to each worker once,
+    when the worker starts, and items are streamed to the workers in
+    chunks. At most ``2 * workers`` chunks are in flight at any time, so
+    memory stays bounded however many items there are.
+
+    Args:
+        contract: Compiled contract shared by every task
+        task: Picklable module-level function run for each item
+        items: Items to process, consumed lazily
+        workers: Number of worker processes or threads
+        executor: "process" (bypasses the GIL) or "thread"
+        chunksize: Number of items sent to a worker at a time
+
+    Returns:
+        Iterator of task results in input order
+
+    Raises:
+        ValueError: If executor, workers or chunksize is invalid
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(
+            f"Unsupported executor: {executor}. Use one of: {', '.join(EXECUTORS)}"
+        )
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, got {chunksize}")
+
+    # Arguments are checked above, eagerly; the pool starts on first use
+    return _map_ordered(contract, task, items, workers, executor, chunksize)
+
+
+def _map_ordered(
+    contract: Contract,
+    task: Callable[[Contract, _T], _R],
+    items: Iterable[_T],
+    workers: int,
+    executor: str,
+    chunksize: int,
+) -> Iterator[_R]:
+    pool: Executor
+    if executor == "process":
+        pool = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(contract,)
+        )
+        run_chunk = functools.partial(_run_chunk_in_worker, task)
+    else:
+        pool = ThreadPoolExecutor(max_workers=workers)
+        run_chunk = functools.partial(_run_chunk, contract, task)
+
+    iterator = iter(items)
+    pending: Deque[Future] = deque()
+    max_pending = workers * 2
+
+    try:
+        while True:
+            while len(pending) < max_pending:
+                chunk = list(islice(iterator, chunksize))
+                if not chunk:
+                    break
+                pending.append(pool.submit(run_chunk, chunk))
+
+            if not pending:
+                break
+
+            yield from pending.popleft().result()
+    finally:
+        # Consumer stopped early or a task failed: drop queued work
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=True)
+
+
+def validate_parallel(
+    contract: Contract,
+    outputs: Iterable[Any],
+    workers: int,
+    executor: str = "process",
+    chunksize: int = 64,
+    all_errors: bool = False,
+    fail_fast: bool = False,
+) -> Iterator[ValidationResult]:
+    """
+    Validate outputs in a worker pool, yielding results in input order.
+
+    Strict mode is applied here, in the calling process, so a failing
+    output raises ValidationError with its full error list.
+
+    Args:
+        contract: Compiled contract
+        outputs: Outputs to validate, consumed lazily
+        workers: Number of worker processes or threads
+        executor: "process" or "thread"
+        chunksize: Number of outputs sent to a worker at a time
+        all_errors: Report every JSON schema violation
+        fail_fast: Stop each validation at its first error
+
+    Returns:
+        Iterator of one ValidationResult per output
+    """
+    task = functools.partial(
+        _validate_task, all_errors=all_errors, fail_fast=fail_fast
+    )
+    results = map_ordered(contract, task, outputs, workers, executor, chunksize)
+    return contract._apply_strict(results)
+
+
+def _validate_task(
+    contract: Contract,
+    output: Any,
+    all_errors: bool,
+    fail_fast: bool,
+) -> ValidationResult:
+    return contract._evaluate(output, all_errors, fail_fast)
+
+
+def _init_worker(contract: Contract) -> None:
+    global _worker_contract
+    _worker_contract = contract
+
+
+def _run_chunk(
+    contract: Contract,
+    task: Callable[[Contract, _T], _R],
+    chunk: List[_T],
+) -> List[_R]:
+    return [task(contract, item) for item in chunk]
+
+
+def _run_chunk_in_worker(task: Callable[[Contract, _T], _R], chunk: List[_T]) -> List[_R]:
+    assert _worker_contract is not None, "worker not initialized"
+    return _run_chunk(_worker_contract, task, chunk)
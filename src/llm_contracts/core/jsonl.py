@@ -0,0 +1,137 @@
+"""Validation of JSON Lines files, one record at a time."""
+
+import functools
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+from ..utils.mapped_lines import iter_mapped_lines
+from .validator import Contract, ValidationResult, _resolve_contract
+from .violations import Violation
+
+
+def validate_jsonl(
+    path: Union[str, Path],
+    schema: Union[str, Path, Dict[str, Any], Contract],
+    *,
+    field: Optional[str] = None,
+    all_errors: Optional[bool] = None,
+    fail_fast: Optional[bool] = None,
+    workers: Optional[int] = None,
+    executor: str = "process",
+    chunksize: int = 64
+) -> Iterator[ValidationResult]:
+    """
+    Validate every record of a JSON Lines file against one schema.
+
+    The file is memory-mapped and scanned one line at a time, and each
+    line is decoded only when its record is validated (in the worker,
+    when there are workers), so files of any size are processed in
+    constant memory. Blank lines are skipped. A line that isn't valid
+    JSON, or a record without ``field``, produces a failed result rather
+    than stopping the run.
+
+    Args:
+        path: Path to the JSON Lines file
+        schema: Path to YAML schema file, schema dictionary,
+            or a compiled Contract
+        field: Key of the output in each record; use dots for nested
+            keys and list indexes (``"choices.0.text"``). The whole
+            record is validated when omitted.
+        all_errors: Report every JSON schema violation with its path
+        fail_fast: Stop each validation at its first error
+        workers: Number of parallel workers (default: validate in-process)
+        executor: "process" or "thread" pool when workers is given
+        chunksize: Number of records sent to a worker at a time
+
+    Returns:
+        Iterator of ValidationResult, one per non-blank line, in file
+        order. When a record fails and strict mode is enabled, iterating
+        raises ValidationError.
+
+    Raises:
+        ValidationError: If the schema cannot be loaded
+        ValueError: If workers, executor or chunksize is invalid
+    """
+    contract = _resolve_contract(schema)
+    task = functools.partial(
+        validate_record, field=field, all_errors=all_errors, fail_fast=fail_fast
+    )
+    lines = iter_lines(path)
+
+    if workers is not None:
+        from .batch import map_ordered
+        results = map_ordered(contract, task, lines, workers, executor, chunksize)
+    else:
+        results = (task(contract, line) for line in lines)
+
+    return contract._apply_strict(results)
+
+
+def iter_lines(path: Union[str, Path]) -> Iterator[Tuple[int, bytes]]:
+    """
+    Yield the (1-based line number, raw line) of each non-blank line of a file.
+
+    Lines are left undecoded; ``validate_record`` decodes them.
+
+    Args:
+        path: Path to the JSON Lines file
+
+    Returns:
+        Iterator of (line number, line) pairs, read lazily
+    """
+    for number, line in enumerate(iter_mapped_lines(path), 1):
+        if line.strip():
+            yield number, line
+
+
+def validate_record(
+    contract: Contract,
+    line: Tuple[int, bytes],
+    field: Optional[str] = None,
+    all_errors: Optional[bool] = None,
+    fail_fast: Optional[bool] = None
+) -> ValidationResult:
+    """
+    Decode one JSON Lines record and validate it, without strict mode.
+
+    Args:
+        contract: Compiled contract
+        line: (line number, UTF-8 encoded line) pair as yielded by
+            ``iter_lines``
+        field: Dotted key of the output in the record, or None
+        all_errors: Report every JSON schema violation with its path
+        fail_fast: Stop at the first error
+
+    Returns:
+        ValidationResult for the record's output
+    """
+    number, data = line
+    try:
+        record = json.loads(data.decode("utf-8"))
+    except UnicodeDecodeError as e:
+        return ValidationResult._of([Violation("invalid_record", (number, e.reason))])
+    except json.JSONDecodeError as e:
+        return ValidationResult._of([Violation("invalid_record", (number, e.msg))])
+
+    if field is not None:
+        try:
+            record = _extract_field(record, field)
+        except (KeyError, IndexError, TypeError, ValueError):
+            return ValidationResult._of([
+                Violation("record_field_missing", (number, field))
+            ])
+
+    return contract._evaluate(record, all_errors, fail_fast)
+
+
+def _extract_field(record: Any, field: str) -> Any:
+    """Follow a dotted path of keys and list indexes into a record."""
+    for key in field.split("."):
+        if isinstance(record, list):
+            record = record[int(key)]
+        elif isinstance(record, dict):
+            record = record[key]
+        else:
+            raise KeyError(key)
+    return record
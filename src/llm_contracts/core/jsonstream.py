@@ -0,0 +1,447 @@
+"""Incremental JSON parsing with early JSON schema checks."""
+
+import json
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .violations import Violation
+
+# Whitespace as json.loads defines it
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# Run of string characters that need no special handling
+_STRING_CHARS = re.compile(r'[^"\\]*')
+# Numbers and literals (true, false, null, NaN, Infinity, -Infinity); the
+# token is checked by json.loads once a delimiter after it has arrived
+_SCALAR_TOKEN = re.compile(r'-?[A-Za-z]+|[-+0-9.eE]+')
+
+# Keywords whose subschemas are applied to child values as they close, and
+# which are therefore left out when the container itself is checked
+_CHILD_KEYWORDS = frozenset({
+    "properties", "patternProperties", "additionalProperties", "propertyNames",
+    "items", "prefixItems", "additionalItems",
+})
+# Schemas using these are only checked as a whole: references may ignore
+# sibling keywords, and unevaluated* depend on what the children matched
+_OPAQUE_KEYWORDS = frozenset({
+    "$ref", "$dynamicRef", "$recursiveRef", "$id", "id",
+    "unevaluatedProperties", "unevaluatedItems",
+})
+
+Path = Tuple[Union[str, int], ...]
+
+
+class IncrementalJSONParser:
+    """
+    Parse a JSON document fed in pieces, reporting values as they close.
+
+    The listener is notified as the document is read:
+
+    - ``start(path, container)`` when an object or array opens
+    - ``key(path, key)`` when an object key has been read
+    - ``end(path, value)`` when a value is complete
+
+    Values are decoded with ``json.loads``, so they are exactly what
+    parsing the whole document would produce. Text is only buffered while
+    a token is incomplete; long strings are collected in parts.
+    """
+
+    def __init__(self, listener: Any):
+        self._listener = listener
+        self._buffer = ""
+        # Open containers: [value, pending key, expected token]
+        self._stack: List[List[Any]] = []
+        # Parts of the string being read, and whether it is an object key
+        self._string: Optional[List[str]] = None
+        self._string_is_key = False
+        self._expect = "value"
+        self.done = False
+        self.error: Optional[str] = None
+        self.offset = 0
+
+    def feed(self, text: str) -> None:
+        """
+        Parse the next piece of the document.
+
+        Stops at the first syntax error, recording it in ``error``.
+        """
+        if self.error is not None:
+            return
+        buffer = self._buffer + text
+        base = self.offset - len(self._buffer)
+        pos = 0
+        end = len(buffer)
+
+        try:
+            while pos < end:
+                if self._string is not None:
+                    pos, complete = self._read_string(buffer, pos)
+                    if not complete:
+                        break
+                    continue
+
+                space = _WHITESPACE.match(buffer, pos)
+                assert space is not None  # matches the empty string too
+                pos = space.end()
+                if pos == end:
+                    break
+                if self.done:
+                    raise ValueError("extra data")
+
+                char = buffer[pos]
+                expect = self._expect
+
+                if expect == "value" or (expect == "value_or_end" and char != "]"):
+                    if char == "{":
+                        self._open({}, "key_or_end")
+                        pos += 1
+                    elif char == "[":
+                        self._open([], "value_or_end")
+                        pos += 1
+                    elif char == '"':
+                        self._string = []
+                        self._string_is_key = False
+                        pos += 1
+                    else:
+                        match = _SCALAR_TOKEN.match(buffer, pos)
+                        if match is None:
+                            raise ValueError("Expecting value")
+                        if match.end() == end:
+                            break  # the token may continue in the next piece
+                        self._value(json.loads(match.group()))
+                        pos = match.end()
+                elif expect in ("key", "key_or_end"):
+                    if char == '"':
+                        self._string = []
+                        self._string_is_key = True
+                        pos += 1
+                    elif char == "}" and expect == "key_or_end":
+                        self._close()
+                        pos += 1
+                    else:
+                        raise ValueError("Expecting property name")
+                elif expect == "colon":
+                    if char != ":":
+                        raise ValueError("Expecting ':' delimiter")
+                    self._expect = "value"
+                    pos += 1
+                elif expect == "value_or_end" or expect == "comma_or_end":
+                    container = self._stack[-1][0]
+                    closing = "}" if isinstance(container, dict) else "]"
+                    if char == closing:
+                        self._close()
+                    elif char == "," and expect == "comma_or_end":
+                        self._expect = "key" if closing == "}" else "value"
+                    else:
+                        raise ValueError(f"Expecting ',' or '{closing}'")
+                    pos += 1
+        except ValueError:
+            # Includes json.JSONDecodeError from decoding a token
+            self.error = f"invalid JSON at offset {base + pos}"
+            self._buffer = ""
+            return
+
+        self._buffer = buffer[pos:]
+        self.offset = base + end
+
+    def _read_string(self, buffer: str, pos: int) -> Tuple[int, bool]:
+        """
+        Read string characters up to the closing quote.
+
+        Returns the position reached and whether the string was closed.
+        An escape sequence cut short is left for the next piece.
+        """
+        parts = self._string
+        assert parts is not None
+        end = len(buffer)
+        while pos < end:
+            run = _STRING_CHARS.match(buffer, pos)
+            assert run is not None  # matches the empty string too
+            run_end = run.end()
+            if run_end > pos:
+                parts.append(buffer[pos:run_end])
+                pos = run_end
+            if pos == end:
+                return pos, False
+            if buffer[pos] == '"':
+                self._string = None
+                value = json.loads('"' + "".join(parts) + '"')
+                if self._string_is_key:
+                    self._key(value)
+                else:
+                    self._value(value)
+                return pos + 1, True
+            # Backslash escape
+            size = 6 if buffer[pos + 1:pos + 2] == "u" else 2
+            if pos + size > end:
+                return pos, False
+            parts.append(buffer[pos:pos + size])
+            pos += size
+        return pos, False
+
+    def _path(self) -> Path:
+        return tuple(
+            frame[1] if isinstance(frame[0], dict) else len(frame[0])
+            for frame in self._stack
+        )
+
+    def _open(
+        self,
+        container: Union[Dict[str, Any], List[Any]],
+        expect: str
+    ) -> None:
+        self._listener.start(self._path(), container)
+        self._stack.append([container, None, expect])
+        self._expect = expect
+
+    def _close(self) -> None:
+        container = self._stack.pop()[0]
+        self._value(container)
+
+    def _key(self, key: str) -> None:
+        frame = self._stack[-1]
+        frame[1] = key
+        self._listener.key(self._path()[:-1], key)
+        self._expect = "colon"
+
+    def _value(self, value: Any) -> None:
+        self._listener.end(self._path(), value)
+        if not self._stack:
+            self.done = True
+            return
+        frame = self._stack[-1]
+        if isinstance(frame[0], dict):
+            frame[0][frame[1]] = value
+        else:
+            frame[0].append(value)
+        self._expect = "comma_or_end"
+
+
+class JSONSchemaStream:
+    """
+    Checks parts of a streamed JSON document against a schema as they close.
+
+    Only subschemas that apply to a location whatever the rest of the
+    document contains are used: ``properties``, ``patternProperties``,
+    ``additionalProperties``, ``items`` and ``prefixItems``, followed down
+    from the root. Subschemas under ``anyOf``, ``oneOf``, ``not``,
+    ``if`` and ``$ref`` are only applied when their parent closes.
+    Checks stop at the first violation.
+
+    The stream is only valid when the root schema rejects every string:
+    output that turns out not to be JSON is then validated as a string,
+    so it fails too.
+    """
+
+    def __init__(self, validator: Any):
+        """
+        Args:
+            validator: jsonschema validator for the contract's schema
+        """
+        self._validator = validator
+        self._root = validator.schema
+        # Per-schema validators, keyed by id() of schemas owned by the contract
+        self._validators: Dict[int, Any] = {}
+        self._container_validators: Dict[int, Any] = {}
+        self._key_validators: Dict[int, Any] = {}
+
+    @staticmethod
+    def supports(schema: Any) -> bool:
+        """Return True if early checks are sound for a root schema."""
+        if not isinstance(schema, dict) or _OPAQUE_KEYWORDS.intersection(
+            key for key in schema if key not in ("$id", "id")
+        ):
+            return False
+        types = schema.get("type")
+        if isinstance(types, str):
+            types = [types]
+        return isinstance(types, list) and "string" not in types
+
+    def start(self) -> "_SchemaListener":
+        """Return a listener for one document."""
+        return _SchemaListener(self)
+
+    def root_types(self) -> List[str]:
+        types = self._root["type"]
+        return [types] if isinstance(types, str) else list(types)
+
+    def _full(self, schema: Any) -> Any:
+        validator = self._validators.get(id(schema))
+        if validator is None:
+            validator = self._validators[id(schema)] = self._validator.evolve(
+                schema=schema
+            )
+        return validator
+
+    def _for_container(self, schema: Any) -> Any:
+        """Validator for a closed container whose children were checked already."""
+        if not _descends(schema, schema is self._root):
+            return self._full(schema)
+        validator = self._container_validators.get(id(schema))
+        if validator is None:
+            validator = self._validator.evolve(schema={
+                key: value for key, value in schema.items()
+                if key not in _CHILD_KEYWORDS
+            })
+            self._container_validators[id(schema)] = validator
+        return validator
+
+    def _for_keys(self, schema: Any) -> Optional[Any]:
+        """Validator checking an object's key names, or None if keys are free."""
+        if id(schema) in self._key_validators:
+            return self._key_validators[id(schema)]
+        key_schema: Dict[str, Any] = {}
+        if schema.get("additionalProperties") is False:
+            # Same keywords as the schema, so messages match jsonschema's
+            for keyword in ("properties", "patternProperties"):
+                if keyword in schema:
+                    key_schema[keyword] = {name: True for name in schema[keyword]}
+            key_schema["additionalProperties"] = False
+        if "propertyNames" in schema:
+            key_schema["propertyNames"] = schema["propertyNames"]
+        validator = self._validator.evolve(schema=key_schema) if key_schema else None
+        self._key_validators[id(schema)] = validator
+        return validator
+
+    def children(self, schemas: Iterable[Any], key: Union[str, int]) -> List[Any]:
+        """Return the subschemas that apply to one child of a container."""
+        result = []
+        for schema in schemas:
+            if not _descends(schema, schema is self._root):
+                continue
+            if isinstance(key, str):
+                result.extend(_property_schemas(schema, key))
+            else:
+                result.extend(_item_schemas(schema, key))
+        return result
+
+
+class _SchemaListener:
+    """Receives parser events for one document and records the first error."""
+
+    def __init__(self, checker: JSONSchemaStream):
+        self._checker = checker
+        # Schemas that apply to each open container, innermost last
+        self._stack: List[List[Any]] = []
+        # The first violation found, once there is one
+        self.error: Optional[Violation] = None
+
+    def _schemas(self, path: Path) -> List[Any]:
+        if not path:
+            return [self._checker._root]
+        return self._checker.children(self._stack[-1], path[-1])
+
+    def start(self, path: Path, container: Any) -> None:
+        schemas = self._schemas(path)
+        self._stack.append(schemas)
+        if self.error is not None:
+            return
+        kind = "object" if isinstance(container, dict) else "array"
+        for schema in schemas:
+            if not isinstance(schema, dict) or "$ref" in schema:
+                continue
+            types = schema.get("type")
+            if isinstance(types, str):
+                types = [types]
+            if isinstance(types, list) and kind not in types:
+                self._fail(
+                    path,
+                    f"{kind} is not of type {', '.join(repr(t) for t in types)}",
+                    "type"
+                )
+                return
+
+    def key(self, path: Path, key: str) -> None:
+        if self.error is not None:
+            return
+        for schema in self._stack[-1]:
+            if not _descends(schema, schema is self._checker._root):
+                continue
+            validator = self._checker._for_keys(schema)
+            if validator is not None:
+                error = _first_error(validator, {key: None})
+                if error is not None:
+                    self._fail(path, error.message, error.validator)
+                    return
+
+    def end(self, path: Path, value: Any) -> None:
+        if isinstance(value, (dict, list)):
+            schemas = self._stack.pop()
+            get_validator = self._checker._for_container
+        else:
+            schemas = self._schemas(path)
+            get_validator = self._checker._full
+        if self.error is not None:
+            return
+        for schema in schemas:
+            error = _first_error(get_validator(schema), value)
+            if error is not None:
+                self._fail(
+                    path + tuple(error.absolute_path), error.message, error.validator
+                )
+                return
+
+    def _fail(self, path: Iterable[Union[str, int]], message: str, keyword: Any) -> None:
+        from .validator import _json_pointer
+
+        path = tuple(path)
+        self.error = Violation(
+            "schema",
+            (message, keyword, _json_pointer(path)),
+            rule_type="schema",
+            path=path
+        )
+
+
+def _descends(schema: Any, is_root: bool) -> bool:
+    """Return True if a schema's child keywords can be applied on their own."""
+    if not isinstance(schema, dict):
+        return False
+    opaque = set(_OPAQUE_KEYWORDS.intersection(schema))
+    if is_root:
+        # The root's own $id is the base every reference resolves against
+        opaque.discard("$id")
+        opaque.discard("id")
+    return not opaque
+
+
+def _property_schemas(schema: Dict[str, Any], key: str) -> List[Any]:
+    result = []
+    properties = schema.get("properties")
+    if isinstance(properties, dict) and key in properties:
+        result.append(properties[key])
+    patterns = schema.get("patternProperties")
+    if isinstance(patterns, dict):
+        for pattern, subschema in patterns.items():
+            if re.search(pattern, key):
+                result.append(subschema)
+    if not result:
+        additional = schema.get("additionalProperties")
+        # False is reported when the key is read
+        if isinstance(additional, dict):
+            result.append(additional)
+    return result
+
+
+def _item_schemas(schema: Dict[str, Any], index: int) -> List[Any]:
+    prefix = schema.get("prefixItems")
+    items = schema.get("items")
+    if isinstance(prefix, list):
+        if index < len(prefix):
+            return [prefix[index]]
+        return [items] if isinstance(items, (dict, bool)) else []
+    if isinstance(items, list):
+        if index < len(items):
+            return [items[index]]
+        additional = schema.get("additionalItems")
+        return [additional] if isinstance(additional, (dict, bool)) else []
+    if isinstance(items, (dict, bool)):
+        return [items]
+    return []
+
+
+def _first_error(validator: Any, value: Any) -> Optional[Any]:
+    try:
+        return next(validator.iter_errors(value), None)
+    except Exception:
+        # The final validation reports broken schemas
+        return None
@@ -0,0 +1,138 @@
+"""Multi-keyword matching for keyword rules."""
+
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton that finds many keywords in a single pass.
+
+    The automaton is built once from lowercased keywords. Scanning a text
+    costs one transition per character regardless of how many keywords
+    there are, instead of one substring search per keyword.
+
+    Example:
+        >>> matcher = KeywordMatcher(["cheap", "defective"])
+        >>> matcher.find("a cheap product")
+        frozenset({'cheap'})
+    """
+
+    # States with more cached transitions than this fall back to walking
+    # failure links, so unusual input can't grow the tables without bound.
+    _MAX_CACHED_TRANSITIONS = 256
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Build the automaton.
+
+        Args:
+            keywords: Keywords to search for, already lowercased if the
+                search should be case-insensitive
+        """
+        self._keywords = frozenset(keywords)
+        self._matches_empty = "" in self._keywords
+
+        # Trie of keyword characters; state 0 is the root
+        transitions: List[Dict[str, int]] = [{}]
+        outputs: List[Tuple[str, ...]] = [()]
+        for keyword in self._keywords:
+            if not keyword:
+                continue
+            state = 0
+            for char in keyword:
+                next_state = transitions[state].get(char)
+                if next_state is None:
+                    transitions.append({})
+                    outputs.append(())
+                    next_state = len(transitions) - 1
+                    transitions[state][char] = next_state
+                state = next_state
+            outputs[state] = outputs[state] + (keyword,)
+
+        # Breadth-first failure links; outputs inherit those of their
+        # longest proper suffix state
+        failures = [0] * len(transitions)
+        queue = deque(transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in transitions[state].items():
+                queue.append(next_state)
+                fallback = failures[state]
+                while fallback and char not in transitions[fallback]:
+                    fallback = failures[fallback]
+                target = transitions[fallback].get(char, 0)
+                failures[next_state] = target if target != next_state else 0
+                outputs[next_state] = outputs[next_state] + outputs[failures[next_state]]
+
+        # Transition tables start as the trie and are completed lazily
+        # with the failure-link results as characters are seen.
+        self._transitions = transitions
+        self._failures = failures
+        self._outputs = outputs
+
+    @property
+    def keywords(self) -> FrozenSet[str]:
+        """Return the keywords this matcher searches for."""
+        return self._keywords
+
+    def __len__(self) -> int:
+        return len(self._keywords)
+
+    def find(self, text: str) -> FrozenSet[str]:
+        """
+        Return every keyword that occurs in text.
+
+        Args:
+            text: Text to search, lowercased to match the keywords
+
+        Returns:
+            Set of keywords found
+        """
+        _, found = self.scan(0, text)
+        return found
+
+    def scan(self, state: int, text: str) -> Tuple[int, FrozenSet[str]]:
+        """
+        Continue a search from a previous state.
+
+        Feeding a text in pieces through ``scan`` finds the same keywords
+        as a single ``find`` over the whole text, including keywords that
+        straddle piece boundaries.
+
+        Args:
+            state: State returned by the previous call, or 0 to start
+            text: Next piece of text to search
+
+        Returns:
+            Tuple of the state after the text and the keywords found in it
+        """
+        transitions = self._transitions
+        outputs = self._outputs
+        hit_states: Set[int] = set()
+
+        for char in text:
+            next_state = transitions[state].get(char)
+            if next_state is None:
+                next_state = self._transition(state, char)
+            state = next_state
+            if outputs[state]:
+                hit_states.add(state)
+
+        found: Set[str] = set()
+        for hit_state in hit_states:
+            found.update(outputs[hit_state])
+        if self._matches_empty:
+            found.add("")
+        return state, frozenset(found)
+
+    def _transition(self, state: int, char: str) -> int:
+        """Follow failure links for a transition missing from the table."""
+        transitions = self._transitions
+        source = state
+        while state and char not in transitions[state]:
+            state = self._failures[state]
+        target = transitions[state].get(char, 0)
+        if len(transitions[source]) < self._MAX_CACHED_TRANSITIONS:
+            transitions[source][char] = target
+        return target
@@ -1,7 +1,11 @@
 """Content linting and validation rules."""
 
 import re
-from typing import Any, Dict, List, Union, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple, Union
+
+from .matching import KeywordMatcher
+from .text import AnalyzedText
+from .violations import Violation
 
 
 class RuleError(Exception):
@@ -13,6 +17,163 @@ class RuleError(Exception):
         self.rule_name = rule_name
 
 
+# Signature of a compiled check: appends violations for one rule type
+RuleCheck = Callable[[AnalyzedText, List[Violation]], None]
+
+# Production safety: maximum content size processed by the rules
+MAX_CONTENT_SIZE = 1_000_000  # 1MB limit
+
+# Below this many distinct keywords, per-keyword substring searches (which
+# run in C) beat a single automaton pass over the text.
+_KEYWORD_MATCHER_THRESHOLD = 100
+
+_NUMBERED_LINE_PATTERN = re.compile(r"^\d+\.")
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+# Unicode and ASCII bullets with flexible spacing
+_BULLET_ITEM_PATTERN = re.compile(
+    r'(?:^|\n)[\s]*[•\u2022\u2023\u25e6\u2043\-\*\+][\s]+\S', re.MULTILINE
+)
+# Numbered lists with flexible formatting
+_NUMBERED_ITEM_PATTERN = re.compile(r'(?:^|\n)[\s]*\d+[\.\)][\s]+\S', re.MULTILINE)
+_PASSIVE_VOICE_PATTERNS = [
+    re.compile(r'\b(am|is|are|was|were|be|been|being)\s+\w+ed\b', re.IGNORECASE),
+    re.compile(r'\b(am|is|are|was|were|be|been|being)\s+\w+en\b', re.IGNORECASE),
+    re.compile(r'\b(am|is|are|was|were|be|been|being)\s+\w+ing\b', re.IGNORECASE),
+]
+_SENTENCE_SPLIT_PATTERN = re.compile(r'[.!?]+')
+
+
+class RulePlan:
+    """
+    Rules compiled into a flat execution plan.
+    
+    Each rule type in each rule becomes one specialized check with its
+    regexes and keywords prepared up front, so running the plan does no
+    dispatching or pattern compilation. All checks in a run share one
+    AnalyzedText, so derived views of the content are built only once.
+    """
+    
+    __slots__ = ("_checks",)
+    
+    def __init__(self, checks: List[Tuple[int, str, RuleCheck]]):
+        self._checks = tuple(checks)
+    
+    def __len__(self) -> int:
+        return len(self._checks)
+    
+    def run(
+        self, 
+        content: Union[str, Dict[str, Any]], 
+        fail_fast: bool = False
+    ) -> List[str]:
+        """
+        Run every check against content.
+        
+        Args:
+            content: Content to validate (string or dict)
+            fail_fast: Stop after the first error
+            
+        Returns:
+            List of validation error messages
+        """
+        return [violation.message for violation in self.evaluate(content, fail_fast)]
+    
+    def evaluate(
+        self, 
+        content: Union[str, Dict[str, Any]], 
+        fail_fast: bool = False
+    ) -> List[Violation]:
+        """
+        Run every check against content, returning structured violations.
+        
+        Each violation records the index and type of the rule that
+        produced it; messages are only rendered if asked for.
+        
+        Args:
+            content: Content to validate (string or dict)
+            fail_fast: Stop after the first error
+            
+        Returns:
+            List of violations
+        """
+        errors: List[Violation] = []
+        
+        content_str, path = _locate_text(content)
+        
+        # Production safety: Check content size before processing
+        content_size = len(content_str.encode('utf-8'))
+        if content_size > MAX_CONTENT_SIZE:
+            errors.append(Violation(
+                "content_too_large",
+                (content_size, MAX_CONTENT_SIZE),
+                path=path
+            ))
+            return errors  # Don't process oversized content
+        
+        text = AnalyzedText(content_str)
+        for rule_index, rule_type, check in self._checks:
+            found = len(errors)
+            try:
+                check(text, errors)
+            except Exception as e:
+                errors.append(Violation("rule_error", (rule_type, str(e))))
+            if len(errors) > found:
+                for violation in errors[found:]:
+                    violation.rule_index = rule_index
+                    violation.rule_type = rule_type
+                    violation.path = path
+                if fail_fast:
+                    return errors[:1]
+        
+        return errors
+
+
+def compile_rules(rules: List[Dict[str, Any]]) -> RulePlan:
+    """
+    Compile a list of rules into a reusable execution plan.
+    
+    Args:
+        rules: List of rule dictionaries
+        
+    Returns:
+        RulePlan producing the same errors as validate_rules
+        
+    Raises:
+        RuleError: If a rule is not a dictionary
+    """
+    checks: List[Tuple[int, str, RuleCheck]] = []
+    
+    for i, rule in enumerate(rules):
+        if not isinstance(rule, dict):
+            raise RuleError(
+                f"Rule {i+1} must be a dictionary, got {type(rule).__name__}"
+            )
+    
+    matcher = _build_keyword_matcher(rules)
+    
+    for rule_index, rule in enumerate(rules):
+        for rule_type, rule_value in rule.items():
+            compiler = _RULE_COMPILERS.get(rule_type)
+            if compiler is None:
+                checks.append((rule_index, rule_type, _unknown_rule_check(rule_type)))
+                continue
+            
+            try:
+                if rule_type in _KEYWORD_RULE_TYPES:
+                    check = compiler(rule_value, matcher)
+                else:
+                    check = compiler(rule_value)
+            except Exception as e:
+                # Report bad rule values on every run, as if applied lazily
+                check = _failing_check(e)
+            
+            if check is not None:
+                checks.append((rule_index, rule_type, check))
+    
+    return RulePlan(checks)
+
+
 def validate_rules(
     content: Union[str, Dict[str, Any]], 
     rules: List[Dict[str, Any]]
@@ -20,6 +181,9 @@ def validate_rules(
     """
     Validate content against a list of rules with production safety.
     
+    Callers applying the same rules repeatedly should use compile_rules
+    and reuse the resulting plan.
+    
     Args:
         content: Content to validate (string or dict)
         rules: List of rule dictionaries
@@ -27,263 +191,415 @@ def validate_rules(
     Returns:
         List of validation error messages
     """
-    errors: List[str] = []
-    
-    # Convert content to string for text-based rules
+    return compile_rules(rules).run(content)
+
+
+def _extract_text(content: Union[str, Dict[str, Any]]) -> str:
+    """Extract the text that text-based rules should look at."""
+    return _locate_text(content)[0]
+
+
+def _locate_text(
+    content: Union[str, Dict[str, Any]]
+) -> Tuple[str, Tuple[str, ...]]:
+    """Extract the text rules look at, with the key it came from, if any."""
     # FIXED: Extract actual text content from dictionary instead of stringifying the dict
     if isinstance(content, dict):
         # For structured content, extract the text field(s) for rule validation
         if "translation" in content:
-            content_str = content["translation"]
+            return content["translation"], ("translation",)
         elif "content" in content:
-            content_str = content["content"]
+            return content["content"], ("content",)
         elif "text" in content:
-            content_str = content["text"]
+            return content["text"], ("text",)
         else:
             # Fallback: combine all string values in the dict
             text_parts = []
             for value in content.values():
                 if isinstance(value, str):
                     text_parts.append(value)
-            content_str = " ".join(text_parts) if text_parts else str(content)
-    else:
-        content_str = str(content)
-    
-    # Production safety: Check content size before processing
-    MAX_CONTENT_SIZE = 1_000_000  # 1MB limit
-    content_size = len(content_str.encode('utf-8'))
-    if content_size > MAX_CONTENT_SIZE:
-        errors.append(
-            f"Content size ({content_size:,} bytes) exceeds maximum allowed "
-            f"({MAX_CONTENT_SIZE:,} bytes). Please reduce content size for processing."
-        )
-        return errors  # Don't process oversized content
+            return " ".join(text_parts) if text_parts else str(content), ()
+    return str(content), ()
+
+
+def _unknown_rule_check(rule_type: str) -> RuleCheck:
+    args = (rule_type,)
     
-    for i, rule in enumerate(rules):
+    def check(text: AnalyzedText, errors: List[Violation]) -> None:
+        errors.append(Violation("unknown_rule", args))
+    
+    return check
+
+
+class _DeferredRuleError(Exception):
+    """A rule value error found at compile time, reported when the rule runs."""
+
+
+def _failing_check(error: Exception) -> RuleCheck:
+    message = str(error)
+    
+    def check(text: AnalyzedText, errors: List[Violation]) -> None:
+        raise _DeferredRuleError(message)
+    
+    return check
+
+
+def _lower_keywords(
+    rule_value: Any
+) -> Tuple[List[Tuple[str, str]], Optional[str]]:
+    """
+    Prepare (keyword, lowered keyword) pairs for keyword rules.
+    
+    A keyword that can't be lowered stops preparation; its error message
+    is returned so the check can report it after the keywords before it.
+    """
+    if isinstance(rule_value, str):
+        return [(rule_value, rule_value.lower())], None
+    if not isinstance(rule_value, list):
+        return [], None
+    
+    pairs = []
+    for keyword in rule_value:
         try:
-            rule_errors = _validate_single_rule(content_str, rule)
-            errors.extend(rule_errors)
+            pairs.append((keyword, keyword.lower()))
         except Exception as e:
-            # Production error handling with context
-            rule_types = list(rule.keys())
-            errors.append(
-                f"Error processing rule {i+1} ({', '.join(rule_types)}): {str(e)}"
-            )
+            return pairs, str(e)
+    return pairs, None
+
+
+def _build_keyword_matcher(
+    rules: List[Dict[str, Any]]
+) -> Optional[KeywordMatcher]:
+    """Build one automaton over every keyword rule, if there are enough keywords."""
+    keywords: Set[str] = set()
+    for rule in rules:
+        for rule_type, rule_value in rule.items():
+            if rule_type in _KEYWORD_RULE_TYPES:
+                pairs, _ = _lower_keywords(rule_value)
+                keywords.update(keyword_lower for _, keyword_lower in pairs)
     
-    return errors
+    if len(keywords) < _KEYWORD_MATCHER_THRESHOLD:
+        return None
+    return KeywordMatcher(keywords)
 
 
-def _validate_single_rule(
-    content: str, 
-    rule: Dict[str, Any]
-) -> List[str]:
+def _keyword_hits(
+    text: AnalyzedText, 
+    matcher: Optional[KeywordMatcher]
+) -> Union[str, FrozenSet[str]]:
     """
-    Validate content against a single rule.
+    Return something supporting ``keyword_lower in hits`` for the text.
     
-    Args:
-        content: Content string to validate
-        rule: Rule dictionary
-        
-    Returns:
-        List of validation error messages
+    With a matcher this is the set of keywords found by its single pass,
+    shared by every keyword rule in the run; otherwise the lowercased text.
     """
-    errors: List[str] = []
+    if matcher is None:
+        return text.lower
+    return text.derive(matcher, lambda t: matcher.find(t.lower))
+
+
+def _keyword_span(lower: str, keyword_lower: str) -> Optional[Tuple[int, int]]:
+    """Return the offsets of a keyword's first occurrence in lowered text."""
+    start = lower.find(keyword_lower)
+    return (start, start + len(keyword_lower)) if start != -1 else None
+
+
+def _compile_keyword_must_include(
+    rule_value: Any, 
+    matcher: Optional[KeywordMatcher] = None
+) -> RuleCheck:
+    pairs, error = _lower_keywords(rule_value)
     
-    for rule_type, rule_value in rule.items():
-        try:
-            if rule_type == "keyword_must_include":
-                if isinstance(rule_value, str):
-                    if rule_value.lower() not in content.lower():
-                        errors.append(f"Missing required keyword: '{rule_value}'. Please include this term in your content.")
-                elif isinstance(rule_value, list):
-                    for keyword in rule_value:
-                        if keyword.lower() not in content.lower():
-                            errors.append(f"Missing required keyword: '{keyword}'. Please include this term in your content.")
-            
-            elif rule_type == "keyword_must_not_include":
-                if isinstance(rule_value, str):
-                    if rule_value.lower() in content.lower():
-                        errors.append(f"Prohibited keyword found: '{rule_value}'. Please remove or rephrase this content.")
-                elif isinstance(rule_value, list):
-                    for keyword in rule_value:
-                        if keyword.lower() in content.lower():
-                            errors.append(f"Prohibited keyword found: '{keyword}'. Please remove or rephrase this content.")
-            
-            elif rule_type == "no_placeholder_text":
-                pattern = re.compile(rule_value, re.IGNORECASE)
-                if pattern.search(content):
-                    errors.append(f"Contains placeholder text: '{rule_value}'")
-            
-            elif rule_type == "word_count_min":
-                word_count = len(content.split())
-                if word_count < rule_value:
-                    errors.append(f"Word count ({word_count}) below minimum ({rule_value})")
-            
-            elif rule_type == "word_count_max":
-                word_count = len(content.split())
-                if word_count > rule_value:
-                    errors.append(f"Word count ({word_count}) above maximum ({rule_value})")
-            
-            elif rule_type == "phrase_proximity":
-                if isinstance(rule_value, dict):
-                    terms = rule_value.get("terms", [])
-                    max_distance = rule_value.get("max_distance", 10)
-                    
-                    if len(terms) >= 2:
-                        proximity_errors = _check_phrase_proximity(
-                            content, terms, max_distance
-                        )
-                        errors.extend(proximity_errors)
-            
-            elif rule_type == "phrase_order":
-                if isinstance(rule_value, dict):
-                    first_phrase = rule_value.get("first", "")
-                    then_phrase = rule_value.get("then", "")
-                    
-                    if first_phrase and then_phrase:
-                        order_errors = _check_phrase_order(content, first_phrase, then_phrase)
-                        errors.extend(order_errors)
-            
-            elif rule_type == "section_must_start_with":
-                pattern = re.compile(rule_value, re.IGNORECASE)
-                if not pattern.match(content.strip()):
-                    errors.append(f"Content must start with pattern: '{rule_value}'")
-            
-            elif rule_type == "list_item_pattern":
-                pattern = re.compile(rule_value)
-                lines = content.splitlines()
-                for i, line in enumerate(lines):
-                    if line.strip().startswith("-") or line.strip().startswith("*"):
-                        continue  # skip unordered lists
-                    if re.match(r"^\d+\.", line.strip()):
-                        if not pattern.match(line.strip()):
-                            errors.append(f"Line {i+1} does not match list item pattern: '{rule_value}'")
-            
-            # New advanced rules
-            elif rule_type == "regex_must_match":
-                pattern = re.compile(rule_value, re.IGNORECASE)
-                if not pattern.search(content):
-                    errors.append(f"Content must match regex pattern: '{rule_value}'")
-            
-            elif rule_type == "no_duplicate_sentences":
-                # FIXED: Robust duplicate detection with proper normalization
-                if not rule_value:  # Skip if rule is disabled
-                    continue
-                    
-                # Enhanced sentence splitting that handles various punctuation
-                sentences = re.split(r'[.!?]+(?:\s|$)', content)
-                
-                # Robust sentence normalization and comparison
-                normalized_sentences = set()
-                duplicates = []
-                
-                for sentence in sentences:
-                    sentence = sentence.strip()
-                    if not sentence:
-                        continue
-                    
-                    # Comprehensive normalization for comparison
-                    normalized = sentence.lower()
-                    # Remove extra whitespace
-                    normalized = re.sub(r'\s+', ' ', normalized)
-                    # Remove punctuation for comparison
-                    normalized = re.sub(r'[^\w\s]', '', normalized).strip()
-                    
-                    if normalized in normalized_sentences:
-                        duplicates.append(sentence)
-                    else:
-                        normalized_sentences.add(normalized)
-                
-                if duplicates:
-                    duplicate_examples = [f'"{dup[:50]}..."' for dup in duplicates[:2]]
-                    errors.append(f"Duplicate sentences detected ({len(duplicates)} instances). Examples: {', '.join(duplicate_examples)}. Please rephrase or remove duplicate content.")
-            
-            elif rule_type == "min_list_items":
-                # FIXED: Enhanced list item detection for production use
-                # Handles indented lists, Unicode bullets, and real-world formatting
-                if rule_value <= 0:
-                    continue  # Skip if rule is disabled
-                
-                total_items = 0
-                
-                # Pattern 1: Unicode and ASCII bullets with flexible spacing
-                bullet_pattern = r'(?:^|\n)[\s]*[•\u2022\u2023\u25e6\u2043\-\*\+][\s]+\S'
-                bullet_matches = re.findall(bullet_pattern, content, re.MULTILINE)
-                total_items += len(bullet_matches)
-                
-                # Pattern 2: Numbered lists with flexible formatting  
-                number_pattern = r'(?:^|\n)[\s]*\d+[\.\)][\s]+\S'
-                number_matches = re.findall(number_pattern, content, re.MULTILINE)
-                total_items += len(number_matches)
-                
-                if total_items < rule_value:
-                    errors.append(f"Must have at least {rule_value} list items, found {total_items}. Please add more bullet points or numbered items.")
+    def check(text: AnalyzedText, errors: List[Violation]) -> None:
+        hits = _keyword_hits(text, matcher)
+        for keyword, keyword_lower in pairs:
+            if keyword_lower not in hits:
+                errors.append(Violation("keyword_missing", (keyword,)))
+        if error is not None:
+            raise _DeferredRuleError(error)
+    
+    return check
+
+
+def _compile_keyword_must_not_include(
+    rule_value: Any, 
+    matcher: Optional[KeywordMatcher] = None
+) -> RuleCheck:
+    pairs, error = _lower_keywords(rule_value)
+    
+    def check(text: AnalyzedText, errors: List[Violation]) -> None:
+        hits = _keyword_hits(text, matcher)
+        lower = None
+        for keyword, keyword_lower in pairs:
+            if keyword_lower in hits:
+                if lower is None:
+                    lower = text.lower
+                    # Offsets only line up if lowercasing kept the length
+                    exact = len(lower) == len(text.raw)
+                errors.append(Violation(
+                    "keyword_prohibited",
+                    (keyword,),
+                    _keyword_span(lower, keyword_lower) if exact else None
+                ))
+        if error is not None:
+            raise _DeferredRuleError(error)
+    
+    return check
+
+
+def _compile_no_placeholder_text(rule_value: Any) -> RuleCheck:
+    pattern = re.compile(rule_value, re.IGNORECASE)
+    args = (rule_value,)
+    
+    def check(text: AnalyzedText, errors: List[Violation]) -> None:
+        match = pattern.search(text.raw)
+        if match:
+            errors.append(Violation("placeholder_text", args, match.span()))
+    
+    return check
+
+
+def _compile_word_count_min(rule_value: Any) -> RuleCheck:
+    def check(text: AnalyzedText, errors: List[Violation]) -> None:
+        word_count = text.word_count
+        if word_count < rule_value:
+            errors.append(Violation(
+                "word_count_below", (word_count, rule_value)
+            ))
+    
+    return check
+
+
+def _compile_word_count_max(rule_value: Any) -> RuleCheck:
+    def check(text: AnalyzedText, errors: List[Violation]) -> None:
+        word_count = text.word_count
+        if word_count > rule_value:
+            errors.append(Violation(
+                "word_count_above", (word_count, rule_value)
+            ))
+    
+    return check
+
+
+def _compile_phrase_proximity(rule_value: Any) -> Optional[RuleCheck]:
+    if not isinstance(rule_value, dict):
+        return None
+    
+    terms = rule_value.get("terms", [])
+    max_distance = rule_value.get("max_distance", 10)
+    if len(terms) < 2:
+        return None
+    
+    # Lower terms once; non-string terms keep failing the way they always have
+    terms_lower = (
+        [term.lower() for term in terms]
+        if all(isinstance(term, str) for term in terms)
+        else None
+    )
+    
+    def check(text: AnalyzedText, errors: List[Violation]) -> None:
+        errors.extend(_check_phrase_proximity(
+            text, terms, max_distance, terms_lower
+        ))
+    
+    return check
+
+
+def _compile_phrase_order(rule_value: Any) -> Optional[RuleCheck]:
+    if not isinstance(rule_value, dict):
+        return None
+    
+    first_phrase = rule_value.get("first", "")
+    then_phrase = rule_value.get("then", "")
+    if not (first_phrase and then_phrase):
+        return None
+    
+    def check(text: AnalyzedText, errors: List[Violation]) -> None:
+        errors.extend(_check_phrase_order(text.lower, first_phrase, then_phrase))
+    
+    return check
+
+
+def _compile_section_must_start_with(rule_value: Any) -> RuleCheck:
+    pattern = re.compile(rule_value, re.IGNORECASE)
+    args = (rule_value,)
+    
+    def check(text: AnalyzedText, errors: List[Violation]) -> None:
+        if not pattern.match(text.stripped):
+            errors.append(Violation("section_start", args))
+    
+    return check
+
+
+def _compile_list_item_pattern(rule_value: Any) -> RuleCheck:
+    pattern = re.compile(rule_value)
+    
+    def check(text: AnalyzedText, errors: List[Violation]) -> None:
+        for i, line in enumerate(text.lines):
+            line = line.strip()
+            if line.startswith("-") or line.startswith("*"):
+                continue  # skip unordered lists
+            if _NUMBERED_LINE_PATTERN.match(line):
+                if not pattern.match(line):
+                    errors.append(Violation(
+                        "list_item_pattern", (i + 1, rule_value)
+                    ))
+    
+    return check
+
+
+def _compile_regex_must_match(rule_value: Any) -> RuleCheck:
+    pattern = re.compile(rule_value, re.IGNORECASE)
+    args = (rule_value,)
+    
+    def check(text: AnalyzedText, errors: List[Violation]) -> None:
+        if not pattern.search(text.raw):
+            errors.append(Violation("regex_mismatch", args))
+    
+    return check
+
+
+def _compile_no_duplicate_sentences(rule_value: Any) -> Optional[RuleCheck]:
+    if not rule_value:  # Skip if rule is disabled
+        return None
+    
+    def check(text: AnalyzedText, errors: List[Violation]) -> None:
+        # FIXED: Robust duplicate detection with proper normalization
+        # Enhanced sentence splitting that handles various punctuation
+        sentences = text.sentences
+        
+        # Robust sentence normalization and comparison
+        normalized_sentences = set()
+        duplicates = []
+        
+        for sentence in sentences:
+            sentence = sentence.strip()
+            if not sentence:
+                continue
             
-            elif rule_type == "max_passive_voice_ratio":
-                # Simple passive voice detection
-                passive_patterns = [
-                    r'\b(am|is|are|was|were|be|been|being)\s+\w+ed\b',
-                    r'\b(am|is|are|was|were|be|been|being)\s+\w+en\b',
-                    r'\b(am|is|are|was|were|be|been|being)\s+\w+ing\b'
-                ]
-                
-                total_sentences = len(re.split(r'[.!?]+', content))
-                passive_sentences = 0
-                
-                for pattern in passive_patterns:
-                    matches = re.findall(pattern, content, re.IGNORECASE)
-                    passive_sentences += len(matches)
-                
-                if total_sentences > 0:
-                    passive_ratio = passive_sentences / total_sentences
-                    if passive_ratio > rule_value:
-                        errors.append(f"Passive voice ratio ({passive_ratio:.2f}) exceeds maximum ({rule_value})")
+            # Comprehensive normalization for comparison
+            normalized = sentence.lower()
+            # Remove extra whitespace
+            normalized = _WHITESPACE_PATTERN.sub(' ', normalized)
+            # Remove punctuation for comparison
+            normalized = _PUNCTUATION_PATTERN.sub('', normalized).strip()
             
+            if normalized in normalized_sentences:
+                duplicates.append(sentence)
             else:
-                errors.append(f"Unknown rule type: '{rule_type}'")
-                
-        except Exception as e:
-            errors.append(f"Error applying rule '{rule_type}': {str(e)}")
+                normalized_sentences.add(normalized)
+        
+        if duplicates:
+            errors.append(Violation("duplicate_sentences", (
+                len(duplicates), tuple(dup[:50] for dup in duplicates[:2])
+            )))
     
-    return errors
+    return check
+
+
+def _compile_min_list_items(rule_value: Any) -> Optional[RuleCheck]:
+    # FIXED: Enhanced list item detection for production use
+    # Handles indented lists, Unicode bullets, and real-world formatting
+    if rule_value <= 0:
+        return None  # Skip if rule is disabled
+    
+    def check(text: AnalyzedText, errors: List[Violation]) -> None:
+        total_items = len(_BULLET_ITEM_PATTERN.findall(text.raw))
+        total_items += len(_NUMBERED_ITEM_PATTERN.findall(text.raw))
+        
+        if total_items < rule_value:
+            errors.append(Violation(
+                "min_list_items", (rule_value, total_items)
+            ))
+    
+    return check
+
+
+def _compile_max_passive_voice_ratio(rule_value: Any) -> RuleCheck:
+    def check(text: AnalyzedText, errors: List[Violation]) -> None:
+        # Simple passive voice detection
+        total_sentences = len(_SENTENCE_SPLIT_PATTERN.split(text.raw))
+        passive_sentences = 0
+        
+        for pattern in _PASSIVE_VOICE_PATTERNS:
+            passive_sentences += len(pattern.findall(text.raw))
+        
+        if total_sentences > 0:
+            passive_ratio = passive_sentences / total_sentences
+            if passive_ratio > rule_value:
+                errors.append(Violation(
+                    "passive_voice_ratio", (passive_ratio, rule_value)
+                ))
+    
+    return check
+
+
+_KEYWORD_RULE_TYPES = frozenset({"keyword_must_include", "keyword_must_not_include"})
+
+_RULE_COMPILERS: Dict[str, Callable[..., Optional[RuleCheck]]] = {
+    "keyword_must_include": _compile_keyword_must_include,
+    "keyword_must_not_include": _compile_keyword_must_not_include,
+    "no_placeholder_text": _compile_no_placeholder_text,
+    "word_count_min": _compile_word_count_min,
+    "word_count_max": _compile_word_count_max,
+    "phrase_proximity": _compile_phrase_proximity,
+    "phrase_order": _compile_phrase_order,
+    "section_must_start_with": _compile_section_must_start_with,
+    "list_item_pattern": _compile_list_item_pattern,
+    # Advanced rules
+    "regex_must_match": _compile_regex_must_match,
+    "no_duplicate_sentences": _compile_no_duplicate_sentences,
+    "min_list_items": _compile_min_list_items,
+    "max_passive_voice_ratio": _compile_max_passive_voice_ratio,
+}
 
 
 def _check_phrase_proximity(
-    content: str, 
+    text: AnalyzedText, 
     terms: List[str], 
-    max_distance: int
-) -> List[str]:
+    max_distance: int,
+    terms_lower: Optional[List[str]] = None
+) -> List[Violation]:
     """
     Check if terms appear within the specified distance of each other.
     
     Args:
-        content: Content to check
+        text: Analyzed content to check
         terms: List of terms to find
         max_distance: Maximum word distance between terms
+        terms_lower: Optional pre-lowered terms, parallel to terms
         
     Returns:
-        List of proximity error messages
+        List of proximity violations
     """
-    errors: List[str] = []
+    errors: List[Violation] = []
     
     if len(terms) < 2:
         return errors
     
-    words = content.lower().split()
     term_positions = {}
     
     # Find positions of all terms
-    for i, word in enumerate(words):
-        for term in terms:
-            if term.lower() in word:
-                if term not in term_positions:
-                    term_positions[term] = []
-                term_positions[term].append(i)
+    if terms_lower is not None:
+        for term, term_lower in zip(terms, terms_lower):
+            if term not in term_positions:
+                positions = text.words_containing(term_lower)
+                if positions:
+                    term_positions[term] = positions
+    else:
+        for i, word in enumerate(text.lower_words):
+            for term in terms:
+                if term.lower() in word:
+                    if term not in term_positions:
+                        term_positions[term] = []
+                    term_positions[term].append(i)
     
     # Check if all terms are found
     missing_terms = [term for term in terms if term not in term_positions]
     if missing_terms:
-        errors.append(f"Missing terms: {', '.join(missing_terms)}")
+        errors.append(Violation(
+            "proximity_missing_terms", (", ".join(missing_terms),)
+        ))
         return errors
     
     # Check proximity between all pairs of terms
@@ -301,43 +617,41 @@ def _check_phrase_proximity(
                     break
             
             if not found_proximity:
-                errors.append(
-                    f"Terms '{term1}' and '{term2}' must be within "
-                    f"{max_distance} words of each other"
-                )
+                errors.append(Violation(
+                    "proximity_too_far", (term1, term2, max_distance)
+                ))
     
     return errors
 
 
 def _check_phrase_order(
-    content: str, 
+    content_lower: str, 
     first_phrase: str, 
     then_phrase: str
-) -> List[str]:
+) -> List[Violation]:
     """
     Check if first_phrase appears before then_phrase.
     
     Args:
-        content: Content to check
+        content_lower: Lowercased content to check
         first_phrase: Phrase that should appear first
         then_phrase: Phrase that should appear after
         
     Returns:
-        List of order error messages
+        List of order violations
     """
-    errors: List[str] = []
+    errors: List[Violation] = []
     
-    content_lower = content.lower()
     first_pos = content_lower.find(first_phrase.lower())
     then_pos = content_lower.find(then_phrase.lower())
     
     if first_pos == -1:
-        errors.append(f"Missing required phrase: '{first_phrase}'")
+        errors.append(Violation("phrase_missing", (first_phrase,)))
     elif then_pos == -1:
-        errors.append(f"Missing required phrase: '{then_phrase}'")
+        errors.append(Violation("phrase_missing", (then_phrase,)))
     elif first_pos > then_pos:
-        errors.append(
-            f"Phrase '{first_phrase}' must appear before '{then_phrase}'"
-        )
+        errors.append(Violation(
+            "phrase_order", (first_phrase, then_phrase)
+        ))
     
     return errors 
\ No newline at end of file
@@ -1,8 +1,11 @@
 """Schema loading and parsing functionality."""
 
-from typing import Any, Dict, Optional, Union, List
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional, Union, List, Tuple
 from pathlib import Path
-import yaml
+import copy
+import os
+import threading
 
 
 class SchemaError(Exception):
@@ -14,12 +17,270 @@ class SchemaError(Exception):
         self.file_path = file_path
 
 
+class SchemaCacheInfo(NamedTuple):
+    """Statistics for the process-wide schema cache."""
+    
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+# (path, mtime_ns, size) for every file a schema was built from
+_Signature = Tuple[Tuple[str, int, int], ...]
+
+
+class _SchemaCacheEntry:
+    """A loaded schema together with the files it was built from."""
+    
+    __slots__ = ("signature", "schema", "compiled")
+    
+    def __init__(self, signature: _Signature, schema: Dict[str, Any]):
+        self.signature = signature
+        self.schema = schema
+        # Opaque slot for artifacts derived from this schema (e.g. a
+        # compiled Contract); dropped together with the entry.
+        self.compiled: Any = None
+
+
+class _SchemaCache:
+    """
+    LRU cache of loaded schemas keyed on resolved file path.
+    
+    An entry is only reused while the root schema file and every rule
+    bundle it includes still have the same modification time and size,
+    so editing any file in the include graph invalidates it.
+    """
+    
+    def __init__(self, maxsize: int = 128):
+        self._entries: "OrderedDict[str, _SchemaCacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+    
+    def get(self, schema_path: Union[str, Path]) -> _SchemaCacheEntry:
+        """Return the cache entry for a schema file, loading it if needed."""
+        path = Path(schema_path)
+        try:
+            key = str(path.resolve())
+        except OSError:
+            key = str(path.absolute())
+        
+        with self._lock:
+            entry = self._entries.get(key)
+        
+        if entry is not None and _signature_is_current(entry.signature):
+            with self._lock:
+                self._hits += 1
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+            return entry
+        
+        dependencies: List[Path] = []
+        schema = _load_schema_file(path, dependencies)
+        entry = _SchemaCacheEntry(_file_signature(dependencies), schema)
+        
+        with self._lock:
+            self._misses += 1
+            if self._maxsize > 0:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._maxsize:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+        
+        return entry
+    
+    def configure(self, maxsize: int) -> None:
+        """Change the maximum number of cached schemas."""
+        if maxsize < 0:
+            raise ValueError(f"maxsize must be non-negative, got {maxsize}")
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+    
+    def clear(self) -> None:
+        """Drop all cached schemas and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+    
+    def info(self) -> SchemaCacheInfo:
+        """Return current cache statistics."""
+        with self._lock:
+            return SchemaCacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._maxsize,
+                len(self._entries),
+            )
+
+
+_schema_cache = _SchemaCache()
+
+
 def load_schema(schema_path: Union[str, Path]) -> Dict[str, Any]:
     """
     Load and parse a YAML schema file.
     
+    Results are memoized in a process-wide LRU cache and reused until the
+    schema file or any rule bundle it includes changes on disk.
+    
+    Args:
+        schema_path: Path to the YAML schema file
+        
+    Returns:
+        Parsed schema dictionary
+        
+    Raises:
+        SchemaError: If file cannot be loaded or parsed
+    """
+    # Hand out a copy so callers can't corrupt the cached schema
+    return copy.deepcopy(_schema_cache.get(schema_path).schema)
+
+
+def configure_schema_cache(maxsize: int) -> None:
+    """
+    Set the maximum number of schemas kept in the cache.
+    
+    Args:
+        maxsize: Maximum number of cached schemas; 0 disables caching
+    """
+    _schema_cache.configure(maxsize)
+
+
+def clear_schema_cache() -> None:
+    """Drop all cached schemas and reset cache statistics."""
+    _schema_cache.clear()
+
+
+def schema_cache_info() -> SchemaCacheInfo:
+    """Return hit, miss and eviction counts for the schema cache."""
+    return _schema_cache.info()
+
+
+def _file_signature(paths: List[Path]) -> _Signature:
+    """Build a signature from the modification time and size of files."""
+    signature = []
+    for path in paths:
+        path_str = os.path.abspath(path)
+        try:
+            stat = os.stat(path_str)
+        except OSError:
+            # Vanished since it was read; never treat the entry as current
+            signature.append((path_str, -1, -1))
+            continue
+        signature.append((path_str, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _signature_is_current(signature: _Signature) -> bool:
+    """Check whether every file in a signature is unchanged."""
+    for path, mtime_ns, size in signature:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if stat.st_mtime_ns != mtime_ns or stat.st_size != size:
+            return False
+    return True
+
+
+def parse_schema(
+    schema: Union[str, Dict[str, Any]],
+    *,
+    base_dir: Optional[Union[str, Path]] = None,
+    bundles: Optional[Dict[str, Union[str, Dict[str, Any]]]] = None
+) -> Dict[str, Any]:
+    """
+    Parse a schema held in memory, expanding its rule bundles.
+    
+    Nothing is written to disk, and the result is not cached. Each
+    ``include`` is looked up in ``bundles`` first and then read from
+    ``base_dir``; bundles in ``bundles`` include each other by the same
+    names.
+    
+    Args:
+        schema: Schema dictionary, or the YAML text of a schema
+        base_dir: Directory that include paths are relative to
+        bundles: In-memory rule bundles (dictionaries or YAML text)
+            keyed on the include path that refers to them
+        
+    Returns:
+        Parsed schema dictionary; the input is never modified
+        
+    Raises:
+        SchemaError: If the schema or a bundle cannot be parsed, or an
+            include cannot be resolved
+    
+    Example:
+        >>> schema = parse_schema(yaml_text, bundles={"common.yaml": common})
+    """
+    parsed = _parse_document(schema, "schema")
+    
+    if "rules" in parsed:
+        parsed["rules"] = _process_rule_bundles(
+            parsed["rules"],
+            Path(base_dir) if base_dir is not None else None,
+            bundles=bundles
+        )
+    
+    return parsed
+
+
+def _parse_document(
+    document: Union[str, Dict[str, Any]],
+    kind: str,
+    file_path: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Turn YAML text or a dictionary into a fresh schema or bundle dictionary.
+    
+    Args:
+        document: YAML text or dictionary
+        kind: "schema" or "rule bundle", for error messages
+        file_path: Where the document came from, for error messages
+        
+    Raises:
+        SchemaError: If the YAML is invalid or isn't a dictionary
+    """
+    if isinstance(document, str):
+        # Imported on first parse rather than with the package; compiling
+        # a schema dictionary never needs it
+        import yaml
+        
+        try:
+            document = yaml.safe_load(document)
+        except yaml.YAMLError as e:
+            raise SchemaError(f"Invalid YAML in {kind}: {str(e)}", file_path)
+    else:
+        document = copy.deepcopy(document)
+    
+    if not isinstance(document, dict):
+        raise SchemaError(
+            f"{kind.capitalize()} must be a dictionary, got {type(document).__name__}",
+            file_path
+        )
+    
+    return document
+
+
+def _load_schema_file(
+    schema_path: Path,
+    dependencies: Optional[List[Path]] = None
+) -> Dict[str, Any]:
+    """
+    Load a YAML schema file from disk, bypassing the cache.
+    
     Args:
         schema_path: Path to the YAML schema file
+        dependencies: Optional list that receives every file read
         
     Returns:
         Parsed schema dictionary
@@ -27,6 +288,10 @@ def load_schema(schema_path: Union[str, Path]) -> Dict[str, Any]:
     Raises:
         SchemaError: If file cannot be loaded or parsed
     """
+    # Imported on first load rather than with the package; compiling a
+    # schema dictionary never needs it
+    import yaml
+    
     try:
         schema_path = Path(schema_path)
         
@@ -36,6 +301,9 @@ def load_schema(schema_path: Union[str, Path]) -> Dict[str, Any]:
                 str(schema_path)
             )
         
+        if dependencies is not None:
+            dependencies.append(schema_path)
+        
         with open(schema_path, 'r', encoding='utf-8') as f:
             schema = yaml.safe_load(f)
         
@@ -47,7 +315,9 @@ def load_schema(schema_path: Union[str, Path]) -> Dict[str, Any]:
         
         # Process rule bundles if present
         if "rules" in schema:
-            schema["rules"] = _process_rule_bundles(schema["rules"], schema_path)
+            schema["rules"] = _process_rule_bundles(
+                schema["rules"], schema_path.parent, dependencies
+            )
         
         return schema
         
@@ -63,13 +333,21 @@ def load_schema(schema_path: Union[str, Path]) -> Dict[str, Any]:
         )
 
 
-def _process_rule_bundles(rules: List[Dict[str, Any]], base_path: Path) -> List[Dict[str, Any]]:
+def _process_rule_bundles(
+    rules: List[Dict[str, Any]],
+    base_dir: Optional[Path],
+    dependencies: Optional[List[Path]] = None,
+    bundles: Optional[Dict[str, Union[str, Dict[str, Any]]]] = None
+) -> List[Dict[str, Any]]:
     """
     Process rule bundles by expanding include statements.
     
     Args:
         rules: List of rule dictionaries
-        base_path: Path to the base schema file
+        base_dir: Directory include paths are relative to, or None if
+            includes can only come from ``bundles``
+        dependencies: Optional list that receives every bundle file read
+        bundles: Optional in-memory bundles keyed on include path
         
     Returns:
         Expanded list of rules with bundles included
@@ -80,7 +358,9 @@ def _process_rule_bundles(rules: List[Dict[str, Any]], base_path: Path) -> List[
         # Check if this is an include statement
         if "include" in rule:
             include_path = rule["include"]
-            bundle_rules = _load_rule_bundle(include_path, base_path)
+            bundle_rules = _load_rule_bundle(
+                include_path, base_dir, dependencies, bundles
+            )
             expanded_rules.extend(bundle_rules)
         else:
             expanded_rules.append(rule)
@@ -88,23 +368,48 @@ def _process_rule_bundles(rules: List[Dict[str, Any]], base_path: Path) -> List[
     return expanded_rules
 
 
-def _load_rule_bundle(include_path: str, base_path: Path) -> List[Dict[str, Any]]:
+def _load_rule_bundle(
+    include_path: str,
+    base_dir: Optional[Path],
+    dependencies: Optional[List[Path]] = None,
+    bundles: Optional[Dict[str, Union[str, Dict[str, Any]]]] = None
+) -> List[Dict[str, Any]]:
     """
-    Load rules from a bundle file.
+    Load rules from an in-memory bundle or a bundle file.
     
     Args:
-        include_path: Path to the bundle file (relative to base_path)
-        base_path: Path to the base schema file
+        include_path: Key in ``bundles``, or path relative to base_dir
+        base_dir: Directory include paths are relative to, or None
+        dependencies: Optional list that receives every bundle file read
+        bundles: Optional in-memory bundles keyed on include path
         
     Returns:
         List of rules from the bundle
         
     Raises:
-        SchemaError: If bundle file cannot be loaded
+        SchemaError: If the bundle cannot be found or loaded
     """
+    if bundles is not None and include_path in bundles:
+        bundle_schema = _parse_document(
+            bundles[include_path], "rule bundle", include_path
+        )
+        # In-memory bundles resolve their own includes the same way
+        return _process_rule_bundles(
+            bundle_schema.get("rules", []), base_dir, dependencies, bundles
+        )
+    
+    if base_dir is None:
+        raise SchemaError(
+            f"Cannot resolve rule bundle '{include_path}' of an in-memory "
+            f"schema; pass base_dir or bundles",
+            include_path
+        )
+    
+    import yaml
+    
     try:
         # Resolve relative path
-        bundle_path = base_path.parent / include_path
+        bundle_path = base_dir / include_path
         
         if not bundle_path.exists():
             raise SchemaError(
@@ -112,6 +417,9 @@ def _load_rule_bundle(include_path: str, base_path: Path) -> List[Dict[str, Any]
                 str(bundle_path)
             )
         
+        if dependencies is not None:
+            dependencies.append(bundle_path)
+        
         # Load the bundle file
         with open(bundle_path, 'r', encoding='utf-8') as f:
             bundle_schema = yaml.safe_load(f)
@@ -127,7 +435,9 @@ def _load_rule_bundle(include_path: str, base_path: Path) -> List[Dict[str, Any]
         
         # Recursively process any includes in the bundle
         if bundle_rules:
-            bundle_rules = _process_rule_bundles(bundle_rules, bundle_path)
+            bundle_rules = _process_rule_bundles(
+                bundle_rules, bundle_path.parent, dependencies, bundles
+            )
         
         return bundle_rules
         
@@ -0,0 +1,564 @@
+"""Incremental validation of LLM output as it is generated."""
+
+import importlib
+import re
+from bisect import bisect_right
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from .jsonstream import IncrementalJSONParser, JSONSchemaStream
+from .matching import KeywordMatcher
+from .rules import _lower_keywords
+from .validator import Contract, ValidationError, ValidationResult
+from .violations import Violation
+
+
+def _import_regex_parser() -> Any:
+    """Return CPython's private regex parser module, or None if there is none."""
+    # re._parser from Python 3.11, sre_parse (deprecated since) before it
+    for name in ("re._parser", "sre_parse"):
+        try:
+            return importlib.import_module(name)
+        except ImportError:
+            continue
+    return None
+
+
+# Used to find which patterns can be decided early. It is not a public
+# API: without it, or if it fails on a pattern, the pattern is left to
+# finish()
+_sre_parser = _import_regex_parser()
+
+# Outputs starting with one of these may parse as JSON, in which case the
+# rules see extracted fields rather than the raw text
+_JSON_START_CHARS = frozenset('{["-0123456789')
+_JSON_LITERALS = ("true", "false", "null", "NaN", "Infinity")
+
+# Capital sigma lowercases differently at the end of a word, so lowering
+# a chunk at a time could disagree with lowering the whole text
+_CONTEXTUAL_LOWER_CHARS = frozenset("Σ")
+
+# Unbounded placeholder patterns are re-searched over the whole text each
+# time it grows by this fraction (or at least _MIN_RESCAN_GROWTH chars)
+_RESCAN_GROWTH = 0.25
+_MIN_RESCAN_GROWTH = 256
+
+
+class StreamRules:
+    """
+    The rules of a contract that can fail before the output is complete.
+
+    Only rules whose failure on a prefix guarantees failure on the whole
+    text are checked early:
+
+    - ``keyword_must_not_include``: a prohibited keyword, once seen, stays
+    - ``no_placeholder_text``: a match that doesn't touch the end of the
+      text so far stays a match
+    - ``word_count_max``: the word count only grows
+    - ``section_must_start_with``: decided once enough of the opening has
+      arrived, for patterns that can only match a bounded number of chars
+
+    Patterns with lookahead assertions are left to the final validation.
+
+    JSON output is parsed incrementally and checked against the JSON
+    schema as its objects and fields close (see JSONSchemaStream).
+    """
+
+    __slots__ = (
+        "keyword_rules", "matcher", "placeholders", "word_limits", "sections",
+        "json_schema",
+    )
+
+    def __init__(
+        self,
+        rules: List[Dict[str, Any]],
+        json_validator: Optional[Any] = None
+    ):
+        """
+        Compile the early-failing rules from a contract's rules.
+
+        Args:
+            rules: List of rule dictionaries, as validated by compile_rules
+            json_validator: jsonschema validator for the contract's JSON
+                schema, if it has a valid one
+        """
+        self.json_schema = (
+            JSONSchemaStream(json_validator)
+            if json_validator is not None
+            and JSONSchemaStream.supports(json_validator.schema)
+            else None
+        )
+
+        # Each entry ends with the index of the rule it came from
+        self.keyword_rules: List[Tuple[List[Tuple[str, str]], int]] = []
+        self.placeholders: List[
+            Tuple[re.Pattern, Optional[Tuple[int, int]], Any, int]
+        ] = []
+        self.word_limits: List[Tuple[Any, int]] = []
+        self.sections: List[Tuple[re.Pattern, int, Any, int]] = []
+
+        for rule_index, rule in enumerate(rules):
+            for rule_type, rule_value in rule.items():
+                if rule_type == "keyword_must_not_include":
+                    pairs, _ = _lower_keywords(rule_value)
+                    if pairs:
+                        self.keyword_rules.append((pairs, rule_index))
+                elif rule_type == "no_placeholder_text":
+                    pattern = _compile_pattern(rule_value)
+                    if pattern is not None and not _has_lookahead(pattern):
+                        self.placeholders.append((
+                            pattern, _pattern_window(pattern), rule_value, rule_index
+                        ))
+                elif rule_type == "word_count_max":
+                    if (
+                        isinstance(rule_value, (int, float))
+                        and not isinstance(rule_value, bool)
+                    ):
+                        self.word_limits.append((rule_value, rule_index))
+                elif rule_type == "section_must_start_with":
+                    pattern = _compile_pattern(rule_value)
+                    window = _pattern_window(pattern) if pattern is not None else None
+                    if (
+                        pattern is not None
+                        and window is not None
+                        and not _has_lookahead(pattern)
+                    ):
+                        self.sections.append((
+                            pattern, window[0], rule_value, rule_index
+                        ))
+
+        keywords = {
+            keyword_lower
+            for pairs, _ in self.keyword_rules
+            for _, keyword_lower in pairs
+        }
+        self.matcher = KeywordMatcher(keywords) if keywords else None
+
+    @property
+    def has_text_rules(self) -> bool:
+        """Return True if any rule is checked early on plain-text output."""
+        return bool(
+            self.keyword_rules or self.placeholders or self.word_limits or self.sections
+        )
+
+
+class StreamValidator:
+    """
+    Validate an output chunk by chunk while it is being generated.
+
+    Feed each chunk as it arrives; ``feed`` returns the errors that the
+    finished output is already certain to have, so a generation that
+    breaks a contract can be stopped early. Each chunk is processed once:
+    keyword matching resumes from the previous automaton state, word
+    counts are carried over, and placeholder patterns only rescan a short
+    window at the end of the text. ``finish`` validates the complete
+    output against the whole contract and is the authoritative result.
+
+    Text rules are checked early on plain-text outputs. Outputs that
+    start like JSON are parsed as they arrive instead, and reported as
+    soon as a closed value breaks the JSON schema; their text rules are
+    only checked by ``finish``.
+
+    Example:
+        >>> stream = contract.stream()
+        >>> for chunk in llm_stream:
+        ...     if stream.feed(chunk):
+        ...         break  # cancel the generation
+        >>> result = stream.finish()
+    """
+
+    def __init__(
+        self,
+        contract: Contract,
+        rules: StreamRules,
+        all_errors: Optional[bool] = None,
+        fail_fast: Optional[bool] = None
+    ):
+        """
+        Start a stream. Use ``Contract.stream()`` rather than calling this.
+
+        Args:
+            contract: Contract the finished output is validated against
+            rules: The contract's early-failing rules
+            all_errors: Passed to the final validation
+            fail_fast: Passed to the final validation
+        """
+        self._contract = contract
+        self._rules = rules
+        self._all_errors = all_errors
+        self._fail_fast = fail_fast
+
+        self._chunks: List[str] = []
+        self._offsets: List[int] = []
+        self._length = 0
+        self._finished = False
+
+        # Where the content starts and ends, ignoring surrounding whitespace
+        self._content_start: Optional[int] = None
+        self._content_end = 0
+        # None until we know whether the output is plain text
+        self._plain_text: Optional[bool] = None
+
+        # JSON output is parsed as it arrives and checked against the schema
+        self._json = rules.json_schema.start() if rules.json_schema else None
+        self._parser = IncrementalJSONParser(self._json) if self._json else None
+        self._root_types = (
+            ", ".join(repr(t) for t in rules.json_schema.root_types())
+            if rules.json_schema else ""
+        )
+
+        self._violations: List[Violation] = []
+        self._pending: List[Violation] = []
+
+        self._keyword_state = 0
+        self._keywords_found: Set[str] = set()
+        self._keyword_rules_left = [
+            (list(pairs), rule_index) for pairs, rule_index in rules.keyword_rules
+        ]
+        self._keywords_usable = True
+
+        self._word_count = 0
+        self._in_word = False
+        self._word_limits_left = list(rules.word_limits)
+
+        # Per placeholder rule: earliest start of a possible match, or
+        # None once it has matched; and the length to next rescan at
+        self._placeholder_starts: List[Optional[int]] = [0] * len(rules.placeholders)
+        self._placeholder_rescans = [0] * len(rules.placeholders)
+
+        self._sections_left = list(rules.sections)
+
+    @property
+    def text(self) -> str:
+        """Return the output received so far."""
+        return "".join(self._chunks)
+
+    @property
+    def violations(self) -> List[Violation]:
+        """Return the violations found so far, as ``ValidationResult`` has them."""
+        return list(self._violations)
+
+    @property
+    def errors(self) -> List[str]:
+        """Return the messages of the violations found so far."""
+        return [violation.message for violation in self._violations]
+
+    @property
+    def failed(self) -> bool:
+        """Return True if the finished output is already certain to fail."""
+        return bool(self._violations)
+
+    def feed(self, chunk: str) -> List[str]:
+        """
+        Add the next chunk of output.
+
+        Args:
+            chunk: Next piece of generated text
+
+        Returns:
+            Errors found so far; non-empty means the output will fail
+
+        Raises:
+            ValidationError: If an error is found and strict mode is enabled
+            ValueError: If the stream has already been finished
+        """
+        if self._finished:
+            raise ValueError("Cannot feed a stream after finish()")
+        if not chunk:
+            return self.errors
+
+        start = self._length
+        self._chunks.append(chunk)
+        self._offsets.append(start)
+        self._length += len(chunk)
+
+        stripped = chunk.rstrip()
+        if stripped:
+            if self._content_start is None:
+                self._content_start = start + len(chunk) - len(chunk.lstrip())
+            self._content_end = start + len(stripped)
+
+        found = len(self._violations)
+
+        if self._plain_text is not False and self._rules.has_text_rules:
+            self._scan(chunk)
+        if self._plain_text is None:
+            self._detect_plain_text()
+        if self._parser is not None:
+            self._scan_json(chunk)
+        if self._plain_text and self._pending:
+            self._violations.extend(self._pending)
+            self._pending = []
+
+        if self._contract.strict and len(self._violations) > found:
+            raise ValidationError(
+                f"Validation failed with {len(self._violations)} errors",
+                self.errors,
+                self.violations
+            )
+        return self.errors
+
+    def finish(self) -> ValidationResult:
+        """
+        Validate the complete output against the whole contract.
+
+        Returns:
+            ValidationResult for the complete output
+
+        Raises:
+            ValidationError: If validation fails and strict mode is enabled
+            ValueError: If the stream has already been finished
+        """
+        if self._finished:
+            raise ValueError("Stream already finished")
+        self._finished = True
+        return self._contract.validate(
+            self.text, all_errors=self._all_errors, fail_fast=self._fail_fast
+        )
+
+    def _scan(self, chunk: str) -> None:
+        """Run the early checks over a new chunk."""
+        rules = self._rules
+
+        if rules.matcher is not None and self._keywords_usable:
+            if _CONTEXTUAL_LOWER_CHARS.intersection(chunk):
+                self._keywords_usable = False
+            else:
+                self._scan_keywords(chunk)
+
+        if self._word_limits_left:
+            self._count_words(chunk)
+
+        for index, (pattern, window, _, _) in enumerate(rules.placeholders):
+            if self._placeholder_starts[index] is not None:
+                self._search_placeholder(index, pattern, window)
+
+        if self._sections_left and self._content_start is not None:
+            self._check_sections()
+
+    def _scan_json(self, chunk: str) -> None:
+        """Parse a new chunk of JSON output and check what has closed."""
+        if self._plain_text:
+            # Not JSON, so validated as a string, which the schema rejects
+            self._parser = None
+            self._violations.append(_schema_type_violation(
+                f"output is not JSON and is not of type {self._root_types}"
+            ))
+            return
+
+        parser, listener = self._parser, self._json
+        assert parser is not None and listener is not None
+        parser.feed(chunk)
+        if listener.error is not None:
+            self._parser = None
+            self._violations.append(listener.error)
+        elif parser.error is not None:
+            self._violations.append(_schema_type_violation(
+                f"{parser.error}; output is not of type {self._root_types}"
+            ))
+            self._parser = None
+
+    def _scan_keywords(self, chunk: str) -> None:
+        matcher = self._rules.matcher
+        assert matcher is not None
+        self._keyword_state, found = matcher.scan(
+            self._keyword_state, chunk.lower()
+        )
+        if not found - self._keywords_found:
+            return
+        self._keywords_found.update(found)
+
+        for pairs, rule_index in self._keyword_rules_left:
+            for pair in list(pairs):
+                keyword, keyword_lower = pair
+                if keyword_lower in self._keywords_found:
+                    self._pending.append(Violation(
+                        "keyword_prohibited",
+                        (keyword,),
+                        rule_index=rule_index,
+                        rule_type="keyword_must_not_include"
+                    ))
+                    pairs.remove(pair)
+
+    def _count_words(self, chunk: str) -> None:
+        words = len(chunk.split())
+        if words and self._in_word and not chunk[0].isspace():
+            words -= 1  # the chunk continues the previous word
+        self._word_count += words
+        self._in_word = not chunk[-1].isspace()
+
+        for entry in list(self._word_limits_left):
+            limit, rule_index = entry
+            if self._word_count > limit:
+                # The final count can only be higher
+                self._pending.append(Violation(
+                    "word_count_above_so_far",
+                    (self._word_count, limit),
+                    rule_index=rule_index,
+                    rule_type="word_count_max"
+                ))
+                self._word_limits_left.remove(entry)
+
+    def _search_placeholder(
+        self,
+        index: int,
+        pattern: re.Pattern,
+        window: Optional[Tuple[int, int]]
+    ) -> None:
+        # A match ending at least two characters before the end of the
+        # text so far is unaffected by what comes next: end anchors and
+        # word boundaries are decided by characters already received.
+        limit = self._length - 2
+
+        if window is None:
+            # Unbounded pattern: rescan everything, but only as the text grows
+            if self._length < self._placeholder_rescans[index]:
+                return
+            self._placeholder_rescans[index] = max(
+                int(self._length * (1 + _RESCAN_GROWTH)),
+                self._length + _MIN_RESCAN_GROWTH,
+            )
+            match = pattern.search(self.text)
+            if match is not None and match.end() <= limit:
+                self._placeholder_starts[index] = None
+                self._pending.append(self._placeholder_violation(index, match.span()))
+            return
+
+        width, lookbehind = window
+        start = self._placeholder_starts[index]
+        assert start is not None
+        base = max(0, start - lookbehind - 1)
+        text = self._text_from(base)
+        match = pattern.search(text, start - base)
+        if match is not None and match.end() + base <= limit:
+            self._placeholder_starts[index] = None
+            self._pending.append(self._placeholder_violation(
+                index, (match.start() + base, match.end() + base)
+            ))
+        else:
+            # Any match starting before this would have fit in the text so far
+            resolved = max(start, limit + 1 - width)
+            if match is not None:
+                resolved = min(resolved, match.start() + base)
+            self._placeholder_starts[index] = resolved
+
+    def _check_sections(self) -> None:
+        content_start = self._content_start
+        assert content_start is not None
+        content_length = self._content_end - content_start
+        for section in list(self._sections_left):
+            pattern, width, rule_value, rule_index = section
+            # Matching at most `width` chars, the result is fixed once the
+            # stripped text has two more
+            if content_length < width + 2:
+                continue
+            self._sections_left.remove(section)
+            if not pattern.match(self._text_from(content_start)):
+                self._pending.append(Violation(
+                    "section_start",
+                    (rule_value,),
+                    rule_index=rule_index,
+                    rule_type="section_must_start_with"
+                ))
+
+    def _placeholder_violation(self, index: int, span: Tuple[int, int]) -> Violation:
+        _, _, rule_value, rule_index = self._rules.placeholders[index]
+        return Violation(
+            "placeholder_text",
+            (rule_value,),
+            span,
+            rule_index=rule_index,
+            rule_type="no_placeholder_text"
+        )
+
+    def _detect_plain_text(self) -> None:
+        """Decide whether the output is plain text rather than JSON."""
+        if self._content_start is None:
+            return
+        first = self._text_from(self._content_start)[0]
+        if first in _JSON_START_CHARS:
+            self._plain_text = False
+            self._pending = []
+            return
+
+        content = self._text_from(self._content_start)[
+            :self._content_end - self._content_start
+        ]
+        if not any(literal.startswith(content) for literal in _JSON_LITERALS):
+            self._plain_text = True
+
+    def _text_from(self, start: int) -> str:
+        """Return the text received from an offset on, joining only what's needed."""
+        index = bisect_right(self._offsets, start) - 1
+        return "".join(self._chunks[index:])[start - self._offsets[index]:]
+
+
+def _schema_type_violation(message: str) -> Violation:
+    """Build the violation for output that cannot match the root type."""
+    return Violation("schema", (message, "type", ""), rule_type="schema")
+
+
+def _compile_pattern(rule_value: Any) -> Optional[re.Pattern]:
+    """Compile a rule's pattern the way the rule does, or None if it can't be."""
+    try:
+        return re.compile(rule_value, re.IGNORECASE)
+    except Exception:
+        return None
+
+
+def _pattern_window(pattern: re.Pattern) -> Optional[Tuple[int, int]]:
+    """
+    Return (max match width, max lookbehind width) for a pattern.
+
+    Returns None if a match can be arbitrarily long, or if the widths
+    can't be worked out.
+    """
+    if _sre_parser is None:
+        return None
+    try:
+        parsed = _sre_parser.parse(pattern.pattern, pattern.flags)
+        width = parsed.getwidth()[1]
+        if width >= _sre_parser.MAXREPEAT:
+            return None
+
+        lookbehind = 0
+        for op, av in _walk(parsed):
+            if op in (_sre_parser.ASSERT, _sre_parser.ASSERT_NOT) and av[0] < 0:
+                lookbehind = max(lookbehind, av[1].getwidth()[1])
+    except Exception:
+        return None
+    return int(width), int(lookbehind)
+
+
+def _has_lookahead(pattern: re.Pattern) -> bool:
+    """
+    Return True if a pattern may look past the end of its match.
+
+    Also True if the pattern can't be inspected, so it isn't checked early.
+    """
+    if _sre_parser is None:
+        return True
+    try:
+        parsed = _sre_parser.parse(pattern.pattern, pattern.flags)
+        return any(
+            op in (_sre_parser.ASSERT, _sre_parser.ASSERT_NOT) and av[0] > 0
+            for op, av in _walk(parsed)
+        )
+    except Exception:
+        return True
+
+
+def _walk(items: Any) -> Iterator[Tuple[Any, Any]]:
+    """Yield every (op, av) item of a parsed pattern, including nested ones."""
+    for item in items:
+        if isinstance(item, tuple) and len(item) == 2:
+            op, av = item
+            yield op, av
+            yield from _walk(_subpatterns(av))
+
+
+def _subpatterns(value: Any) -> Iterator[Any]:
+    if isinstance(value, _sre_parser.SubPattern):
+        yield from value
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _subpatterns(item)
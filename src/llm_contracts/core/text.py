@@ -0,0 +1,126 @@
+"""Shared, lazily computed views of content for rule evaluation."""
+
+import re
+from bisect import bisect_right
+from functools import cached_property
+from typing import Any, Callable, Dict, List, Tuple, TypeVar
+
+_T = TypeVar("_T")
+
+_WORD_PATTERN = re.compile(r'\S+')
+_SENTENCE_END_PATTERN = re.compile(r'[.!?]+(?:\s|$)')
+
+
+class AnalyzedText:
+    """
+    Content being validated, with derived views built on first use.
+
+    One instance is shared by every rule in a validation run, so the
+    lowercased text, word tokens, lines and sentences are each computed
+    at most once per output no matter how many rules need them.
+    """
+
+    def __init__(self, raw: str):
+        self.raw = raw
+        self._derived: Dict[Any, Any] = {}
+
+    def derive(self, key: Any, compute: Callable[["AnalyzedText"], _T]) -> _T:
+        """
+        Return a view computed by ``compute(self)``, building it on first use.
+
+        Lets compiled rules share their own derived views (e.g. keyword
+        hits) within a run without AnalyzedText knowing about them.
+
+        Args:
+            key: Hashable key identifying the view
+            compute: Function building the view from this text
+
+        Returns:
+            The cached or newly computed view
+        """
+        try:
+            value: _T = self._derived[key]
+        except KeyError:
+            value = self._derived[key] = compute(self)
+        return value
+
+    @cached_property
+    def lower(self) -> str:
+        """Lowercased text."""
+        return self.raw.lower()
+
+    @cached_property
+    def stripped(self) -> str:
+        """Text with surrounding whitespace removed."""
+        return self.raw.strip()
+
+    @cached_property
+    def words(self) -> List[str]:
+        """Whitespace-separated word tokens."""
+        return self.raw.split()
+
+    @cached_property
+    def word_count(self) -> int:
+        """Number of word tokens."""
+        return len(self.words)
+
+    @cached_property
+    def lower_words(self) -> List[str]:
+        """Whitespace-separated tokens of the lowercased text."""
+        return self.lower.split()
+
+    @cached_property
+    def word_spans(self) -> List[Tuple[int, int]]:
+        """(start, end) character offsets of each word token."""
+        return [match.span() for match in _WORD_PATTERN.finditer(self.raw)]
+
+    @cached_property
+    def lines(self) -> List[str]:
+        """Text split into lines."""
+        return self.raw.splitlines()
+
+    @cached_property
+    def sentences(self) -> List[str]:
+        """Text split on sentence-ending punctuation followed by whitespace."""
+        return _SENTENCE_END_PATTERN.split(self.raw)
+
+    @cached_property
+    def _joined_lower_words(self) -> Tuple[str, List[int]]:
+        """Lowercased words joined by single spaces, plus each word's offset."""
+        starts = []
+        offset = 0
+        for word in self.lower_words:
+            starts.append(offset)
+            offset += len(word) + 1
+        return " ".join(self.lower_words), starts
+
+    def words_containing(self, fragment: str) -> List[int]:
+        """
+        Return indices of lowercased words that contain a fragment.
+
+        Equivalent to ``[i for i, w in enumerate(lower_words) if fragment in w]``
+        but searches the text once instead of testing every word.
+
+        Args:
+            fragment: Lowercased fragment to look for
+
+        Returns:
+            Ascending word indices
+        """
+        if not fragment:
+            return list(range(len(self.lower_words)))
+        if any(char.isspace() for char in fragment):
+            # Words never contain whitespace
+            return []
+
+        joined, starts = self._joined_lower_words
+        positions: List[int] = []
+        find = joined.find
+        pos = find(fragment)
+        while pos != -1:
+            index = bisect_right(starts, pos) - 1
+            positions.append(index)
+            # Continue after this word; each word is reported once
+            next_start = starts[index + 1] if index + 1 < len(starts) else len(joined)
+            pos = find(fragment, next_start)
+        return positions
@@ -1,46 +1,630 @@
 """Core validation functionality."""
 
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence,
+    Type, Union
+)
+import copy
 import json
 from pathlib import Path
 
-from jsonschema import ValidationError as JSONSchemaValidationError
-from jsonschema import validate as json_validate
+from .schema import SchemaError, _schema_cache, parse_schema
+from .rules import RuleError, compile_rules
+from .violations import Violation
 
-from .schema import SchemaError, load_schema
-from .rules import RuleError, validate_rules
+if TYPE_CHECKING:
+    from jsonschema.exceptions import ValidationError as JSONSchemaValidationError
+    from .streaming import StreamRules, StreamValidator
+
+# jsonschema takes longer to import than the rest of the package, so it
+# is imported by _import_jsonschema when the first JSON schema is compiled
+validator_for: Any = None
+best_match: Any = None
 
 
 class ValidationError(Exception):
     """Raised when validation fails."""
     
-    def __init__(self, message: str, errors: Optional[List[str]] = None):
+    def __init__(
+        self, 
+        message: str, 
+        errors: Optional[List[str]] = None,
+        violations: Optional[List[Violation]] = None
+    ):
         super().__init__(message)
         self.message = message
         self.errors = errors or []
+        self.violations = violations or []
 
 
 class ValidationResult:
-    """Result of a validation operation."""
+    """
+    Result of a validation operation.
     
-    def __init__(self, is_valid: bool, errors: List[str]):
+    Failures are kept as structured ``violations``; ``errors`` renders
+    their messages the first time it is read. Both are ordinary lists
+    that can be changed in place, and each follows changes to the other.
+    """
+    
+    def __init__(self, is_valid: bool, errors: Sequence[Union[str, Violation]]):
+        """
+        Args:
+            is_valid: Whether the output passed validation
+            errors: Violations, or plain error messages
+        """
         self.is_valid = is_valid
-        self.errors = errors
+        self._violations: Optional[List[Violation]] = _as_violations(errors)
+        self._errors: Optional[List[str]] = None
+        self._stale_violations: Optional[List[Violation]] = None
+    
+    @classmethod
+    def _of(cls, violations: List[Violation]) -> "ValidationResult":
+        """Build a result from violations without re-checking them."""
+        result = cls.__new__(cls)
+        result.is_valid = not violations
+        result._violations = violations
+        result._errors = None
+        result._stale_violations = None
+        return result
+    
+    @property
+    def violations(self) -> List[Violation]:
+        """Return the structured violations."""
+        violations = self._violations
+        if violations is None:
+            # errors was changed in place; keep the structured violation
+            # behind every message that is still there
+            assert self._errors is not None
+            violations = _match_violations(self._errors, self._stale_violations)
+            self._stale_violations = None
+        if type(violations) is not _SyncedList:
+            violations = _SyncedList(violations, self._list_changed)
+            self._violations = violations
+        return violations
+    
+    @violations.setter
+    def violations(self, violations: Iterable[Violation]) -> None:
+        if violations is self._violations:
+            # ``result.violations += ...`` already changed the list in place
+            return
+        self._violations = list(violations)
+        self._errors = None
+    
+    @property
+    def errors(self) -> List[str]:
+        """Return the error messages."""
+        if self._errors is None:
+            self._errors = _SyncedList(
+                [violation.message for violation in self.violations],
+                self._list_changed
+            )
+        return self._errors
+    
+    @errors.setter
+    def errors(self, errors: Sequence[Union[str, Violation]]) -> None:
+        if errors is self._errors:
+            # ``result.errors += ...`` already changed the list in place
+            return
+        self.violations = _as_violations(errors)
+    
+    def _list_changed(self, changed: List[Any]) -> None:
+        """Bring one list up to date after the other was changed in place."""
+        if changed is self._errors:
+            self._stale_violations = self._violations
+            self._violations = None
+        elif changed is self._violations:
+            self._errors = None
     
     def __bool__(self) -> bool:
         return self.is_valid
+    
+    def __reduce__(self) -> Any:
+        # The lists refer back to their result; pickle plain copies, along
+        # with any attributes callers have set
+        violations = self._violations if self._violations is not None else self.violations
+        extra = {
+            name: value for name, value in vars(self).items()
+            if not name.startswith("_") and name != "is_valid"
+        }
+        return (
+            _rebuild_result,
+            (self.__class__, self.is_valid, list(violations)),
+            extra or None
+        )
+
+
+def _rebuild_result(
+    cls: Type[ValidationResult],
+    is_valid: bool,
+    violations: List[Violation]
+) -> ValidationResult:
+    """Recreate a pickled result."""
+    result = cls._of(violations)
+    result.is_valid = is_valid
+    return result
+
+
+class _SyncedList(list):
+    """A list that reports changes made to it in place."""
+    
+    __slots__ = ("_on_change",)
+    
+    def __init__(self, items: Iterable[Any], on_change: Callable[[List[Any]], None]):
+        super().__init__(items)
+        self._on_change = on_change
+    
+    def __reduce__(self) -> Any:
+        return list, (list(self),)
+
+
+def _notifying(name: str) -> Callable[..., Any]:
+    method = getattr(list, name)
+    
+    def changed(self: _SyncedList, *args: Any) -> Any:
+        value = method(self, *args)
+        self._on_change(self)
+        return value
+    
+    changed.__name__ = name
+    return changed
+
+
+for _name in (
+    "append", "extend", "insert", "remove", "pop", "clear", "sort", "reverse",
+    "__setitem__", "__delitem__", "__iadd__", "__imul__",
+):
+    setattr(_SyncedList, _name, _notifying(_name))
+del _name
+
+
+def _match_violations(
+    errors: List[str],
+    previous: Optional[List[Violation]]
+) -> List[Violation]:
+    """Rebuild violations for messages, reusing earlier ones with the same message."""
+    by_message: Dict[str, List[Violation]] = {}
+    for violation in reversed(previous or []):
+        by_message.setdefault(violation.message, []).append(violation)
+    
+    violations = []
+    for error in errors:
+        matches = by_message.get(error)
+        violations.append(matches.pop() if matches else Violation.from_message(error))
+    return violations
+
+
+def _as_violations(errors: Sequence[Union[str, Violation]]) -> List[Violation]:
+    """Return errors as violations, wrapping any plain messages."""
+    return [
+        error if isinstance(error, Violation) else Violation.from_message(error)
+        for error in errors
+    ]
+
+
+class Contract:
+    """
+    A schema loaded, expanded and compiled once for repeated validation.
+
+    Loading a schema means reading the YAML file, expanding every rule
+    bundle and resolving include paths. A ``Contract`` does that work a
+    single time so that each call to :meth:`validate` only pays for
+    checking the output itself.
+
+    Contracts are immutable; compile a new one if the schema changes.
+
+    Example:
+        >>> contract = Contract.compile('schema.yaml')
+        >>> for output in outputs:
+        ...     result = contract.validate(output)
+    """
+
+    __slots__ = (
+        "_schema",
+        "_source",
+        "_json_schema",
+        "_rule_plan",
+        "_stream_rules",
+        "_strict",
+        "_all_errors",
+        "_fail_fast",
+    )
+
+    def __init__(
+        self,
+        schema: Dict[str, Any],
+        source: Optional[str] = None,
+        *,
+        all_errors: Optional[bool] = None,
+        fail_fast: Optional[bool] = None
+    ):
+        """
+        Compile an already loaded schema dictionary.
+
+        Args:
+            schema: Schema dictionary as returned by ``load_schema``
+            source: Optional description of where the schema came from
+            all_errors: Report every JSON schema violation instead of the
+                most relevant one (defaults to the schema's ``all_errors``)
+            fail_fast: Stop at the first error of any kind (defaults to
+                the schema's ``fail_fast``)
+
+        Raises:
+            SchemaError: If the schema is not a dictionary
+            RuleError: If a rule is not a dictionary
+        """
+        if not isinstance(schema, dict):
+            raise SchemaError(
+                f"Schema must be a dictionary, got {type(schema).__name__}",
+                source
+            )
+
+        self._schema = copy.deepcopy(schema)
+        self._source = source
+        self._json_schema = (
+            _CompiledJSONSchema(self._schema["schema"])
+            if "schema" in self._schema else None
+        )
+        self._rule_plan = (
+            compile_rules(self._schema["rules"]) if "rules" in self._schema else None
+        )
+        # Compiled on first use by stream()
+        self._stream_rules: Optional["StreamRules"] = None
+        self._strict = bool(self._schema.get("strict", False))
+        self._all_errors = bool(
+            self._schema.get("all_errors", False) if all_errors is None else all_errors
+        )
+        self._fail_fast = bool(
+            self._schema.get("fail_fast", False) if fail_fast is None else fail_fast
+        )
+
+    @classmethod
+    def compile(
+        cls,
+        schema_path: Union[str, Path],
+        *,
+        all_errors: Optional[bool] = None,
+        fail_fast: Optional[bool] = None
+    ) -> "Contract":
+        """
+        Load a YAML schema file and compile it into a contract.
+
+        Compiled contracts are kept alongside the schema cache, so calling
+        this repeatedly for an unchanged file reuses the same compiled
+        schema and rules.
+
+        Args:
+            schema_path: Path to the YAML schema file
+            all_errors: Report every JSON schema violation by default
+            fail_fast: Stop at the first error by default
+
+        Returns:
+            Compiled Contract
+
+        Raises:
+            SchemaError: If the schema file cannot be loaded
+        """
+        entry = _schema_cache.get(schema_path)
+        contract = entry.compiled
+        if type(contract) is not cls:
+            contract = cls(entry.schema, str(schema_path))
+            entry.compiled = contract
+        return contract.with_options(all_errors=all_errors, fail_fast=fail_fast)
+
+    @classmethod
+    def from_schema(
+        cls,
+        schema: Union[str, Dict[str, Any]],
+        *,
+        base_dir: Optional[Union[str, Path]] = None,
+        bundles: Optional[Dict[str, Union[str, Dict[str, Any]]]] = None,
+        all_errors: Optional[bool] = None,
+        fail_fast: Optional[bool] = None
+    ) -> "Contract":
+        """
+        Compile a schema held in memory, without writing it to a file.
+
+        Unlike ``Contract(schema)``, rule bundle includes are expanded;
+        see ``parse_schema`` for how they are resolved. The result is not
+        cached, so keep the contract to validate many outputs.
+
+        Args:
+            schema: Schema dictionary, or the YAML text of a schema
+            base_dir: Directory that include paths are relative to
+            bundles: In-memory rule bundles keyed on include path
+            all_errors: Report every JSON schema violation by default
+            fail_fast: Stop at the first error by default
+
+        Returns:
+            Compiled Contract
+
+        Raises:
+            SchemaError: If the schema cannot be parsed or an include
+                cannot be resolved
+            RuleError: If a rule is not a dictionary
+        """
+        parsed = parse_schema(schema, base_dir=base_dir, bundles=bundles)
+        return cls(parsed, all_errors=all_errors, fail_fast=fail_fast)
+
+    def with_options(
+        self,
+        *,
+        all_errors: Optional[bool] = None,
+        fail_fast: Optional[bool] = None
+    ) -> "Contract":
+        """
+        Return a contract with different default error reporting.
+
+        The compiled schema and rules are shared, so this is cheap.
+
+        Args:
+            all_errors: New all_errors default, or None to keep the current one
+            fail_fast: New fail_fast default, or None to keep the current one
+
+        Returns:
+            This contract if nothing changes, otherwise a new Contract
+        """
+        all_errors = self._all_errors if all_errors is None else bool(all_errors)
+        fail_fast = self._fail_fast if fail_fast is None else bool(fail_fast)
+        if all_errors == self._all_errors and fail_fast == self._fail_fast:
+            return self
+
+        contract = copy.copy(self)
+        contract._all_errors = all_errors
+        contract._fail_fast = fail_fast
+        return contract
+
+    def __copy__(self) -> "Contract":
+        contract = self.__class__.__new__(self.__class__)
+        for name in Contract.__slots__:
+            setattr(contract, name, getattr(self, name))
+        return contract
+
+    @property
+    def schema(self) -> Dict[str, Any]:
+        """Return a copy of the expanded schema dictionary."""
+        return copy.deepcopy(self._schema)
+
+    @property
+    def source(self) -> Optional[str]:
+        """Return where the schema was loaded from, if known."""
+        return self._source
+
+    @property
+    def strict(self) -> bool:
+        """Return whether failed validations raise ValidationError."""
+        return self._strict
+
+    @property
+    def all_errors(self) -> bool:
+        """Return whether every JSON schema violation is reported by default."""
+        return self._all_errors
+
+    @property
+    def fail_fast(self) -> bool:
+        """Return whether validation stops at the first error by default."""
+        return self._fail_fast
+
+    def validate(
+        self,
+        output: Union[str, Dict[str, Any]],
+        *,
+        all_errors: Optional[bool] = None,
+        fail_fast: Optional[bool] = None
+    ) -> ValidationResult:
+        """
+        Validate LLM output against this contract.
+
+        Args:
+            output: The LLM output to validate (JSON string, dict, or text)
+            all_errors: Report every JSON schema violation, each with the
+                JSON pointer of the failing field (defaults to the contract's)
+            fail_fast: Stop at the first error, skipping remaining schema
+                and rule checks (defaults to the contract's)
+
+        Returns:
+            ValidationResult with validation status and any errors
+
+        Raises:
+            ValidationError: If validation fails and strict mode is enabled
+        """
+        result = self._evaluate(output, all_errors, fail_fast)
+
+        if self._strict and not result.is_valid:
+            raise _validation_failed(result)
+
+        return result
+
+    def validate_many(
+        self,
+        outputs: Iterable[Union[str, Dict[str, Any]]],
+        *,
+        all_errors: Optional[bool] = None,
+        fail_fast: Optional[bool] = None,
+        workers: Optional[int] = None,
+        executor: str = "process",
+        chunksize: int = 64
+    ) -> Iterator[ValidationResult]:
+        """
+        Validate many outputs against this contract, lazily and in order.
+
+        By default outputs are validated one after another in this process.
+        Rule evaluation is CPU-bound pure Python, so pass ``workers`` to
+        spread a large batch over several processes: the contract is sent
+        to each worker once and outputs are streamed to them in chunks,
+        with a bounded number of chunks in flight.
+
+        Args:
+            outputs: Iterable of LLM outputs (JSON strings, dicts, or text)
+            all_errors: Report every JSON schema violation (defaults to the
+                contract's)
+            fail_fast: Stop each validation at its first error (defaults to
+                the contract's)
+            workers: Number of parallel workers, or None to validate in
+                this process
+            executor: "process" or "thread" pool when workers is given
+            chunksize: Number of outputs sent to a worker at a time
+
+        Returns:
+            Iterator of ValidationResult, one per output, in input order.
+            When an output fails and strict mode is enabled, iterating
+            raises ValidationError.
+
+        Raises:
+            ValueError: If workers, executor or chunksize is invalid
+        """
+        if all_errors is None:
+            all_errors = self._all_errors
+        if fail_fast is None:
+            fail_fast = self._fail_fast
+
+        if workers is not None:
+            from .batch import validate_parallel
+            return validate_parallel(
+                self, outputs, workers, executor, chunksize, all_errors, fail_fast
+            )
+
+        evaluate = self._evaluate
+        return self._apply_strict(
+            evaluate(output, all_errors, fail_fast) for output in outputs
+        )
+
+    def stream(
+        self,
+        *,
+        all_errors: Optional[bool] = None,
+        fail_fast: Optional[bool] = None
+    ) -> "StreamValidator":
+        """
+        Start validating an output incrementally, as it is generated.
+
+        Rules that can fail on a partial output (prohibited keywords,
+        placeholder text, maximum word count and the required opening)
+        are checked as each chunk is fed in, and JSON output is checked
+        against the JSON schema as its values close, so a generation that
+        breaks the contract can be cancelled early.
+
+        Args:
+            all_errors: Passed to the final validation by ``finish()``
+            fail_fast: Passed to the final validation by ``finish()``
+
+        Returns:
+            StreamValidator with ``feed(chunk)`` and ``finish()`` methods
+
+        Example:
+            >>> stream = contract.stream()
+            >>> for chunk in llm_stream:
+            ...     if stream.feed(chunk):
+            ...         break
+            >>> result = stream.finish()
+        """
+        from .streaming import StreamRules, StreamValidator
+
+        if self._stream_rules is None:
+            self._stream_rules = StreamRules(
+                self._schema["rules"] if self._rule_plan is not None else [],
+                self._json_schema._validator if self._json_schema is not None else None
+            )
+        return StreamValidator(self, self._stream_rules, all_errors, fail_fast)
+
+    def _apply_strict(
+        self,
+        results: Iterable[ValidationResult]
+    ) -> Iterator[ValidationResult]:
+        """Pass results through, raising on the first failure in strict mode."""
+        strict = self._strict
+        for result in results:
+            if strict and not result.is_valid:
+                raise _validation_failed(result)
+            yield result
+
+    def _evaluate(
+        self,
+        output: Union[str, Dict[str, Any]],
+        all_errors: Optional[bool] = None,
+        fail_fast: Optional[bool] = None
+    ) -> ValidationResult:
+        """Validate output without applying strict mode."""
+        if all_errors is None:
+            all_errors = self._all_errors
+        if fail_fast is None:
+            fail_fast = self._fail_fast
+
+        parsed_output = _parse_output(output)
+
+        errors: List[Violation] = []
+
+        # Validate schema if present
+        if self._json_schema is not None:
+            errors.extend(self._json_schema.violations(
+                parsed_output, all_errors=all_errors, fail_fast=fail_fast
+            ))
+
+        # Validate rules if present
+        if self._rule_plan is not None and not (fail_fast and errors):
+            errors.extend(self._rule_plan.evaluate(parsed_output, fail_fast=fail_fast))
+
+        return ValidationResult._of(errors)
+
+    def __reduce__(self) -> Any:
+        # Compiled checks are closures and can't be pickled; ship the
+        # schema and recompile it on the other side (e.g. in a worker).
+        return (
+            _rebuild_contract,
+            (
+                self.__class__,
+                self._schema,
+                self._source,
+                self._all_errors,
+                self._fail_fast,
+            ),
+        )
+
+    def __repr__(self) -> str:
+        return f"Contract(source={self._source!r})"
+
+
+def _validation_failed(result: ValidationResult) -> ValidationError:
+    """Build the exception strict mode raises for a failed result."""
+    return ValidationError(
+        f"Validation failed with {len(result.violations)} errors",
+        result.errors,
+        result.violations
+    )
+
+
+def _rebuild_contract(
+    cls: Type[Contract],
+    schema: Dict[str, Any],
+    source: Optional[str],
+    all_errors: bool,
+    fail_fast: bool
+) -> Contract:
+    """Recompile a pickled contract."""
+    return cls(schema, source, all_errors=all_errors, fail_fast=fail_fast)
 
 
 def validate_output(
     output: Union[str, Dict[str, Any]], 
-    schema_path: Union[str, Path]
+    schema_path: Union[str, Path, Dict[str, Any], Contract],
+    *,
+    all_errors: Optional[bool] = None,
+    fail_fast: Optional[bool] = None
 ) -> ValidationResult:
     """
     Validate LLM output against a schema and rules.
     
+    Callers validating many outputs against the same schema should
+    compile it once with ``Contract.compile`` or ``Contract.from_schema``
+    instead.
+    
     Args:
         output: The LLM output to validate (JSON string, dict, or text)
-        schema_path: Path to the YAML schema file
+        schema_path: Path to the YAML schema file, a schema dictionary,
+            or a compiled Contract (compile YAML text with
+            ``Contract.from_schema``)
+        all_errors: Report every JSON schema violation instead of the
+            most relevant one
+        fail_fast: Stop at the first error of any kind
         
     Returns:
         ValidationResult with validation status and any errors
@@ -50,46 +634,161 @@ def validate_output(
         SchemaError: If schema file cannot be loaded
         RuleError: If rule validation fails
     """
+    contract = _resolve_contract(schema_path)
+    return contract.validate(output, all_errors=all_errors, fail_fast=fail_fast)
+
+
+def _resolve_contract(schema: Union[str, Path, Dict[str, Any], Contract]) -> Contract:
+    """
+    Return a compiled contract for any accepted form of schema.
+    
+    Dictionaries are in-memory schemas; strings are always file paths.
+    
+    Raises:
+        ValidationError: If the schema cannot be loaded or compiled
+    """
+    if isinstance(schema, Contract):
+        return schema
+    
     try:
-        # Load schema from file
-        schema = load_schema(schema_path)
-        
-        # Parse output if it's a string
-        if isinstance(output, str):
-            try:
-                parsed_output = json.loads(output)
-            except json.JSONDecodeError:
-                # Treat as plain text
-                parsed_output = output
-        else:
-            parsed_output = output
-        
-        errors: List[str] = []
-        
-        # Validate schema if present
-        if "schema" in schema:
-            schema_errors = _validate_schema(parsed_output, schema["schema"])
-            errors.extend(schema_errors)
+        if isinstance(schema, dict):
+            return Contract.from_schema(schema)
+        return Contract.compile(schema)
+    except (SchemaError, RuleError) as e:
+        raise ValidationError(f"Validation setup failed: {str(e)}")
+
+
+def _parse_output(output: Union[str, Dict[str, Any]]) -> Any:
+    """Parse output as JSON if it's a string, otherwise return it unchanged."""
+    if isinstance(output, str):
+        try:
+            return json.loads(output)
+        except json.JSONDecodeError:
+            # Treat as plain text
+            return output
+    return output
+
+
+class _CompiledJSONSchema:
+    """
+    A JSON schema checked against its metaschema once, with a reusable validator.
+    
+    Produces exactly the messages ``jsonschema.validate`` would, without
+    re-checking the schema and rebuilding a validator on every call.
+    """
+    
+    __slots__ = ("_validator", "_setup_error")
+    
+    def __init__(self, schema: Any):
+        # jsonschema validator instance, or None if the schema is invalid
+        self._validator: Any = None
+        self._setup_error: Optional[str] = None
         
-        # Validate rules if present
-        if "rules" in schema:
-            rule_errors = validate_rules(parsed_output, schema["rules"])
-            errors.extend(rule_errors)
+        _import_jsonschema()
+        try:
+            validator_class = validator_for(schema)
+            validator_class.check_schema(schema)
+            self._validator = validator_class(schema)
+        except Exception as e:
+            # Reported on every validation, as it was before compiling
+            self._setup_error = str(e)
+    
+    def errors(
+        self, 
+        data: Any, 
+        all_errors: bool = False, 
+        fail_fast: bool = False
+    ) -> List[str]:
+        """
+        Return schema validation error messages for data.
         
-        is_valid = len(errors) == 0
+        Args:
+            data: Data to validate
+            all_errors: Report every violation with its JSON pointer
+                instead of only the most relevant one
+            fail_fast: Report the first violation found without looking
+                for the most relevant one
+            
+        Returns:
+            List of validation error messages
+        """
+        return [
+            violation.message
+            for violation in self.violations(data, all_errors, fail_fast)
+        ]
+    
+    def violations(
+        self, 
+        data: Any, 
+        all_errors: bool = False, 
+        fail_fast: bool = False
+    ) -> List[Violation]:
+        """
+        Return schema violations for data; see ``errors`` for the options.
         
-        # Check if strict mode is enabled
-        strict = schema.get("strict", False)
-        if strict and not is_valid:
-            raise ValidationError(
-                f"Validation failed with {len(errors)} errors", 
-                errors
-            )
+        Every violation carries the path of the failing value, whether or
+        not its message shows it.
+        """
+        if self._setup_error is not None:
+            return [Violation("schema_setup", (self._setup_error,))]
         
-        return ValidationResult(is_valid, errors)
+        try:
+            if fail_fast:
+                error = next(self._validator.iter_errors(data), None)
+                return [_schema_violation(error, all_errors)] if error else []
+            if all_errors:
+                return [
+                    _schema_violation(error, True)
+                    for error in self._validator.iter_errors(data)
+                ]
+            error = best_match(self._validator.iter_errors(data))
+        except Exception as e:
+            return [Violation("schema_setup", (str(e),))]
         
-    except (SchemaError, RuleError) as e:
-        raise ValidationError(f"Validation setup failed: {str(e)}")
+        if error is not None:
+            return [_schema_violation(error, False)]
+        return []
+
+
+def _import_jsonschema() -> None:
+    global validator_for, best_match
+    if validator_for is None:
+        from jsonschema.validators import validator_for
+    if best_match is None:
+        from jsonschema.exceptions import best_match
+
+
+def _schema_violation(
+    error: "JSONSchemaValidationError", 
+    with_path: bool
+) -> Violation:
+    """Convert a jsonschema error, optionally showing its JSON pointer."""
+    path = tuple(error.absolute_path)
+    return Violation(
+        "schema",
+        (
+            error.message,
+            error.validator,
+            _json_pointer(path) if with_path else "",
+        ),
+        rule_type="schema",
+        path=path
+    )
+
+
+def _format_schema_error(
+    error: "JSONSchemaValidationError", 
+    with_path: bool
+) -> str:
+    """Format a jsonschema error, optionally with its JSON pointer."""
+    return _schema_violation(error, with_path).message
+
+
+def _json_pointer(path: Iterable[Union[str, int]]) -> str:
+    """Build an RFC 6901 JSON pointer from a sequence of keys and indexes."""
+    return "".join(
+        "/" + str(part).replace("~", "~0").replace("/", "~1") for part in path
+    )
 
 
 def _validate_schema(
@@ -106,13 +805,4 @@ def _validate_schema(
     Returns:
         List of validation error messages
     """
-    errors: List[str] = []
-    
-    try:
-        json_validate(instance=data, schema=schema)
-    except JSONSchemaValidationError as e:
-        errors.append(f"Schema validation failed: {e.message}")
-    except Exception as e:
-        errors.append(f"Unexpected validation error: {str(e)}")
-    
-    return errors 
\ No newline at end of file
+    return _CompiledJSONSchema(schema).errors(data)
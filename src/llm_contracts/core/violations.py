@@ -0,0 +1,234 @@
+"""Structured validation errors with lazily rendered messages."""
+
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+
+def _render_schema(message: str, keyword: Any, pointer: str) -> str:
+    if pointer:
+        return f"Schema validation failed at {pointer}: {message}"
+    return f"Schema validation failed: {message}"
+
+
+def _render_duplicate_sentences(count: int, examples: Tuple[str, ...]) -> str:
+    examples_text = ", ".join(f'"{example}..."' for example in examples)
+    return (
+        f"Duplicate sentences detected ({count} instances). "
+        f"Examples: {examples_text}. Please rephrase or remove duplicate content."
+    )
+
+
+# For each error code: the names of its arguments, and a function that
+# renders the message from them
+CODES: Dict[str, Tuple[Tuple[str, ...], Callable[..., str]]] = {
+    "schema": (("message", "keyword", "pointer"), _render_schema),
+    "schema_setup": (
+        ("error",),
+        lambda error: f"Unexpected validation error: {error}",
+    ),
+    "content_too_large": (
+        ("size", "maximum"),
+        lambda size, maximum: (
+            f"Content size ({size:,} bytes) exceeds maximum allowed ({maximum:,} bytes). "
+            f"Please reduce content size for processing."
+        ),
+    ),
+    "invalid_record": (
+        ("line", "error"),
+        lambda line, error: f"Line {line} is not valid JSON: {error}",
+    ),
+    "record_field_missing": (
+        ("line", "field"),
+        lambda line, field: f"Line {line} has no field '{field}'",
+    ),
+    "unknown_rule": (
+        ("rule_type",),
+        lambda rule_type: f"Unknown rule type: '{rule_type}'",
+    ),
+    "rule_error": (
+        ("rule_type", "error"),
+        lambda rule_type, error: f"Error applying rule '{rule_type}': {error}",
+    ),
+    "keyword_missing": (
+        ("keyword",),
+        lambda keyword: (
+            f"Missing required keyword: '{keyword}'. "
+            f"Please include this term in your content."
+        ),
+    ),
+    "keyword_prohibited": (
+        ("keyword",),
+        lambda keyword: (
+            f"Prohibited keyword found: '{keyword}'. "
+            f"Please remove or rephrase this content."
+        ),
+    ),
+    "placeholder_text": (
+        ("pattern",),
+        lambda pattern: f"Contains placeholder text: '{pattern}'",
+    ),
+    "word_count_below": (
+        ("count", "minimum"),
+        lambda count, minimum: f"Word count ({count}) below minimum ({minimum})",
+    ),
+    "word_count_above": (
+        ("count", "maximum"),
+        lambda count, maximum: f"Word count ({count}) above maximum ({maximum})",
+    ),
+    # Reported by a stream before the output is complete, when the final
+    # count is only known to be at least ``count``
+    "word_count_above_so_far": (
+        ("count", "maximum"),
+        lambda count, maximum: (
+            f"Word count (at least {count}) above maximum ({maximum})"
+        ),
+    ),
+    "proximity_missing_terms": (
+        ("terms",),
+        lambda terms: f"Missing terms: {terms}",
+    ),
+    "proximity_too_far": (
+        ("first", "second", "max_distance"),
+        lambda first, second, max_distance: (
+            f"Terms '{first}' and '{second}' must be within "
+            f"{max_distance} words of each other"
+        ),
+    ),
+    "phrase_missing": (
+        ("phrase",),
+        lambda phrase: f"Missing required phrase: '{phrase}'",
+    ),
+    "phrase_order": (
+        ("first", "then"),
+        lambda first, then: f"Phrase '{first}' must appear before '{then}'",
+    ),
+    "section_start": (
+        ("pattern",),
+        lambda pattern: f"Content must start with pattern: '{pattern}'",
+    ),
+    "list_item_pattern": (
+        ("line", "pattern"),
+        lambda line, pattern: (
+            f"Line {line} does not match list item pattern: '{pattern}'"
+        ),
+    ),
+    "regex_mismatch": (
+        ("pattern",),
+        lambda pattern: f"Content must match regex pattern: '{pattern}'",
+    ),
+    "duplicate_sentences": (("count", "examples"), _render_duplicate_sentences),
+    "min_list_items": (
+        ("minimum", "count"),
+        lambda minimum, count: (
+            f"Must have at least {minimum} list items, found {count}. "
+            f"Please add more bullet points or numbered items."
+        ),
+    ),
+    "passive_voice_ratio": (
+        ("ratio", "maximum"),
+        lambda ratio, maximum: (
+            f"Passive voice ratio ({ratio:.2f}) exceeds maximum ({maximum})"
+        ),
+    ),
+    "custom": (("message",), str),
+}
+
+
+class Violation:
+    """
+    One reason an output failed validation.
+
+    Violations are cheap to create and store: the values describing the
+    failure are kept as a tuple, and the human-readable message is only
+    built when ``message`` (or ``str()``) is first used, so code that
+    aggregates results by ``code``, ``rule_type`` or ``path`` never pays
+    for formatting English text.
+
+    Attributes:
+        code: Stable identifier of the kind of failure, e.g.
+            ``"keyword_prohibited"`` or ``"schema"``; see ``CODES``
+        args: Values describing the failure, in the order ``CODES``
+            names them (``params`` has them by name)
+        span: (start, end) character offsets of the offending text in
+            the checked text, when known
+        rule_index: Index of the rule in the schema's ``rules`` list, or
+            None for JSON schema and setup errors
+        rule_type: Rule type such as ``"word_count_max"``, ``"schema"``
+            for JSON schema violations, or None
+        path: Location of the failing value: keys and indexes into the
+            output for schema violations, the field the rules read for
+            rule violations
+    """
+
+    __slots__ = ("code", "args", "span", "rule_index", "rule_type", "path", "_message")
+
+    def __init__(
+        self,
+        code: str,
+        args: Tuple[Any, ...] = (),
+        span: Optional[Tuple[int, int]] = None,
+        *,
+        rule_index: Optional[int] = None,
+        rule_type: Optional[str] = None,
+        path: Tuple[Union[str, int], ...] = (),
+        message: Optional[str] = None
+    ):
+        self.code = code
+        self.args = args
+        self.span = span
+        self.rule_index = rule_index
+        self.rule_type = rule_type
+        self.path = path
+        self._message = message
+
+    @classmethod
+    def from_message(cls, message: str) -> "Violation":
+        """Wrap a plain error message."""
+        return cls("custom", (message,), message=message)
+
+    @property
+    def params(self) -> Dict[str, Any]:
+        """Return the values describing the failure, by name."""
+        names, _ = CODES[self.code]
+        return dict(zip(names, self.args))
+
+    @property
+    def message(self) -> str:
+        """Return the human-readable message, rendering it on first use."""
+        if self._message is None:
+            _, render = CODES[self.code]
+            self._message = render(*self.args)
+        return self._message
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the violation as a JSON-serializable dictionary."""
+        return {
+            "code": self.code,
+            "message": self.message,
+            "rule_index": self.rule_index,
+            "rule_type": self.rule_type,
+            "path": list(self.path),
+            "span": list(self.span) if self.span is not None else None,
+        }
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __repr__(self) -> str:
+        return (
+            f"Violation(code={self.code!r}, rule_index={self.rule_index!r}, "
+            f"path={self.path!r})"
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Violation):
+            return NotImplemented
+        return (
+            self.code == other.code
+            and self.args == other.args
+            and self.span == other.span
+            and self.rule_index == other.rule_index
+            and self.rule_type == other.rule_type
+            and self.path == other.path
+        )
+
+    __hash__ = None  # type: ignore[assignment]
@@ -1,5 +1,24 @@
 """HTML report generation for llm-contracts."""
 
-from .html_generator import generate_html_report
+from typing import TYPE_CHECKING
 
-__all__ = ["generate_html_report"] 
\ No newline at end of file
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .html_generator import generate_html_report
+    from .summary import ValidationSummary, generate_summary_report, summarize
+
+__all__ = [
+    "generate_html_report",
+    "ValidationSummary",
+    "generate_summary_report",
+    "summarize",
+]
+
+# Imported on first access; see llm_contracts/__init__.py
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "generate_html_report": ".html_generator",
+    "ValidationSummary": ".summary",
+    "generate_summary_report": ".summary",
+    "summarize": ".summary",
+})
@@ -1,61 +1,314 @@
 """HTML report generator for validation results."""
 
+import io
+import itertools
 import json
 import yaml
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import IO, Any, Dict, Iterable, List, Optional, Tuple, Union
 
-from ..core.validator import ValidationResult
+from ..core.schema import load_schema, parse_schema
+from ..core.validator import Contract, ValidationResult
+from ..core.violations import Violation
 
 
 def generate_html_report(
-    results: Union[ValidationResult, List[ValidationResult]], 
-    output_file: str,
-    schema_path: Optional[str] = None
+    results: Union[ValidationResult, Iterable[ValidationResult]], 
+    output_file: Union[str, Path, IO[bytes]],
+    schema_path: Optional[Union[str, Path, Dict[str, Any], Contract]] = None,
+    page_size: Optional[int] = None
 ) -> None:
     """
     Generate an HTML report for validation results.
     
+    Results are written to the file as they are consumed, so an iterator
+    of any length is reported in constant memory. The summary at the top
+    is filled in once the last result has been written.
+    
+    With ``page_size``, results are split across pages of that many
+    results, written next to ``output_file`` as ``<name>-1.html``,
+    ``<name>-2.html`` and so on, and ``output_file`` becomes an index page
+    with the totals, failure counts per rule type and links to every page.
+    
     Args:
-        results: Single ValidationResult or list of ValidationResult objects
-        output_file: Path to output HTML file
-        schema_path: Optional path to schema file for highlighting
+        results: Single ValidationResult, or an iterable of them
+        output_file: Path to output HTML file, or a seekable binary file
+            object (e.g. ``io.BytesIO``) to write the report to
+        schema_path: Optional schema for highlighting: a path to the
+            schema file, a schema dictionary, or a Contract
+        page_size: Optional number of results per page
+        
+    Raises:
+        ValueError: If page_size is less than 1, or is given together
+            with a file object
     """
+    if page_size is not None and page_size < 1:
+        raise ValueError(f"page_size must be at least 1, got {page_size}")
+    
+    to_file_object = not isinstance(output_file, (str, Path))
+    if page_size is not None and to_file_object:
+        raise ValueError("page_size needs an output path to write pages next to")
+    
     if isinstance(results, ValidationResult):
         results = [results]
     
-    html_content = _generate_html_content(results, schema_path)
+    schema_content = _load_schema_content(schema_path)
+    
+    if not isinstance(output_file, (str, Path)):
+        _write_html_report(results, output_file, schema_content)
+        return
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    if page_size is not None:
+        _write_paged_report(results, Path(output_file), schema_content, page_size)
+        return
+    
+    with open(output_file, 'wb') as f:
+        _write_html_report(results, f, schema_content)
 
 
 def _generate_html_content(
-    results: List[ValidationResult], 
-    schema_path: Optional[str] = None
+    results: Iterable[ValidationResult], 
+    schema_path: Optional[Union[str, Path, Dict[str, Any], Contract]] = None
 ) -> str:
     """Generate the complete HTML content."""
-    
-    # Load schema content if provided
-    schema_content = None
+    buffer = io.BytesIO()
+    _write_html_report(results, buffer, _load_schema_content(schema_path))
+    return buffer.getvalue().decode('utf-8')
+
+
+def _load_schema_content(
+    schema_path: Optional[Union[str, Path, Dict[str, Any], Contract]]
+) -> Optional[Dict[str, Any]]:
+    """Load the schema to reference in a report, if there is one."""
+    # Bundles are expanded so rule indexes line up with the ones recorded
+    # during validation
+    if isinstance(schema_path, Contract):
+        return schema_path.schema
+    if isinstance(schema_path, dict):
+        return parse_schema(schema_path)
     if schema_path and Path(schema_path).exists():
-        with open(schema_path, 'r') as f:
-            schema_content = yaml.safe_load(f)
+        return load_schema(schema_path)
+    return None
+
+
+def _write_html_report(
+    results: Iterable[ValidationResult], 
+    f: IO[bytes], 
+    schema_content: Optional[Dict[str, Any]] = None
+) -> None:
+    """Stream a single-page report to a seekable binary file."""
+    sections = _SchemaSections(schema_content) if schema_content else None
+    
+    header_offset = _start_page(f)
+    total_tests, passed_tests = _write_test_results(f, results, 0, sections)
+    _finish_page(f, header_offset, total_tests, passed_tests)
+
+
+def _start_page(f: IO[bytes]) -> int:
+    """
+    Write the start of a page, returning where its header goes.
+    
+    The header is written as a fixed-size placeholder; once every result
+    has been written and the totals are known, ``_finish_page`` overwrites
+    it in place.
+    """
+    f.write(_generate_page_start().encode('utf-8'))
+    header_offset = f.tell()
+    f.write(b' ' * _HEADER_SIZE)
+    return header_offset
+
+
+def _write_test_results(
+    f: IO[bytes], 
+    results: Iterable[ValidationResult], 
+    first_index: int, 
+    sections: Optional["_SchemaSections"] = None,
+    rule_failures: Optional[Dict[str, List[int]]] = None
+) -> Tuple[int, int]:
+    """
+    Write the section of every result, returning (total, passed).
+    
+    If ``rule_failures`` is given, it is updated with ``[violations,
+    failed results]`` counts for each rule type.
+    """
+    f.write(b'<div class="test-results">')
+    
+    total_tests = passed_tests = 0
+    for result in results:
+        f.write(_generate_test_result(
+            first_index + total_tests, result, sections
+        ).encode('utf-8'))
+        total_tests += 1
+        if result.is_valid:
+            passed_tests += 1
+        elif rule_failures is not None:
+            _count_rule_failures(result, rule_failures)
+    
+    f.write(b'</div>')
+    return total_tests, passed_tests
+
+
+def _finish_page(
+    f: IO[bytes], 
+    header_offset: int, 
+    total_tests: int, 
+    passed_tests: int, 
+    navigation: str = ""
+) -> None:
+    """Write the end of a page and fill in its header."""
+    f.write(navigation.encode('utf-8'))
+    f.write(_generate_page_end().encode('utf-8'))
+    
+    failed_tests = total_tests - passed_tests
+    success_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
+    header = _generate_header(
+        total_tests, passed_tests, failed_tests, success_rate
+    ).encode('utf-8')
+    
+    end_offset = f.tell()
+    f.seek(header_offset)
+    f.write(header.ljust(_HEADER_SIZE))
+    f.seek(end_offset)
+
+
+def _count_rule_failures(
+    result: ValidationResult, 
+    rule_failures: Dict[str, List[int]]
+) -> None:
+    """Add a failed result's violations to the per-rule-type counts."""
+    seen = set()
+    for violation in result.violations:
+        rule_type = violation.rule_type or violation.code
+        counts = rule_failures.get(rule_type)
+        if counts is None:
+            counts = rule_failures[rule_type] = [0, 0]
+        counts[0] += 1
+        if rule_type not in seen:
+            seen.add(rule_type)
+            counts[1] += 1
+
+
+def _write_paged_report(
+    results: Iterable[ValidationResult], 
+    index_path: Path, 
+    schema_content: Optional[Dict[str, Any]], 
+    page_size: int
+) -> None:
+    """
+    Write results across pages of ``page_size``, then the index page.
+    
+    Results are consumed once. Each page is finished as soon as it is
+    full, after checking whether another result follows so its navigation
+    knows whether there is a next page.
+    """
+    sections = _SchemaSections(schema_content) if schema_content else None
+    rule_failures: Dict[str, List[int]] = {}
+    pages: List[Tuple[str, int, int]] = []
     
-    # Calculate summary
-    total_tests = len(results)
-    passed_tests = sum(1 for r in results if r.is_valid)
+    iterator = iter(results)
+    # Results are never None, so it marks the end
+    pending: Optional[ValidationResult] = next(iterator, None)
+    first_index = 0
+    while pending is not None or not pages:
+        number = len(pages) + 1
+        page_name = _page_name(index_path, number)
+        page_results: Iterable[ValidationResult] = (
+            itertools.chain([pending], itertools.islice(iterator, page_size - 1))
+            if pending is not None else ()
+        )
+        
+        with open(index_path.with_name(page_name), 'wb') as f:
+            header_offset = _start_page(f)
+            total_tests, passed_tests = _write_test_results(
+                f, page_results, first_index, sections, rule_failures
+            )
+            pending = next(iterator, None)
+            _finish_page(
+                f, header_offset, total_tests, passed_tests,
+                _generate_page_navigation(
+                    index_path, number, has_next=pending is not None
+                )
+            )
+        
+        pages.append((page_name, total_tests, passed_tests))
+        first_index += total_tests
+    
+    with open(index_path, 'w', encoding='utf-8') as f:
+        f.write(_generate_index_page(pages, rule_failures, page_size))
+
+
+def _page_name(index_path: Path, number: int) -> str:
+    """Return the file name of a page of a paged report."""
+    return f"{index_path.stem}-{number}{index_path.suffix or '.html'}"
+
+
+def _generate_page_navigation(index_path: Path, number: int, has_next: bool) -> str:
+    """Generate the links between the pages of a paged report."""
+    links = []
+    if number > 1:
+        links.append(f'<a href="{_page_name(index_path, number - 1)}">← Previous</a>')
+    links.append(f'<a href="{index_path.name}">Index</a>')
+    if has_next:
+        links.append(f'<a href="{_page_name(index_path, number + 1)}">Next →</a>')
+    return f'<nav class="pagination">{" | ".join(links)}</nav>'
+
+
+def _generate_index_page(
+    pages: List[Tuple[str, int, int]], 
+    rule_failures: Dict[str, List[int]], 
+    page_size: int
+) -> str:
+    """Generate the index page of a paged report."""
+    total_tests = sum(total for _, total, _ in pages)
+    passed_tests = sum(passed for _, _, passed in pages)
     failed_tests = total_tests - passed_tests
     success_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
     
-    # Generate CSS
-    css = _generate_css()
+    rule_rows = [
+        f"<tr><td>{rule_type}</td><td>{violations}</td><td>{failed}</td></tr>"
+        for rule_type, (violations, failed) in sorted(
+            rule_failures.items(), key=lambda item: -item[1][1]
+        )
+    ]
+    if not rule_rows:
+        rule_rows.append('<tr><td colspan="3">No failures</td></tr>')
     
-    # Generate report sections
-    header = _generate_header(total_tests, passed_tests, failed_tests, success_rate)
-    test_results = _generate_test_results(results, schema_content)
+    page_rows = []
+    first = 1
+    for page_name, total, passed in pages:
+        tests = f"{first}–{first + total - 1}" if total else "–"
+        page_rows.append(
+            f'<tr><td><a href="{page_name}">{page_name}</a></td>'
+            f'<td>{tests}</td><td>{passed}</td><td>{total - passed}</td></tr>'
+        )
+        first += total
     
+    return (
+        _generate_page_start()
+        + _generate_header(total_tests, passed_tests, failed_tests, success_rate)
+        + f"""
+        <div class="test-item">
+            <h3>Failures by Rule</h3>
+            <table class="index-table">
+                <thead><tr><th>Rule</th><th>Violations</th><th>Failed Tests</th></tr></thead>
+                <tbody>{''.join(rule_rows)}</tbody>
+            </table>
+        </div>
+        <div class="test-item">
+            <h3>Pages ({page_size} results each)</h3>
+            <table class="index-table">
+                <thead><tr><th>Page</th><th>Tests</th><th>Passed</th><th>Failed</th></tr></thead>
+                <tbody>{''.join(page_rows)}</tbody>
+            </table>
+        </div>
+        """
+        + _generate_page_end()
+    )
+
+
+def _generate_page_start() -> str:
+    """Generate the document up to the report header."""
     return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -63,13 +316,17 @@ def _generate_html_content(
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>llm-contracts Validation Report</title>
     <style>
-        {css}
+        {_generate_css()}
     </style>
 </head>
 <body>
     <div class="container">
-        {header}
-        {test_results}
+        """
+
+
+def _generate_page_end() -> str:
+    """Generate the document after the test results."""
+    return """
     </div>
 </body>
 </html>"""
@@ -204,6 +461,24 @@ def _generate_css() -> str:
             margin-top: 1rem;
         }
         
+        .pagination {
+            margin-top: 2rem;
+            text-align: center;
+        }
+        
+        .index-table {
+            width: 100%;
+            border-collapse: collapse;
+            margin-top: 1rem;
+        }
+        
+        .index-table th,
+        .index-table td {
+            text-align: left;
+            padding: 0.5rem;
+            border-bottom: 1px solid #e5e7eb;
+        }
+        
         @media (max-width: 768px) {
             .container {
                 padding: 1rem;
@@ -248,36 +523,39 @@ def _generate_header(
     """
 
 
-def _generate_test_results(
-    results: List[ValidationResult], 
-    schema_content: Optional[Dict[str, Any]] = None
+# Bytes reserved for the header, which is written last: enough for the
+# largest counts a report can hold
+_HEADER_SIZE = len(_generate_header(
+    10 ** 15, 10 ** 15, 10 ** 15, 100.0
+).encode('utf-8'))
+
+
+def _generate_test_result(
+    index: int, 
+    result: ValidationResult, 
+    sections: Optional["_SchemaSections"] = None
 ) -> str:
-    """Generate the test results section."""
-    html_parts = ['<div class="test-results">']
+    """Generate the section for one result."""
+    status_class = "pass" if result.is_valid else "fail"
+    status_icon = "✅" if result.is_valid else "❌"
     
-    for i, result in enumerate(results):
-        status_class = "pass" if result.is_valid else "fail"
-        status_icon = "✅" if result.is_valid else "❌"
-        
-        html_parts.append(f'''
+    html_parts = [f'''
             <div class="test-item {status_class}">
-                <h3>{status_icon} Test {i + 1}</h3>
-        ''')
-        
-        if result.is_valid:
-            html_parts.append('<p>All validations passed successfully.</p>')
-        else:
-            html_parts.append('<div class="errors">')
-            for error in result.errors:
-                html_parts.append(f'''
+                <h3>{status_icon} Test {index + 1}</h3>
+        ''']
+    
+    if result.is_valid:
+        html_parts.append('<p>All validations passed successfully.</p>')
+    else:
+        html_parts.append('<div class="errors">')
+        for violation in result.violations:
+            html_parts.append(f'''
                     <div class="error-detail">
                         <h4>Validation Error</h4>
-                        <p>{error}</p>
-                        {_generate_schema_reference(error, schema_content)}
+                        <p>{violation.message}</p>
+                        {_generate_schema_reference(violation, sections)}
                     </div>
                 ''')
-            html_parts.append('</div>')
-        
         html_parts.append('</div>')
     
     html_parts.append('</div>')
@@ -285,15 +563,14 @@ def _generate_test_results(
 
 
 def _generate_schema_reference(
-    error: str, 
-    schema_content: Optional[Dict[str, Any]] = None
+    error: Union[str, Violation], 
+    sections: Optional["_SchemaSections"] = None
 ) -> str:
     """Generate schema reference for an error."""
-    if not schema_content:
+    if sections is None:
         return ""
     
-    # Try to find relevant schema section based on error message
-    relevant_section = _find_relevant_schema_section(error, schema_content)
+    relevant_section = sections.find(error)
     
     if relevant_section:
         return f'''
@@ -306,8 +583,75 @@ def _generate_schema_reference(
     return ""
 
 
+class _SchemaSections:
+    """
+    Schema sections for report errors, rendered once each.
+    
+    Violations record the rule or field they came from, so their section
+    is found by index instead of by searching the schema for words from
+    the message.
+    """
+    
+    __slots__ = ("_schema_content", "_rules", "_properties", "_rendered")
+    
+    def __init__(self, schema_content: Dict[str, Any]):
+        self._schema_content = schema_content
+        rules = schema_content.get("rules")
+        self._rules = rules if isinstance(rules, list) else []
+        schema = schema_content.get("schema")
+        properties = schema.get("properties") if isinstance(schema, dict) else None
+        self._properties = properties if isinstance(properties, dict) else {}
+        self._rendered: Dict[Tuple[Any, ...], Optional[str]] = {}
+    
+    def find(self, error: Union[str, Violation]) -> Optional[str]:
+        """Return the schema section an error refers to, as YAML."""
+        if isinstance(error, str) or error.code == "custom":
+            # Plain messages carry no rule identity; fall back to their wording
+            message = error if isinstance(error, str) else error.message
+            return _find_relevant_schema_section(message, self._schema_content)
+        
+        if error.rule_index is not None:
+            return self._rule_section(error.rule_index, error.rule_type)
+        
+        if error.code == "schema":
+            if error.path:
+                return self._property_section(error.path[0])
+            # Failures at the root (e.g. a missing required property) only
+            # name the field in their message
+            message = error.message.lower()
+            for key in self._properties:
+                if key in message:
+                    return self._property_section(key)
+        
+        return None
+    
+    def _rule_section(self, rule_index: int, rule_type: Optional[str]) -> Optional[str]:
+        key = ("rule", rule_index, rule_type)
+        if key not in self._rendered:
+            section = None
+            if 0 <= rule_index < len(self._rules):
+                rule = self._rules[rule_index]
+                if isinstance(rule, dict) and rule_type in rule:
+                    section = yaml.dump(
+                        {rule_type: rule[rule_type]}, default_flow_style=False
+                    )
+            self._rendered[key] = section
+        return self._rendered[key]
+    
+    def _property_section(self, name: Union[str, int]) -> Optional[str]:
+        key = ("property", name)
+        if key not in self._rendered:
+            section = None
+            if name in self._properties:
+                section = yaml.dump(
+                    {name: self._properties[name]}, default_flow_style=False
+                )
+            self._rendered[key] = section
+        return self._rendered[key]
+
+
 def _find_relevant_schema_section(error: str, schema_content: Dict[str, Any]) -> Optional[str]:
-    """Find the relevant schema section for an error."""
+    """Find the relevant schema section for an error message."""
     error_lower = error.lower()
     
     # Handle schema validation errors
@@ -2,15 +2,35 @@
 
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Dict, List, Optional, Sequence, Union
 
-from ..core.validator import ValidationResult
+from ..core.validator import Contract, ValidationResult
+from ..core.violations import Violation
+
+# Report section for the violations of each rule type
+_RULE_GROUPS = {
+    "schema": "Schema Validation",
+    "keyword_must_include": "Keyword Rules",
+    "keyword_must_not_include": "Keyword Rules",
+    "no_placeholder_text": "Content Rules",
+    "word_count_min": "Content Rules",
+    "word_count_max": "Content Rules",
+    "phrase_proximity": "Content Rules",
+    "phrase_order": "Content Rules",
+    "section_must_start_with": "Content Rules",
+    "list_item_pattern": "Content Rules",
+    "min_list_items": "Content Rules",
+    "no_duplicate_sentences": "Content Rules",
+    # The wording of these messages never placed them in a named group
+    "regex_must_match": "Other",
+    "max_passive_voice_ratio": "Other",
+}
 
 
 def generate_markdown_report(
     result: ValidationResult,
-    output_path: str,
-    schema_path: str,
+    output_path: Union[str, Path, IO[str]],
+    schema_path: Union[str, Path, Dict[str, Any], Contract],
     schema_content: Optional[Dict[str, Any]] = None
 ) -> None:
     """
@@ -18,19 +38,30 @@ def generate_markdown_report(
     
     Args:
         result: Validation result from validate_output
-        output_path: Path for the Markdown output file
-        schema_path: Path to the schema file for reference
-        schema_content: Optional schema content for rule references
+        output_path: Path for the Markdown output file, or a text file
+            object (e.g. ``io.StringIO``) to write the report to
+        schema_path: Path to the schema file for reference, or the
+            in-memory schema (dictionary or Contract)
+        schema_content: Optional schema content for rule references;
+            taken from ``schema_path`` when that is an in-memory schema
     """
+    if schema_content is None and isinstance(schema_path, (Contract, dict)):
+        from .html_generator import _load_schema_content
+        schema_content = _load_schema_content(schema_path)
+    
     markdown_content = _generate_markdown_content(result, schema_path, schema_content)
     
+    if hasattr(output_path, "write"):
+        output_path.write(markdown_content)
+        return
+    
     with open(output_path, 'w', encoding='utf-8') as f:
         f.write(markdown_content)
 
 
 def _generate_markdown_content(
     result: ValidationResult,
-    schema_path: str,
+    schema_path: Union[str, Path, Dict[str, Any], Contract],
     schema_content: Optional[Dict[str, Any]] = None
 ) -> str:
     """Generate the Markdown content for the report."""
@@ -40,7 +71,7 @@ def _generate_markdown_content(
         "# llm-contracts Validation Report",
         "",
         f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        f"**Schema**: `{schema_path}`",
+        f"**Schema**: {_schema_label(schema_path)}",
         "",
     ]
     
@@ -79,7 +110,7 @@ def _generate_markdown_content(
         ])
         
         # Group errors by type
-        error_groups = _group_errors_by_type(result.errors)
+        error_groups = _group_errors_by_type(result.violations)
         
         for error_type, errors in error_groups.items():
             content.append(f"#### {error_type}")
@@ -110,9 +141,19 @@ def _generate_markdown_content(
     return "\n".join(content)
 
 
-def _group_errors_by_type(errors: List[str]) -> Dict[str, List[str]]:
-    """Group errors by their type for better organization."""
-    groups = {
+def _schema_label(schema_path: Union[str, Path, Dict[str, Any], Contract]) -> str:
+    """Describe where the schema came from for the report header."""
+    source = schema_path.source if isinstance(schema_path, Contract) else schema_path
+    if source is None or isinstance(source, dict):
+        return "in-memory schema"
+    return f"`{source}`"
+
+
+def _group_errors_by_type(
+    errors: Sequence[Union[str, Violation]]
+) -> Dict[str, List[str]]:
+    """Group error messages by their type for better organization."""
+    groups: Dict[str, List[str]] = {
         "Schema Validation": [],
         "Keyword Rules": [],
         "Content Rules": [],
@@ -120,6 +161,14 @@ def _group_errors_by_type(errors: List[str]) -> Dict[str, List[str]]:
     }
     
     for error in errors:
+        if isinstance(error, Violation):
+            if error.rule_type is not None:
+                group = _RULE_GROUPS.get(error.rule_type, "Other")
+                groups[group].append(error.message)
+                continue
+            error = error.message
+        
+        # Plain messages carry no rule identity; classify them by wording
         error_lower = error.lower()
         
         if "schema validation failed" in error_lower:
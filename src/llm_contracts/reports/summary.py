@@ -0,0 +1,375 @@
+"""Aggregate statistics over many validation results."""
+
+import html
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from ..core.validator import ValidationResult, _json_pointer
+from ..core.violations import Violation
+from .html_generator import (
+    _generate_header,
+    _generate_page_end,
+    _generate_page_start,
+)
+
+
+class FailureStats:
+    """
+    Failure counts for one rule or one field.
+
+    Attributes:
+        name: Rule or field the counts are for
+        failed: Number of results with at least one violation here
+        violations: Total number of violations here
+        codes: Number of violations of each error code; JSON schema
+            violations are split by keyword, e.g. ``schema:required``
+    """
+
+    __slots__ = ("name", "failed", "violations", "codes", "_examples")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.failed = 0
+        self.violations = 0
+        self.codes: Dict[str, int] = {}
+        self._examples: Dict[str, Violation] = {}
+
+    def _add(self, violation: Violation) -> None:
+        self.violations += 1
+        code = violation.code
+        if code == "schema":
+            code = f"schema:{violation.args[1]}"
+        if code in self.codes:
+            self.codes[code] += 1
+        else:
+            self.codes[code] = 1
+            self._examples[code] = violation
+
+    def example(self, code: str) -> Optional[str]:
+        """Return the message of the first violation seen with a code."""
+        violation = self._examples.get(code)
+        return violation.message if violation is not None else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the counts as a JSON-serializable dictionary."""
+        return {
+            "name": self.name,
+            "failed": self.failed,
+            "violations": self.violations,
+            "codes": dict(self.codes),
+        }
+
+
+class ValidationSummary:
+    """
+    Aggregate statistics over a stream of validation results.
+
+    Results are folded in one at a time with ``add`` and then discarded,
+    so memory grows with the number of rules and fields in the schema,
+    not with the number of results. Rule violations are counted per rule
+    (``rules[<index>].<rule type>``), JSON schema violations under
+    ``schema``, and both per field as a JSON pointer with array indexes
+    collapsed to ``*`` (``(output)`` for the output as a whole).
+
+    Example:
+        >>> summary = summarize(contract.validate_many(outputs))
+        >>> summary.rules["rules[0].keyword_must_include"].failed
+        1234
+    """
+
+    __slots__ = ("total", "passed", "rules", "fields", "co_failures")
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.passed = 0
+        self.rules: Dict[str, FailureStats] = {}
+        self.fields: Dict[str, FailureStats] = {}
+        self.co_failures: Dict[Tuple[str, str], int] = {}
+
+    @property
+    def failed(self) -> int:
+        """Return the number of results that failed."""
+        return self.total - self.passed
+
+    @property
+    def pass_rate(self) -> float:
+        """Return the fraction of results that passed (0.0 if there are none)."""
+        return self.passed / self.total if self.total else 0.0
+
+    def add(self, result: ValidationResult) -> None:
+        """Fold one result into the statistics."""
+        self.total += 1
+        if result.is_valid:
+            self.passed += 1
+            return
+
+        failed_rules = set()
+        failed_fields = set()
+        for violation in result.violations:
+            rule = _rule_name(violation)
+            field = _field_name(violation.path)
+            _stats(self.rules, rule)._add(violation)
+            _stats(self.fields, field)._add(violation)
+            failed_rules.add(rule)
+            failed_fields.add(field)
+
+        for rule in failed_rules:
+            self.rules[rule].failed += 1
+        for field in failed_fields:
+            self.fields[field].failed += 1
+
+        if len(failed_rules) > 1:
+            ordered = sorted(failed_rules)
+            for i, first in enumerate(ordered):
+                for second in ordered[i + 1:]:
+                    pair = (first, second)
+                    self.co_failures[pair] = self.co_failures.get(pair, 0) + 1
+
+    def failure_rate(self, rule: str) -> float:
+        """Return the fraction of results that failed a rule."""
+        stats = self.rules.get(rule)
+        if stats is None or not self.total:
+            return 0.0
+        return stats.failed / self.total
+
+    def top_failures(self, n: int = 10) -> List[Tuple[str, str, int, Optional[str]]]:
+        """
+        Return the most frequent kinds of failure.
+
+        Args:
+            n: Maximum number of entries
+
+        Returns:
+            (rule, code, count, example message or None) tuples, most
+            frequent first
+        """
+        entries = [
+            (stats.name, code, count)
+            for stats in self.rules.values()
+            for code, count in stats.codes.items()
+        ]
+        entries.sort(key=lambda entry: -entry[2])
+        return [
+            (rule, code, count, self.rules[rule].example(code))
+            for rule, code, count in entries[:n]
+        ]
+
+    def co_failure_matrix(self) -> Tuple[List[str], List[List[int]]]:
+        """
+        Return how often each pair of rules failed on the same result.
+
+        Returns:
+            (rules, matrix): rule names, and a symmetric matrix whose
+            diagonal holds each rule's own failure count
+        """
+        names = sorted(self.rules)
+        position = {name: i for i, name in enumerate(names)}
+        matrix = [[0] * len(names) for _ in names]
+        for name, stats in self.rules.items():
+            matrix[position[name]][position[name]] = stats.failed
+        for (first, second), count in self.co_failures.items():
+            matrix[position[first]][position[second]] = count
+            matrix[position[second]][position[first]] = count
+        return names, matrix
+
+    def to_dict(self, top: int = 10) -> Dict[str, Any]:
+        """Return the statistics as a JSON-serializable dictionary."""
+        return {
+            "total": self.total,
+            "passed": self.passed,
+            "failed": self.failed,
+            "pass_rate": self.pass_rate,
+            "rules": {
+                name: dict(stats.to_dict(), failure_rate=self.failure_rate(name))
+                for name, stats in self.rules.items()
+            },
+            "fields": {name: stats.to_dict() for name, stats in self.fields.items()},
+            "top_failures": [
+                {"rule": rule, "code": code, "count": count, "example": example}
+                for rule, code, count, example in self.top_failures(top)
+            ],
+            "co_failures": [
+                {"rules": list(pair), "count": count}
+                for pair, count in sorted(self.co_failures.items())
+            ],
+        }
+
+
+def summarize(results: Iterable[ValidationResult]) -> ValidationSummary:
+    """
+    Compute aggregate statistics over validation results in one pass.
+
+    Args:
+        results: Iterable of ValidationResult objects, e.g. the iterator
+            returned by ``validate_many``
+
+    Returns:
+        ValidationSummary with per-rule and per-field failure counts
+    """
+    summary = ValidationSummary()
+    for result in results:
+        summary.add(result)
+    return summary
+
+
+def generate_summary_report(
+    results: Union[ValidationSummary, Iterable[ValidationResult]],
+    output_path: str,
+    format: str = "html",
+    top: int = 10
+) -> ValidationSummary:
+    """
+    Generate a report of aggregate statistics instead of every error.
+
+    Args:
+        results: ValidationSummary, or results to summarize
+        output_path: Path for the report file
+        format: Report format ("html" or "markdown")
+        top: Number of most frequent failures to list
+
+    Returns:
+        The ValidationSummary the report was built from
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    format = format.lower()
+    if format not in ("html", "md", "markdown"):
+        raise ValueError(f"Unsupported format: {format}. Use 'html' or 'markdown'")
+
+    summary = results if isinstance(results, ValidationSummary) else summarize(results)
+
+    if format == "html":
+        content = _generate_html_summary(summary, top)
+    else:
+        content = _generate_markdown_summary(summary, top)
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+    return summary
+
+
+def _stats(table: Dict[str, FailureStats], name: str) -> FailureStats:
+    stats = table.get(name)
+    if stats is None:
+        stats = table[name] = FailureStats(name)
+    return stats
+
+
+def _rule_name(violation: Violation) -> str:
+    """Return the name violations of the same rule are counted under."""
+    if violation.rule_index is not None:
+        return f"rules[{violation.rule_index}].{violation.rule_type}"
+    return violation.rule_type or violation.code
+
+
+def _field_name(path: Tuple[Union[str, int], ...]) -> str:
+    """Return a JSON pointer for a path with array indexes collapsed."""
+    if not path:
+        return "(output)"
+    return _json_pointer("*" if isinstance(part, int) else part for part in path)
+
+
+def _summary_tables(
+    summary: ValidationSummary, 
+    top: int
+) -> List[Tuple[str, List[str], List[List[str]]]]:
+    """Build the (title, headings, rows) of every table in a summary report."""
+    rules = sorted(summary.rules.values(), key=lambda stats: -stats.failed)
+    fields = sorted(summary.fields.values(), key=lambda stats: -stats.failed)
+    names, matrix = summary.co_failure_matrix()
+
+    return [
+        (
+            "Failures by Rule",
+            ["Rule", "Failed", "Failure Rate", "Violations"],
+            [
+                [
+                    stats.name,
+                    str(stats.failed),
+                    f"{summary.failure_rate(stats.name) * 100:.1f}%",
+                    str(stats.violations),
+                ]
+                for stats in rules
+            ],
+        ),
+        (
+            "Failures by Field",
+            ["Field", "Failed", "Violations"],
+            [[stats.name, str(stats.failed), str(stats.violations)] for stats in fields],
+        ),
+        (
+            f"Top {top} Failures",
+            ["Rule", "Code", "Count", "Example"],
+            [
+                [rule, code, str(count), example or ""]
+                for rule, code, count, example in summary.top_failures(top)
+            ],
+        ),
+        (
+            "Co-failures",
+            ["Rule"] + names,
+            [[name] + [str(count) for count in row] for name, row in zip(names, matrix)],
+        ),
+    ]
+
+
+def _generate_markdown_summary(summary: ValidationSummary, top: int) -> str:
+    """Generate the Markdown content for a summary report."""
+    content = [
+        "# llm-contracts Summary Report",
+        "",
+        f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "",
+        "## Summary",
+        "",
+        f"- **Results**: {summary.total}",
+        f"- **Passed**: {summary.passed}",
+        f"- **Failed**: {summary.failed}",
+        f"- **Pass Rate**: {summary.pass_rate * 100:.1f}%",
+        "",
+    ]
+
+    for title, headings, rows in _summary_tables(summary, top):
+        content.extend([f"## {title}", ""])
+        if not rows:
+            content.extend(["No failures.", ""])
+            continue
+        content.append("| " + " | ".join(headings) + " |")
+        content.append("|" + "---|" * len(headings))
+        for row in rows:
+            cells = (cell.replace("|", "\\|") for cell in row)
+            content.append("| " + " | ".join(cells) + " |")
+        content.append("")
+
+    return "\n".join(content)
+
+
+def _generate_html_summary(summary: ValidationSummary, top: int) -> str:
+    """Generate the HTML content for a summary report."""
+    html_parts = []
+    for title, headings, rows in _summary_tables(summary, top):
+        html_parts.append(f'<div class="test-item"><h3>{title}</h3>')
+        if not rows:
+            html_parts.append('<p>No failures.</p></div>')
+            continue
+        head = "".join(f"<th>{html.escape(heading)}</th>" for heading in headings)
+        # Rule names, field paths and example messages come from user data
+        body = "".join(
+            "<tr>" + "".join(f"<td>{html.escape(cell)}</td>" for cell in row) + "</tr>"
+            for row in rows
+        )
+        html_parts.append(
+            f'<table class="index-table"><thead><tr>{head}</tr></thead>'
+            f'<tbody>{body}</tbody></table></div>'
+        )
+
+    return (
+        _generate_page_start()
+        + _generate_header(
+            summary.total, summary.passed, summary.failed, summary.pass_rate * 100
+        )
+        + f'<div class="test-results">{"".join(html_parts)}</div>'
+        + _generate_page_end()
+    )
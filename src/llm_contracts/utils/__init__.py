@@ -1,5 +1,17 @@
 """Utility functions for llm-contracts."""
 
-from .yaml_loader import load_yaml
+from typing import TYPE_CHECKING
 
-__all__ = ["load_yaml"] 
\ No newline at end of file
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .yaml_loader import load_yaml
+    from .mapped_lines import iter_mapped_lines
+
+__all__ = ["load_yaml", "iter_mapped_lines"]
+
+# Imported on first access, so reading files doesn't load YAML
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "load_yaml": ".yaml_loader",
+    "iter_mapped_lines": ".mapped_lines",
+})
@@ -0,0 +1,52 @@
+"""Line-by-line reading of large files through a memory map."""
+
+import mmap
+from pathlib import Path
+from typing import Iterator, Union
+
+# Pages already read are released from the mapping every this many
+# bytes, so resident memory stays flat however large the file is.
+RELEASE_INTERVAL = 16 * 1024 * 1024
+
+
+def iter_mapped_lines(file_path: Union[str, Path]) -> Iterator[bytes]:
+    """
+    Yield the lines of a file as undecoded bytes, via a memory map.
+
+    The file is mapped read-only and scanned for line boundaries in
+    place, so only the line being yielded is copied out of the page
+    cache; nothing is decoded. Pages behind the current line are
+    released as the scan moves on. Files that can't be mapped (empty
+    files, pipes) are read through a regular buffered file instead.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Iterator of lines, each ending with ``b"\\n"`` except possibly the last
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+    """
+    with open(file_path, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            yield from f
+            return
+
+        with mapped:
+            if not hasattr(mapped, "madvise"):
+                yield from iter(mapped.readline, b"")
+                return
+
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+            released = 0
+            for line in iter(mapped.readline, b""):
+                yield line
+                position = mapped.tell()
+                if position - released >= RELEASE_INTERVAL:
+                    # Drop the pages behind this line from the mapping;
+                    # they stay in the page cache
+                    released = position - position % mmap.PAGESIZE
+                    mapped.madvise(mmap.MADV_DONTNEED, 0, released)
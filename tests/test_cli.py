@@ -1,15 +1,30 @@
 """Tests for the CLI module."""
 
+import io
 import json
+import os
+import shutil
+import socket
+import stat
 import tempfile
+import threading
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Tuple
 from unittest.mock import patch, MagicMock
 
 import pytest
 import click
 from click.testing import CliRunner
 
-from llm_contracts.cli.main import main
+from llm_contracts.cli.client import (
+    SOCKET_ENV,
+    ServerClient,
+    default_socket_path,
+    fallback_socket_directory,
+)
+from llm_contracts.cli.main import _handle_request, main
+from llm_contracts.cli.server import serve_stream, unix_server
 
 
 class TestCLI:
@@ -450,4 +465,364 @@ rules:
             assert "Validation error" in result.output
         finally:
             Path(output_file).unlink()
-            Path(schema_file).unlink() 
\ No newline at end of file
+            Path(schema_file).unlink() 
+
+class TestCLIMultipleFiles:
+    """Test validating many files in one run."""
+    
+    SCHEMA = """
+schema:
+  type: object
+  properties:
+    name:
+      type: string
+    age:
+      type: integer
+  required: [name, age]
+"""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.runner = CliRunner()
+    
+    def _write_outputs(self, directory: Path) -> Path:
+        (directory / "outputs" / "nested").mkdir(parents=True)
+        (directory / "outputs" / "a.json").write_text('{"name": "A", "age": 1}')
+        (directory / "outputs" / "b.json").write_text('{"name": "B"}')
+        (directory / "outputs" / "nested" / "c.json").write_text('{"name": "C", "age": 3}')
+        schema_file = directory / "schema.yaml"
+        schema_file.write_text(self.SCHEMA)
+        return schema_file
+    
+    def test_directory_is_validated_recursively(self, tmp_path):
+        """Test that every file under a directory is validated, in order."""
+        schema_file = self._write_outputs(tmp_path)
+        
+        result = self.runner.invoke(main, [
+            str(tmp_path / "outputs"), '--schema', str(schema_file), '--jobs', '1'
+        ])
+        
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        assert f"✅ {tmp_path / 'outputs' / 'a.json'}" in lines
+        assert f"❌ {tmp_path / 'outputs' / 'b.json'}" in lines
+        assert f"✅ {tmp_path / 'outputs' / 'nested' / 'c.json'}" in lines
+        assert "Validated 3 files: 2 passed, 1 failed" in result.output
+    
+    def test_glob_patterns_and_files_in_parallel(self, tmp_path):
+        """Test glob patterns and worker processes, with results in input order."""
+        schema_file = self._write_outputs(tmp_path)
+        
+        result = self.runner.invoke(main, [
+            str(tmp_path / "outputs" / "*.json"),
+            str(tmp_path / "outputs" / "nested" / "c.json"),
+            '--schema', str(schema_file),
+            '--jobs', '2',
+            '--output-format', 'json',
+        ])
+        
+        assert result.exit_code == 0
+        output_data = json.loads(result.output)
+        assert (output_data["total"], output_data["passed"], output_data["failed"]) == (3, 2, 1)
+        assert [Path(r["output_file"]).name for r in output_data["results"]] == [
+            "a.json", "b.json", "c.json"
+        ]
+        assert output_data["results"][1]["error_count"] == 1
+    
+    def test_strict_fails_if_any_file_fails(self, tmp_path):
+        """Test that strict mode exits with 1 when any file fails."""
+        schema_file = self._write_outputs(tmp_path)
+        
+        result = self.runner.invoke(main, [
+            str(tmp_path / "outputs"), '--schema', str(schema_file), '--strict', '-j', '1'
+        ])
+        
+        assert result.exit_code == 1
+    
+    def test_html_report_covers_every_file(self, tmp_path):
+        """Test that the HTML report includes a section per file."""
+        schema_file = self._write_outputs(tmp_path)
+        html_report = tmp_path / "report.html"
+        
+        result = self.runner.invoke(main, [
+            str(tmp_path / "outputs"), '--schema', str(schema_file),
+            '-j', '1', '--html-report', str(html_report)
+        ])
+        
+        assert result.exit_code == 0
+        content = html_report.read_text(encoding="utf-8")
+        assert "2 Passed" in content
+        assert "1 Failed" in content
+    
+    def test_unmatched_pattern_is_rejected(self, tmp_path):
+        """Test that a pattern matching nothing is a usage error."""
+        schema_file = self._write_outputs(tmp_path)
+        
+        result = self.runner.invoke(main, [
+            str(tmp_path / "missing" / "*.json"), '--schema', str(schema_file)
+        ])
+        
+        assert result.exit_code == 2
+        assert "does not match any files" in result.output
+    
+    def test_markdown_report_needs_single_file(self, tmp_path):
+        """Test that --md-report is rejected for many files."""
+        schema_file = self._write_outputs(tmp_path)
+        
+        result = self.runner.invoke(main, [
+            str(tmp_path / "outputs"), '--schema', str(schema_file),
+            '--md-report', str(tmp_path / "report.md")
+        ])
+        
+        assert result.exit_code == 2
+
+
+class TestCLIJSONL:
+    """Test validating JSON Lines files."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.runner = CliRunner()
+    
+    def _write_files(self, directory: Path) -> Tuple[Path, Path]:
+        schema_file = directory / "schema.yaml"
+        schema_file.write_text(
+            "schema:\n  type: object\n  required: [name]\n"
+        )
+        records = directory / "records.jsonl"
+        records.write_text(
+            '{"id": 1, "output": {"name": "A"}}\n'
+            '\n'
+            '{"id": 2, "output": {"age": 3}}\n'
+            '{"id": 3}\n'
+        )
+        return schema_file, records
+    
+    def test_jsonl_results_to_stdout(self, tmp_path):
+        """Test that one JSON result per record is written, with line numbers."""
+        schema_file, records = self._write_files(tmp_path)
+        
+        result = self.runner.invoke(main, [
+            str(records), '--schema', str(schema_file),
+            '--jsonl', '--field', 'output', '-j', '1'
+        ])
+        
+        assert result.exit_code == 0
+        lines = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [(r["line"], r["valid"]) for r in lines] == [(1, True), (3, False), (4, False)]
+        assert lines[2]["errors"] == ["Line 4 has no field 'output'"]
+        assert "Validated 3 records: 1 passed, 2 failed" in result.stderr
+    
+    def test_jsonl_results_to_file(self, tmp_path):
+        """Test writing results to a file, in parallel, with strict mode."""
+        schema_file, records = self._write_files(tmp_path)
+        results_file = tmp_path / "results.jsonl"
+        
+        result = self.runner.invoke(main, [
+            str(records), '--schema', str(schema_file), '--jsonl',
+            '--field', 'output', '-j', '2', '-o', str(results_file), '--strict'
+        ])
+        
+        assert result.exit_code == 1
+        lines = results_file.read_text().splitlines()
+        assert [json.loads(line)["line"] for line in lines] == [1, 3, 4]
+    
+    def test_field_requires_jsonl(self, tmp_path):
+        """Test that --field is rejected without --jsonl."""
+        schema_file, records = self._write_files(tmp_path)
+        
+        result = self.runner.invoke(main, [
+            str(records), '--schema', str(schema_file), '--field', 'output'
+        ])
+        
+        assert result.exit_code == 2
+
+
+requires_unix_sockets = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Unix sockets not supported"
+)
+
+
+class TestCLIServer:
+    """Test the validation server and forwarding to it."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.runner = CliRunner()
+        self.directory = Path(tempfile.mkdtemp())
+        self.socket_path = self.directory / "v.sock"
+        self.schema_file = self.directory / "schema.yaml"
+        self.schema_file.write_text("schema:\n  type: object\n  required: [name]\n")
+        (self.directory / "ok.json").write_text('{"name": "A"}')
+        (self.directory / "bad.json").write_text('{"age": 3}')
+        self.requests = []
+    
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.directory)
+    
+    def _handle(self, request):
+        self.requests.append(request)
+        return _handle_request(request)
+    
+    @contextmanager
+    def _server(self):
+        server = unix_server(self._handle, self.socket_path)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            server.shutdown()
+            server.server_close()
+    
+    def test_stdio_protocol(self):
+        """Test requests by path and by value, ids, and error responses."""
+        requests = b"\n".join([
+            json.dumps({
+                "id": 1,
+                "schema": str(self.schema_file),
+                "path": str(self.directory / "bad.json"),
+            }).encode(),
+            json.dumps({"id": "b", "schema": str(self.schema_file), "output": {"name": "A"}}).encode(),
+            json.dumps({"schema": str(self.directory / "missing.yaml"), "output": "x"}).encode(),
+            json.dumps({"output": "x"}).encode(),
+            b"not json",
+        ]) + b"\n"
+        writer = io.BytesIO()
+        
+        serve_stream(_handle_request, io.BytesIO(requests), writer)
+        
+        responses = [json.loads(line) for line in writer.getvalue().splitlines()]
+        assert responses[0]["id"] == 1
+        assert responses[0]["valid"] is False
+        assert responses[0]["errors"] == ["Schema validation failed: 'name' is a required property"]
+        assert responses[1] == {
+            "id": "b", "valid": True, "errors": [], "error_count": 0, "strict": False
+        }
+        assert "Validation setup failed" in responses[2]["error"]
+        assert "error" in responses[3]
+        assert responses[4]["error"].startswith("Invalid request")
+    
+    @pytest.mark.parametrize("args", [['--help'], ['-h'], []])
+    def test_group_help_lists_commands(self, args):
+        """Test that help and no arguments show the group, not validate."""
+        result = self.runner.invoke(main, args)
+        
+        assert "COMMAND [ARGS]..." in result.output
+        assert "serve" in result.output
+        assert "validate" in result.output
+    
+    @pytest.mark.parametrize("args", [
+        ['./serve', '--schema', 'schema.yaml', '--no-server'],
+        ['--schema', 'schema.yaml', '--no-server', '--', 'serve'],
+    ])
+    def test_file_named_like_a_command(self, args, monkeypatch):
+        """Test the documented ways to validate a file named like a command."""
+        monkeypatch.chdir(self.directory)
+        Path("serve").write_text('{"name": "A"}')
+        
+        result = self.runner.invoke(main, args)
+        
+        assert result.exit_code == 0
+        assert "✅ Validation passed!" in result.output
+    
+    @requires_unix_sockets
+    def test_cli_forwards_to_running_server(self):
+        """Test that validations go through the server when it is running."""
+        with self._server():
+            result = self.runner.invoke(main, [
+                str(self.directory / "ok.json"), str(self.directory / "bad.json"),
+                '--schema', str(self.schema_file), '--socket', str(self.socket_path),
+                '--strict'
+            ])
+        
+        assert result.exit_code == 1
+        assert "Validated 2 files: 1 passed, 1 failed" in result.output
+        assert [Path(r["path"]).name for r in self.requests] == ["ok.json", "bad.json"]
+        assert all(Path(r["schema"]).is_absolute() for r in self.requests)
+    
+    @requires_unix_sockets
+    def test_cli_validates_locally_without_server(self):
+        """Test the fallback when no server listens, and --no-server."""
+        args = [
+            str(self.directory / "ok.json"),
+            '--schema', str(self.schema_file), '--socket', str(self.socket_path)
+        ]
+        
+        result = self.runner.invoke(main, args)
+        assert result.exit_code == 0
+        assert "✅ Validation passed!" in result.output
+        
+        with self._server():
+            result = self.runner.invoke(main, args + ['--no-server'])
+        assert result.exit_code == 0
+        assert self.requests == []
+    
+    @requires_unix_sockets
+    def test_server_errors_are_reported(self):
+        """Test that a schema the server can't load fails the command."""
+        self.schema_file.write_text("schema: [unclosed\n")
+        
+        with self._server():
+            result = self.runner.invoke(main, [
+                str(self.directory / "ok.json"),
+                '--schema', str(self.schema_file), '--socket', str(self.socket_path)
+            ])
+        
+        assert result.exit_code == 1
+        assert "Validation error: Validation setup failed" in result.output
+    
+    @requires_unix_sockets
+    def test_second_server_is_refused(self):
+        """Test that a live socket isn't taken over by another server."""
+        with self._server():
+            with pytest.raises(RuntimeError, match="already listening"):
+                unix_server(self._handle, self.socket_path)
+    
+    @requires_unix_sockets
+    def test_serve_leaves_other_files_alone(self):
+        """Test that a regular file at the socket path is not replaced."""
+        notes = self.directory / "notes.txt"
+        notes.write_text("important\n")
+        
+        with pytest.raises(RuntimeError, match="not a socket owned by the current user"):
+            unix_server(self._handle, notes)
+        
+        result = self.runner.invoke(main, ['serve', '--socket', str(notes)])
+        assert result.exit_code == 1
+        assert "not a socket owned by the current user" in result.output
+        assert notes.read_text() == "important\n"
+    
+    @requires_unix_sockets
+    def test_untrusted_socket_is_not_used(self):
+        """Test that a socket others can use isn't trusted with validations."""
+        with self._server():
+            os.chmod(self.socket_path, 0o666)
+            assert ServerClient.connect(self.socket_path) is None
+            
+            result = self.runner.invoke(main, [
+                str(self.directory / "ok.json"),
+                '--schema', str(self.schema_file), '--socket', str(self.socket_path)
+            ])
+        
+        assert result.exit_code == 0
+        assert self.requests == []
+    
+    @requires_unix_sockets
+    def test_fallback_socket_directory_is_private(self, monkeypatch):
+        """Test the default socket outside a runtime directory."""
+        monkeypatch.delenv(SOCKET_ENV, raising=False)
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        monkeypatch.setattr(tempfile, "tempdir", str(self.directory))
+        socket_path = Path(default_socket_path())
+        
+        assert socket_path.parent == Path(fallback_socket_directory())
+        server = unix_server(self._handle, socket_path)
+        server.server_close()
+        assert stat.S_IMODE(socket_path.parent.stat().st_mode) == 0o700
+        
+        socket_path.unlink()
+        socket_path.parent.chmod(0o755)
+        with pytest.raises(RuntimeError, match="inaccessible to others"):
+            unix_server(self._handle, socket_path)
@@ -0,0 +1,254 @@
+"""Tests for the Flask frontend server."""
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("flask_cors")
+
+SERVER_PATH = Path(__file__).resolve().parent.parent / "frontend" / "server.py"
+
+SCHEMA = """
+rules:
+  - keyword_must_include: quality
+"""
+
+MISSING_QUALITY = (
+    "Missing required keyword: 'quality'. Please include this term in your content."
+)
+
+OTHER_SCHEMA = """
+rules:
+  - keyword_must_not_include: cheap
+"""
+
+
+def load_server(monkeypatch, cache_size=None):
+    """Import a fresh copy of the server module, with its own cache."""
+    if cache_size is None:
+        monkeypatch.delenv("LLM_CONTRACTS_CACHE_SIZE", raising=False)
+    else:
+        monkeypatch.setenv("LLM_CONTRACTS_CACHE_SIZE", str(cache_size))
+    
+    spec = importlib.util.spec_from_file_location("frontend_server", SERVER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.app.config["TESTING"] = True
+    return module
+
+
+@pytest.fixture
+def server(monkeypatch):
+    return load_server(monkeypatch)
+
+
+@pytest.fixture
+def client(server):
+    return server.app.test_client()
+
+
+def ndjson_lines(response):
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+class TestContractCache:
+    """Test the compiled schema cache."""
+    
+    def test_hits_and_misses(self, server):
+        """Test that the same schema text is compiled once."""
+        cache = server.ContractCache(maxsize=4)
+        
+        first = cache.get(SCHEMA)
+        assert cache.get(SCHEMA) is first
+        cache.get(OTHER_SCHEMA)
+        
+        assert cache.info() == {
+            "hits": 1, "misses": 2, "evictions": 0, "maxsize": 4, "currsize": 2
+        }
+    
+    def test_least_recently_used_is_evicted(self, server):
+        """Test that the schema used least recently is dropped first."""
+        cache = server.ContractCache(maxsize=2)
+        third_schema = SCHEMA + "  - word_count_max: 100\n"
+        
+        cache.get(SCHEMA)
+        cache.get(OTHER_SCHEMA)
+        cache.get(SCHEMA)
+        cache.get(third_schema)
+        cache.get(SCHEMA)
+        cache.get(OTHER_SCHEMA)
+        
+        info = cache.info()
+        assert (info["hits"], info["misses"], info["evictions"]) == (2, 4, 2)
+        assert info["currsize"] == 2
+    
+    def test_invalid_schema_is_not_cached(self, server):
+        """Test that a schema that fails to compile raises and is not kept."""
+        cache = server.ContractCache()
+        
+        with pytest.raises(server.ValidationError, match="Validation setup failed"):
+            cache.get("rules: [")
+        
+        assert cache.info()["currsize"] == 0
+    
+    def test_cache_size_zero_disables_caching(self, monkeypatch):
+        """Test that LLM_CONTRACTS_CACHE_SIZE=0 compiles every request."""
+        server = load_server(monkeypatch, cache_size=0)
+        client = server.app.test_client()
+        
+        for _ in range(2):
+            response = client.post(
+                "/api/validate", json={"output": "quality", "schema": SCHEMA}
+            )
+            assert response.status_code == 200
+        
+        info = client.get("/api/metrics").get_json()["contract_cache"]
+        assert info == {
+            "hits": 0, "misses": 2, "evictions": 0, "maxsize": 0, "currsize": 0
+        }
+    
+    def test_requests_share_the_cache(self, client):
+        """Test that validate, batch and report requests reuse one compiled schema."""
+        client.post("/api/validate", json={"output": "quality", "schema": SCHEMA})
+        client.post("/api/validate/batch", json={"outputs": ["a"], "schema": SCHEMA})
+        client.post(
+            "/api/generate-report",
+            json={"output": "plain", "schema": SCHEMA, "format": "markdown"},
+        )
+        
+        info = client.get("/api/metrics").get_json()["contract_cache"]
+        assert (info["hits"], info["misses"], info["currsize"]) == (2, 1, 1)
+
+
+class TestValidateEndpoint:
+    """Test the single-output endpoint."""
+    
+    def test_validate(self, client):
+        """Test that errors come back for an invalid output."""
+        response = client.post(
+            "/api/validate", json={"output": "plain text", "schema": SCHEMA}
+        )
+        
+        data = response.get_json()
+        assert response.status_code == 200
+        assert data["success"] is True
+        assert data["is_valid"] is False
+        assert data["errors"] == [MISSING_QUALITY]
+    
+    def test_missing_output_is_rejected(self, client):
+        """Test that a request without an output gets a 400."""
+        response = client.post("/api/validate", json={"schema": SCHEMA})
+        
+        assert response.status_code == 400
+        assert response.get_json()["message"] == "Missing output or schema"
+    
+    def test_invalid_schema_is_rejected(self, client):
+        """Test that a schema that fails to compile gets a 400."""
+        response = client.post("/api/validate", json={"output": "x", "schema": "rules: ["})
+        
+        assert response.status_code == 400
+        assert "Validation setup failed" in response.get_json()["message"]
+
+
+class TestBatchEndpoint:
+    """Test the batch validation endpoint."""
+    
+    def test_json_body(self, client):
+        """Test that a JSON body returns every result in input order."""
+        response = client.post("/api/validate/batch", json={
+            "schema": SCHEMA,
+            "outputs": ["good quality", "plain", '{"text": "quality"}'],
+        })
+        
+        data = response.get_json()
+        assert response.status_code == 200
+        assert data["success"] is True
+        assert (data["total"], data["passed"]) == (3, 2)
+        assert [item["index"] for item in data["results"]] == [0, 1, 2]
+        assert [item["is_valid"] for item in data["results"]] == [True, False, True]
+        assert data["results"][1]["errors"] == [MISSING_QUALITY]
+    
+    def test_json_body_streamed(self, client):
+        """Test that stream: true returns one NDJSON line per output."""
+        response = client.post("/api/validate/batch", json={
+            "schema": SCHEMA,
+            "outputs": ["good quality", "plain"],
+            "stream": True,
+        })
+        
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        assert ndjson_lines(response) == [
+            {"index": 0, "is_valid": True, "errors": []},
+            {"index": 1, "is_valid": False, "errors": [MISSING_QUALITY]},
+        ]
+    
+    @pytest.mark.parametrize("kwargs", [
+        {"query_string": {"stream": "1"}},
+        {"headers": {"Accept": "application/x-ndjson"}},
+    ])
+    def test_stream_requested_by_query_or_accept(self, client, kwargs):
+        """Test that ?stream=1 and Accept: application/x-ndjson also stream."""
+        response = client.post(
+            "/api/validate/batch",
+            json={"schema": SCHEMA, "outputs": ["plain"]},
+            **kwargs
+        )
+        
+        assert response.mimetype == "application/x-ndjson"
+        assert ndjson_lines(response)[0]["is_valid"] is False
+    
+    def test_ndjson_body(self, client):
+        """Test that an NDJSON body is read line by line and streamed back."""
+        body = "\n".join([
+            json.dumps({"schema": SCHEMA}),
+            json.dumps("good quality"),
+            "",
+            json.dumps({"text": "plain"}),
+            "not json but quality",
+        ]) + "\n"
+        
+        response = client.post(
+            "/api/validate/batch", data=body, content_type="application/x-ndjson"
+        )
+        
+        assert response.status_code == 200
+        assert [item["is_valid"] for item in ndjson_lines(response)] == [True, False, True]
+    
+    @pytest.mark.parametrize("payload, message", [
+        ({"schema": SCHEMA, "outputs": "plain"}, "outputs must be a list"),
+        ({"outputs": ["plain"]}, "Missing schema"),
+    ])
+    def test_bad_json_body_is_rejected(self, client, payload, message):
+        """Test that malformed JSON bodies get a 400."""
+        response = client.post("/api/validate/batch", json=payload)
+        
+        assert response.status_code == 400
+        assert response.get_json() == {"success": False, "message": message}
+    
+    @pytest.mark.parametrize("body, message", [
+        ("not json\n", "First line must be a JSON object with the schema"),
+        ('{"outputs": []}\n"plain"\n', "Missing schema"),
+        ("", "Missing schema"),
+    ])
+    def test_bad_ndjson_body_is_rejected(self, client, body, message):
+        """Test that an NDJSON body without a schema header gets a 400."""
+        response = client.post(
+            "/api/validate/batch", data=body, content_type="application/x-ndjson"
+        )
+        
+        assert response.status_code == 400
+        assert response.get_json()["message"] == message
+    
+    def test_invalid_schema_is_rejected(self, client):
+        """Test that a schema that fails to compile gets a 400 before streaming."""
+        response = client.post(
+            "/api/validate/batch",
+            json={"schema": "rules: [", "outputs": ["plain"], "stream": True},
+        )
+        
+        assert response.status_code == 400
+        assert "Validation setup failed" in response.get_json()["message"]
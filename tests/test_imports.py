@@ -0,0 +1,74 @@
+"""Tests for the package's lazily imported public names."""
+
+import subprocess
+import sys
+
+import pytest
+
+import llm_contracts
+
+
+def _modules_loaded_by(code: str) -> set:
+    """Run code in a fresh interpreter and return the modules it imported."""
+    output = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(' '.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+    return set(output.split())
+
+
+class TestLazyImports:
+    """Test that heavy dependencies load on first use, not on import."""
+    
+    HEAVY = {
+        "jsonschema",
+        "yaml",
+        "asyncio",
+        "importlib.metadata",
+        "concurrent.futures",
+        "llm_contracts.reports",
+        "llm_contracts.reports.html_generator",
+        "llm_contracts.reports.markdown_generator",
+    }
+    
+    def test_import_loads_no_heavy_modules(self):
+        """Test that importing the package and its singleton stays light."""
+        loaded = _modules_loaded_by("from llm_contracts import contracts")
+        
+        assert loaded & self.HEAVY == set()
+    
+    def test_dependencies_load_on_first_use(self):
+        """Test that validating loads jsonschema and YAML but not reports."""
+        loaded = _modules_loaded_by(
+            "from llm_contracts import Contract\n"
+            "Contract({'schema': {'type': 'object'}}).validate({})"
+        )
+        
+        assert "jsonschema" in loaded
+        assert "llm_contracts.reports.html_generator" not in loaded
+    
+    @pytest.mark.parametrize("name", llm_contracts.__all__)
+    def test_public_names_resolve(self, name):
+        """Test that every exported name is available and listed by dir()."""
+        assert getattr(llm_contracts, name) is not None
+        assert name in dir(llm_contracts)
+    
+    def test_same_objects_as_defining_modules(self):
+        """Test that lazy names are the objects their modules define."""
+        from llm_contracts.core import validator
+        from llm_contracts.reports import html_generator
+        contracts_module = sys.modules["llm_contracts.contracts"]
+        
+        assert llm_contracts.Contract is validator.Contract
+        assert llm_contracts.generate_html_report is html_generator.generate_html_report
+        assert contracts_module.generate_html_report is html_generator.generate_html_report
+        assert llm_contracts.contracts is contracts_module.contracts
+    
+    def test_unknown_name_raises_attribute_error(self):
+        """Test that missing names still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            llm_contracts.no_such_name
+        with pytest.raises(ImportError):
+            from llm_contracts.core import no_such_name  # noqa: F401
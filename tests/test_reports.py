@@ -1,14 +1,16 @@
 """Tests for the reports module."""
 
+import io
 import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-from llm_contracts.core.validator import ValidationResult
+from llm_contracts.core.validator import Contract, ValidationResult
 from llm_contracts.reports.html_generator import generate_html_report
 from llm_contracts.reports.markdown_generator import generate_markdown_report
+from llm_contracts.reports.summary import generate_summary_report, summarize
 
 
 class TestHTMLReportGenerator:
@@ -166,6 +168,124 @@ schema:
                 assert "max-width" in content
         finally:
             Path(output_file).unlink()
+    
+    def test_html_report_streams_an_iterator(self, tmp_path):
+        """Test that results from a generator are reported with correct totals."""
+        def results():
+            for i in range(5):
+                yield ValidationResult(i % 2 == 0, [] if i % 2 == 0 else [f"Error {i}"])
+        output_file = tmp_path / "report.html"
+        
+        generate_html_report(results(), str(output_file))
+        
+        content = output_file.read_text(encoding="utf-8")
+        assert "3 Passed" in content
+        assert "2 Failed" in content
+        assert "60.0% Success Rate" in content
+        assert content.index("Success Rate") < content.index("Test 1")
+        assert "Error 1" in content and "Error 3" in content
+        assert "Test 5" in content
+        assert content.rstrip().endswith("</html>")
+    
+    def test_html_report_empty_iterator(self, tmp_path):
+        """Test that an empty iterable still produces a complete report."""
+        output_file = tmp_path / "report.html"
+        
+        generate_html_report(iter([]), str(output_file))
+        
+        content = output_file.read_text(encoding="utf-8")
+        assert "0 Passed" in content
+        assert "0.0% Success Rate" in content
+    
+    def test_paged_html_report(self, tmp_path):
+        """Test that page_size splits results into pages behind an index page."""
+        contract = Contract({"rules": [{"keyword_must_include": "quality"}]})
+        results = (
+            contract.validate("quality" if i % 2 == 0 else "nothing") for i in range(5)
+        )
+        index_file = tmp_path / "report.html"
+        
+        generate_html_report(results, str(index_file), page_size=2)
+        
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "report-1.html", "report-2.html", "report-3.html", "report.html"
+        ]
+        index = index_file.read_text(encoding="utf-8")
+        assert "3 Passed" in index
+        assert "2 Failed" in index
+        assert "<td>keyword_must_include</td><td>2</td><td>2</td>" in index
+        assert '<a href="report-3.html">' in index
+        
+        last_page = (tmp_path / "report-3.html").read_text(encoding="utf-8")
+        assert "Test 5" in last_page
+        assert "1 Passed" in last_page
+        assert '<a href="report-2.html">← Previous</a>' in last_page
+        assert "Next →" not in last_page
+        assert '<a href="report-2.html">Next →</a>' in (
+            tmp_path / "report-1.html"
+        ).read_text(encoding="utf-8")
+    
+    def test_paged_html_report_full_last_page(self, tmp_path):
+        """Test that no empty page is written when results fill the last page."""
+        results = [ValidationResult(True, [])] * 4
+        
+        generate_html_report(results, str(tmp_path / "report.html"), page_size=2)
+        
+        assert len(list(tmp_path.iterdir())) == 3
+    
+    def test_paged_html_report_rejects_bad_page_size(self, tmp_path):
+        """Test that a page size below 1 is rejected."""
+        with pytest.raises(ValueError):
+            generate_html_report([], str(tmp_path / "report.html"), page_size=0)
+    
+    def test_html_report_links_errors_to_their_rule(self, tmp_path):
+        """Test that errors show the rule that produced them, with bundles expanded."""
+        (tmp_path / "bundle.yaml").write_text(
+            "rules:\n  - keyword_must_not_include: [cheap]\n"
+        )
+        schema_file = tmp_path / "schema.yaml"
+        schema_file.write_text(
+            "schema:\n"
+            "  type: object\n"
+            "  properties:\n"
+            "    content: {type: string}\n"
+            "    score: {type: integer}\n"
+            "rules:\n"
+            "  - include: bundle.yaml\n"
+            "  - word_count_min: 10\n"
+        )
+        result = Contract.compile(schema_file, all_errors=True).validate(
+            {"content": "cheap stuff", "score": "high"}
+        )
+        output_file = tmp_path / "report.html"
+        
+        generate_html_report(result, str(output_file), str(schema_file))
+        
+        content = output_file.read_text(encoding="utf-8")
+        assert "score:\n  type: integer" in content
+        assert "keyword_must_not_include:\n- cheap" in content
+        assert "word_count_min: 10" in content
+    
+    def test_html_report_in_memory(self):
+        """Test writing a report for an in-memory schema to a file object."""
+        schema = {
+            "schema": {"type": "object", "properties": {"score": {"type": "integer"}}},
+            "rules": [{"word_count_min": 10}],
+        }
+        result = Contract(schema, all_errors=True).validate({"score": "high"})
+        buffer = io.BytesIO()
+        
+        generate_html_report(result, buffer, schema)
+        
+        content = buffer.getvalue().decode("utf-8")
+        assert content.rstrip().endswith("</html>")
+        assert "score:\n  type: integer" in content
+        assert "word_count_min: 10" in content
+    
+    def test_paged_html_report_needs_path(self):
+        """Test that paged reports can't be written to a file object."""
+        with pytest.raises(ValueError):
+            generate_html_report([], io.BytesIO(), page_size=2)
 
 
 class TestMarkdownReportGenerator:
@@ -292,6 +412,147 @@ class TestMarkdownReportGenerator:
                 assert "Field 'age' is required" in content
         finally:
             Path(output_file).unlink()
+    
+    def test_markdown_report_groups_violations_by_rule_type(self, tmp_path):
+        """Test that violations are grouped by the rule that produced them."""
+        contract = Contract({
+            "schema": {"type": "object", "required": ["title"]},
+            "rules": [
+                {"keyword_must_include": "quality"},
+                {"min_list_items": 2},
+                {"regex_must_match": r"\d+-day"},
+                {"no_duplicate_sentences": True},
+            ],
+        })
+        result = contract.validate(
+            {"content": "Plain text here. Plain text here."}, all_errors=True
+        )
+        output_file = tmp_path / "report.md"
+        
+        generate_markdown_report(result, str(output_file), "schema.yaml", {})
+        
+        content = output_file.read_text(encoding="utf-8")
+        schema_part, rest = content.split("#### Keyword Rules")
+        keyword_part, rest = rest.split("#### Content Rules")
+        content_part, other_part = rest.split("#### Other")
+        assert "'title' is a required property" in schema_part
+        assert "Missing required keyword: 'quality'" in keyword_part
+        assert "list items" in content_part
+        assert "Duplicate sentences detected" in content_part
+        assert "regex pattern" in other_part
+    
+    def test_markdown_report_in_memory(self):
+        """Test a report for a schema dictionary, written to a text file object."""
+        schema = {"rules": [{"keyword_must_include": "quality"}]}
+        result = Contract.from_schema(schema).validate("plain text")
+        buffer = io.StringIO()
+        
+        generate_markdown_report(result, buffer, schema)
+        
+        content = buffer.getvalue()
+        assert "**Schema**: in-memory schema" in content
+        assert "Missing required keyword: 'quality'" in content
+
+
+class TestSummaryReport:
+    """Test aggregate statistics over many results."""
+    
+    CONTRACT = Contract({
+        "schema": {
+            "type": "object",
+            "properties": {"tags": {"type": "array", "items": {"type": "string"}}},
+        },
+        "rules": [
+            {"keyword_must_include": "quality"},
+            {"word_count_max": 3},
+        ],
+    }, all_errors=True)
+    
+    OUTPUTS = [
+        {"content": "quality"},
+        {"content": "far too many words here"},
+        {"content": "quality", "tags": [1, "ok", 2]},
+        {"content": "quality only"},
+    ]
+    
+    def test_summarize_counts_rules_and_fields(self):
+        """Test per-rule and per-field counts and rates."""
+        summary = summarize(self.CONTRACT.validate_many(self.OUTPUTS))
+        
+        assert (summary.total, summary.passed, summary.failed) == (4, 2, 2)
+        assert summary.pass_rate == 0.5
+        
+        keyword = summary.rules["rules[0].keyword_must_include"]
+        assert (keyword.failed, keyword.violations) == (1, 1)
+        assert summary.failure_rate("rules[0].keyword_must_include") == 0.25
+        
+        schema = summary.rules["schema"]
+        assert (schema.failed, schema.violations) == (1, 2)
+        assert schema.codes == {"schema:type": 2}
+        
+        assert summary.fields["/tags/*"].violations == 2
+        assert summary.fields["/content"].failed == 1
+    
+    def test_co_failures_and_top_failures(self):
+        """Test co-failure counts and the most frequent failures."""
+        summary = summarize(self.CONTRACT.validate_many(self.OUTPUTS))
+        
+        assert summary.co_failures == {
+            ("rules[0].keyword_must_include", "rules[1].word_count_max"): 1
+        }
+        names, matrix = summary.co_failure_matrix()
+        first, second = names.index("rules[0].keyword_must_include"), names.index("schema")
+        assert matrix[first][second] == matrix[second][first] == 0
+        assert matrix[first][first] == 1
+        
+        rule, code, count, example = summary.top_failures(1)[0]
+        assert (rule, code, count) == ("schema", "schema:type", 2)
+        assert example == "Schema validation failed at /tags/0: 1 is not of type 'string'"
+    
+    def test_summary_is_incremental(self):
+        """Test that results can be folded in one at a time."""
+        summary = summarize([])
+        assert summary.total == 0
+        assert summary.pass_rate == 0.0
+        
+        for result in self.CONTRACT.validate_many(self.OUTPUTS):
+            summary.add(result)
+        
+        assert summary.to_dict()["failed"] == 2
+    
+    @pytest.mark.parametrize("format", ["markdown", "html"])
+    def test_generate_summary_report(self, tmp_path, format):
+        """Test that the summary report lists counts rather than every error."""
+        output_file = tmp_path / "summary.out"
+        
+        summary = generate_summary_report(
+            self.CONTRACT.validate_many(self.OUTPUTS), str(output_file), format
+        )
+        
+        content = output_file.read_text(encoding="utf-8")
+        assert summary.total == 4
+        assert "Failures by Rule" in content
+        assert "rules[1].word_count_max" in content
+        assert "Co-failures" in content
+        assert "50.0%" in content
+    
+    def test_html_summary_escapes_messages(self, tmp_path):
+        """Test that rule names and example messages are HTML-escaped."""
+        output_file = tmp_path / "summary.html"
+        contract = Contract({"rules": [{"keyword_must_not_include": ["<script>"]}]})
+        
+        generate_summary_report(
+            [contract.validate("a <script> tag")], str(output_file), "html"
+        )
+        
+        content = output_file.read_text(encoding="utf-8")
+        assert "&lt;script&gt;" in content
+        assert "<script>" not in content
+    
+    def test_generate_summary_report_rejects_unknown_format(self, tmp_path):
+        """Test that unsupported formats are rejected."""
+        with pytest.raises(ValueError):
+            generate_summary_report([], str(tmp_path / "summary.pdf"), "pdf")
 
 
 class TestReportIntegration:
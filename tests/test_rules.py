@@ -1,7 +1,12 @@
 """Tests for the rules module."""
 
 import pytest
-from llm_contracts.core.rules import validate_rules, RuleError
+from functools import cached_property
+from unittest.mock import patch
+
+from llm_contracts.core.rules import compile_rules, validate_rules, RuleError
+from llm_contracts.core.matching import KeywordMatcher
+from llm_contracts.core.text import AnalyzedText
 
 
 class TestBasicRules:
@@ -346,4 +351,200 @@ class TestMultipleRules:
         errors = validate_rules(content, rules)
         assert len(errors) >= 2  # Should fail on multiple rules
         assert any("Must include keyword: 'quality'" in error for error in errors)
-        assert any("Must not include keyword: 'cheap'" in error for error in errors) 
\ No newline at end of file
+        assert any("Must not include keyword: 'cheap'" in error for error in errors)
+
+
+class TestCompiledRules:
+    """Test compiled rule plans."""
+    
+    RULES = [
+        {"keyword_must_include": ["quality", "premium"]},
+        {"keyword_must_not_include": ["cheap", "defective"]},
+        {"no_placeholder_text": r"\[YOUR_TEXT_HERE\]"},
+        {"word_count_min": 10, "word_count_max": 20},
+        {"section_must_start_with": "^this"},
+        {"regex_must_match": r"\d+-day"},
+        {"phrase_order": {"first": "product", "then": "warranty"}},
+    ]
+    
+    def test_plan_matches_validate_rules(self):
+        """Test that a reused plan reports exactly what validate_rules reports."""
+        plan = compile_rules(self.RULES)
+        contents = [
+            "This is a quality product with premium features and a 30-day warranty.",
+            "A cheap [YOUR_TEXT_HERE] thing.",
+            {"content": "This defective product has no warranty"},
+        ]
+        
+        for content in contents:
+            assert plan.run(content) == validate_rules(content, self.RULES)
+    
+    def test_plan_does_not_compile_regexes(self):
+        """Test that running a plan uses the regexes prepared at compile time."""
+        plan = compile_rules(self.RULES)
+        
+        with patch("re.compile", side_effect=AssertionError("recompiled")):
+            errors = plan.run("A cheap [YOUR_TEXT_HERE] thing.")
+        
+        assert "Contains placeholder text: '\\[YOUR_TEXT_HERE\\]'" in errors
+    
+    def test_invalid_regex_reported_on_every_run(self):
+        """Test that a bad pattern is reported each run rather than at compile time."""
+        plan = compile_rules([{"regex_must_match": "[unclosed"}])
+        
+        for _ in range(2):
+            errors = plan.run("content")
+            assert len(errors) == 1
+            assert errors[0].startswith("Error applying rule 'regex_must_match':")
+    
+    def test_bad_keyword_reported_after_valid_ones(self):
+        """Test that keywords before an invalid entry are still checked."""
+        errors = validate_rules("text", [{"keyword_must_include": ["missing", 5]}])
+        
+        assert len(errors) == 2
+        assert "Missing required keyword: 'missing'" in errors[0]
+        assert errors[1].startswith("Error applying rule 'keyword_must_include':")
+    
+    def test_non_dict_rule_rejected(self):
+        """Test that rules that are not dictionaries are rejected at compile time."""
+        with pytest.raises(RuleError):
+            compile_rules(["keyword_must_include"])
+    
+    def test_disabled_rules_are_dropped(self):
+        """Test that disabled rules don't produce checks."""
+        plan = compile_rules([
+            {"no_duplicate_sentences": False},
+            {"min_list_items": 0},
+            {"phrase_proximity": {"terms": ["only-one"]}},
+        ])
+        
+        assert len(plan) == 0
+    
+    def test_evaluate_returns_violations(self):
+        """Test that evaluate reports what run reports, as structured violations."""
+        plan = compile_rules(self.RULES)
+        content = "A cheap [YOUR_TEXT_HERE] thing."
+        
+        violations = plan.evaluate(content)
+        
+        assert [v.message for v in violations] == plan.run(content)
+        assert [(v.code, v.rule_index) for v in violations] == [
+            ("keyword_missing", 0),
+            ("keyword_missing", 0),
+            ("keyword_prohibited", 1),
+            ("placeholder_text", 2),
+            ("word_count_below", 3),
+            ("section_start", 4),
+            ("regex_mismatch", 5),
+            ("phrase_missing", 6),
+        ]
+        placeholder = violations[3]
+        start, end = placeholder.span
+        assert content[start:end] == "[YOUR_TEXT_HERE]"
+    
+    def test_rule_errors_are_attributed(self):
+        """Test that a failing rule's error records which rule failed."""
+        violations = compile_rules([
+            {"word_count_min": 1},
+            {"regex_must_match": "[unclosed"},
+        ]).evaluate("content")
+        
+        assert len(violations) == 1
+        assert violations[0].code == "rule_error"
+        assert violations[0].rule_index == 1
+        assert violations[0].rule_type == "regex_must_match"
+
+
+class TestAnalyzedText:
+    """Test the shared text analysis used by rules."""
+    
+    def test_views_are_computed_once(self):
+        """Test that derived views are cached on the instance."""
+        text = AnalyzedText("Hello World. Hello again!")
+        
+        assert text.lower == "hello world. hello again!"
+        assert text.lower is text.lower
+        assert text.words is text.words
+        assert text.word_count == 4
+        assert text.sentences == ["Hello World", "Hello again", ""]
+    
+    def test_word_spans(self):
+        """Test character offsets of word tokens."""
+        text = AnalyzedText("  one two\nthree ")
+        
+        assert text.word_spans == [(2, 5), (6, 9), (10, 15)]
+    
+    def test_words_containing_matches_naive_scan(self):
+        """Test that words_containing agrees with a per-word substring check."""
+        text = AnalyzedText("Price drops 30% in 30 days; priceless PRICE-tags")
+        
+        for fragment in ["price", "30", "s", "", "es pr", "missing"]:
+            expected = [i for i, word in enumerate(text.lower_words) if fragment in word]
+            assert text.words_containing(fragment) == expected
+    
+    def test_rules_share_one_analysis(self):
+        """Test that a plan lowercases the content once for all rules that need it."""
+        plan = compile_rules([
+            {"keyword_must_include": ["quality"]},
+            {"keyword_must_not_include": ["cheap"]},
+            {"phrase_order": {"first": "quality", "then": "cheap"}},
+        ])
+        
+        calls = []
+        original = AnalyzedText.__dict__["lower"].func
+        
+        def counting_lower(self):
+            calls.append(1)
+            return original(self)
+        
+        counting_property = cached_property(counting_lower)
+        counting_property.__set_name__(AnalyzedText, "lower")
+        
+        with patch.object(AnalyzedText, "lower", counting_property):
+            errors = plan.run("Quality first, never cheap")
+        
+        assert errors == [
+            "Prohibited keyword found: 'cheap'. Please remove or rephrase this content."
+        ]
+        assert len(calls) == 1
+
+
+class TestKeywordMatcher:
+    """Test the multi-keyword automaton used by keyword rules."""
+    
+    def test_find_overlapping_keywords(self):
+        """Test that overlapping and nested keywords are all reported."""
+        matcher = KeywordMatcher(["he", "she", "his", "hers", "her"])
+        
+        assert matcher.find("ushers") == {"he", "she", "hers", "her"}
+        assert matcher.find("nothing") == frozenset()
+    
+    def test_scan_across_chunks(self):
+        """Test that keywords straddling chunk boundaries are found."""
+        matcher = KeywordMatcher(["defective", "cheap"])
+        
+        state, found = matcher.scan(0, "a defec")
+        assert found == frozenset()
+        state, found = matcher.scan(state, "tive item")
+        assert found == {"defective"}
+    
+    def test_empty_keyword_always_matches(self):
+        """Test that an empty keyword behaves like '' in text."""
+        assert KeywordMatcher(["", "x"]).find("") == {""}
+    
+    def test_large_blocklist_rule(self):
+        """Test keyword rules backed by the automaton keep per-keyword messages."""
+        banned = [f"banned{i:04d}" for i in range(500)]
+        rules = [
+            {"keyword_must_not_include": banned},
+            {"keyword_must_include": ["Quality", "warranty"]},
+        ]
+        content = "QUALITY goods, no BANNED0042 or banned0499 here"
+        
+        errors = validate_rules(content, rules)
+        
+        assert errors == [
+            "Prohibited keyword found: 'banned0042'. Please remove or rephrase this content.",
+            "Prohibited keyword found: 'banned0499'. Please remove or rephrase this content.",
+            "Missing required keyword: 'warranty'. Please include this term in your content.",
+        ]
@@ -8,7 +8,16 @@ from unittest.mock import patch, MagicMock
 import pytest
 import yaml
 
-from llm_contracts.core.schema import load_schema, SchemaError
+import os
+
+from llm_contracts.core.schema import (
+    load_schema,
+    SchemaError,
+    clear_schema_cache,
+    configure_schema_cache,
+    parse_schema,
+    schema_cache_info,
+)
 from llm_contracts.core.validator import validate_output, ValidationResult
 
 
@@ -59,6 +68,25 @@ class TestSchemaLoading:
         with pytest.raises(SchemaError):
             load_schema("nonexistent.yaml")
     
+    def test_load_errors_name_the_file(self):
+        """Test that load errors keep their messages and point at the file."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            schema_path = Path(tmp_dir) / "schema.yaml"
+            schema_path.write_text("rules: [\n")
+            
+            with pytest.raises(SchemaError) as exc_info:
+                load_schema(schema_path)
+            assert exc_info.value.message.startswith("Invalid YAML in schema file:")
+            assert f'in "{schema_path}"' in exc_info.value.message
+            
+            schema_path.write_text("rules:\n  - include: missing.yaml\n")
+            with pytest.raises(SchemaError) as exc_info:
+                load_schema(schema_path)
+            assert exc_info.value.message.startswith(
+                "Error loading schema file: Error loading rule bundle file: "
+                "Rule bundle file not found:"
+            )
+    
     def test_load_schema_empty_file(self):
         """Test loading empty schema file."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
@@ -674,4 +702,223 @@ class TestSchemaIntegration:
             assert result.is_valid is False
             assert len(result.errors) > 0
         finally:
-            Path(schema_path).unlink() 
\ No newline at end of file
+            Path(schema_path).unlink()
+
+
+class TestSchemaCache:
+    """Test the process-wide schema cache."""
+    
+    def setup_method(self):
+        """Start every test with an empty cache."""
+        configure_schema_cache(128)
+        clear_schema_cache()
+    
+    def teardown_method(self):
+        """Restore the default cache configuration."""
+        configure_schema_cache(128)
+        clear_schema_cache()
+    
+    def _touch(self, path: str, content: str) -> None:
+        """Rewrite a file and bump its mtime so the change is always visible."""
+        stat = os.stat(path)
+        Path(path).write_text(content)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+    
+    def test_cache_hits_and_misses(self):
+        """Test that repeated loads are served from the cache."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            schema_path = Path(tmp_dir) / "schema.yaml"
+            schema_path.write_text("rules:\n  - keyword_must_include: quality\n")
+            
+            first = load_schema(schema_path)
+            second = load_schema(str(schema_path))
+            
+            assert first == second
+            info = schema_cache_info()
+            assert info.misses == 1
+            assert info.hits == 1
+            assert info.currsize == 1
+    
+    def test_cached_schema_is_copied(self):
+        """Test that mutating a loaded schema does not corrupt the cache."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            schema_path = Path(tmp_dir) / "schema.yaml"
+            schema_path.write_text("rules:\n  - keyword_must_include: quality\n")
+            
+            load_schema(schema_path)["rules"].append({"word_count_min": 5})
+            
+            assert len(load_schema(schema_path)["rules"]) == 1
+    
+    def test_root_file_change_invalidates(self):
+        """Test that editing the schema file is picked up."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            schema_path = Path(tmp_dir) / "schema.yaml"
+            schema_path.write_text("rules:\n  - keyword_must_include: quality\n")
+            load_schema(schema_path)
+            
+            self._touch(str(schema_path), "rules:\n  - keyword_must_include: premium\n")
+            
+            schema = load_schema(schema_path)
+            assert schema["rules"] == [{"keyword_must_include": "premium"}]
+            assert schema_cache_info().misses == 2
+    
+    def test_bundle_change_invalidates(self):
+        """Test that editing an included bundle is picked up."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            bundle_dir = Path(tmp_dir) / "bundles"
+            bundle_dir.mkdir()
+            (bundle_dir / "inner.yaml").write_text(
+                "rules:\n  - keyword_must_not_include: cheap\n"
+            )
+            (bundle_dir / "outer.yaml").write_text("rules:\n  - include: inner.yaml\n")
+            schema_path = Path(tmp_dir) / "schema.yaml"
+            schema_path.write_text("rules:\n  - include: bundles/outer.yaml\n")
+            
+            assert load_schema(schema_path)["rules"] == [
+                {"keyword_must_not_include": "cheap"}
+            ]
+            
+            # Change a transitively included bundle only
+            self._touch(
+                str(bundle_dir / "inner.yaml"),
+                "rules:\n  - keyword_must_not_include: defective\n"
+            )
+            
+            assert load_schema(schema_path)["rules"] == [
+                {"keyword_must_not_include": "defective"}
+            ]
+    
+    def test_validate_output_reuses_cache(self):
+        """Test that validate_output benefits from the cache."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            schema_path = Path(tmp_dir) / "schema.yaml"
+            schema_path.write_text("rules:\n  - keyword_must_include: quality\n")
+            
+            for _ in range(3):
+                assert validate_output("quality", schema_path).is_valid is True
+            
+            info = schema_cache_info()
+            assert info.misses == 1
+            assert info.hits == 2
+    
+    def test_lru_eviction(self):
+        """Test that the least recently used schema is evicted."""
+        configure_schema_cache(2)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = []
+            for name in ("a", "b", "c"):
+                path = Path(tmp_dir) / f"{name}.yaml"
+                path.write_text(f"rules:\n  - keyword_must_include: {name}\n")
+                paths.append(path)
+            
+            load_schema(paths[0])
+            load_schema(paths[1])
+            load_schema(paths[0])  # a is now most recently used
+            load_schema(paths[2])  # evicts b
+            load_schema(paths[0])
+            
+            info = schema_cache_info()
+            assert info.evictions == 1
+            assert info.currsize == 2
+            assert info.maxsize == 2
+            assert info.hits == 2
+    
+    def test_cache_disabled(self):
+        """Test that a maxsize of zero disables caching."""
+        configure_schema_cache(0)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            schema_path = Path(tmp_dir) / "schema.yaml"
+            schema_path.write_text("rules:\n  - keyword_must_include: quality\n")
+            
+            load_schema(schema_path)
+            load_schema(schema_path)
+            
+            info = schema_cache_info()
+            assert info.hits == 0
+            assert info.misses == 2
+            assert info.currsize == 0
+    
+    def test_invalid_maxsize(self):
+        """Test that negative cache sizes are rejected."""
+        with pytest.raises(ValueError):
+            configure_schema_cache(-1)
+
+
+class TestInMemorySchemas:
+    """Test parsing schemas that never touch disk."""
+    
+    SCHEMA_YAML = (
+        "schema:\n"
+        "  type: object\n"
+        "  required: [name]\n"
+        "rules:\n"
+        "  - include: common.yaml\n"
+        "  - keyword_must_include: quality\n"
+    )
+    
+    def test_parse_yaml_text(self):
+        """Test that YAML text is parsed like a schema file."""
+        schema = parse_schema("rules:\n  - keyword_must_include: quality\n")
+        
+        assert schema == {"rules": [{"keyword_must_include": "quality"}]}
+    
+    def test_parse_dict_is_copied(self):
+        """Test that a schema dictionary is never modified."""
+        original = {"rules": [{"include": "common.yaml"}]}
+        
+        schema = parse_schema(
+            original, bundles={"common.yaml": {"rules": [{"min_length": 5}]}}
+        )
+        
+        assert schema["rules"] == [{"min_length": 5}]
+        assert original == {"rules": [{"include": "common.yaml"}]}
+    
+    def test_bundles_from_registry(self):
+        """Test that includes are resolved from in-memory bundles, recursively."""
+        bundles = {
+            "common.yaml": "rules:\n  - include: base.yaml\n  - min_length: 5\n",
+            "base.yaml": {"rules": [{"keyword_must_not_include": ["cheap"]}]},
+        }
+        
+        schema = parse_schema(self.SCHEMA_YAML, bundles=bundles)
+        
+        assert schema["rules"] == [
+            {"keyword_must_not_include": ["cheap"]},
+            {"min_length": 5},
+            {"keyword_must_include": "quality"},
+        ]
+    
+    def test_bundles_from_base_dir(self):
+        """Test that includes are read relative to base_dir."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            Path(tmp_dir, "common.yaml").write_text("rules:\n  - min_length: 5\n")
+            
+            schema = parse_schema(self.SCHEMA_YAML, base_dir=tmp_dir)
+        
+        assert schema["rules"] == [{"min_length": 5}, {"keyword_must_include": "quality"}]
+    
+    def test_unresolvable_include(self):
+        """Test that an include without base_dir or bundles is an error."""
+        with pytest.raises(SchemaError, match="base_dir or bundles"):
+            parse_schema(self.SCHEMA_YAML)
+    
+    def test_invalid_yaml_text(self):
+        """Test that invalid YAML text raises SchemaError."""
+        with pytest.raises(SchemaError, match="Invalid YAML"):
+            parse_schema("rules:\n  - [unclosed\n")
+    
+    def test_non_dictionary(self):
+        """Test that YAML text must hold a dictionary."""
+        with pytest.raises(SchemaError, match="must be a dictionary"):
+            parse_schema("- just\n- a list\n")
+    
+    def test_not_cached(self):
+        """Test that in-memory schemas bypass the schema cache."""
+        clear_schema_cache()
+        
+        parse_schema({"rules": []})
+        
+        info = schema_cache_info()
+        assert info.hits == info.misses == info.currsize == 0
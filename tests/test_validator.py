@@ -1,13 +1,24 @@
 """Tests for the validator module."""
 
+import asyncio
 import json
+import pickle
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any
+from unittest.mock import patch
 
 import pytest
 
-from llm_contracts.core.validator import validate_output, ValidationError, ValidationResult
+from llm_contracts import Violation, contracts, validate_jsonl
+from llm_contracts.core.schema import SchemaError, clear_schema_cache, schema_cache_info
+from llm_contracts.core.validator import (
+    Contract,
+    validate_output,
+    ValidationError,
+    ValidationResult,
+)
 
 
 class TestValidationResult:
@@ -30,6 +41,137 @@ class TestValidationResult:
         
         result = ValidationResult(False, ["Error"])
         assert bool(result) is False
+    
+    def test_plain_messages_become_custom_violations(self):
+        """Test that string errors are kept as violations with code 'custom'."""
+        result = ValidationResult(False, ["Error 1"])
+        
+        assert [v.code for v in result.violations] == ["custom"]
+        assert result.violations[0].message == "Error 1"
+    
+    def test_rule_violations_are_structured(self):
+        """Test that rule failures carry their code, rule index and type."""
+        contract = Contract({
+            "rules": [
+                {"keyword_must_include": "quality"},
+                {"keyword_must_not_include": ["cheap"]},
+            ]
+        })
+        
+        result = contract.validate({"content": "A cheap thing"})
+        
+        missing, prohibited = result.violations
+        assert (missing.code, missing.rule_index, missing.rule_type) == (
+            "keyword_missing", 0, "keyword_must_include"
+        )
+        assert (prohibited.code, prohibited.rule_index) == ("keyword_prohibited", 1)
+        assert prohibited.params == {"keyword": "cheap"}
+        assert prohibited.path == ("content",)
+        assert prohibited.span == (2, 7)
+        assert result.errors[1] == (
+            "Prohibited keyword found: 'cheap'. Please remove or rephrase this content."
+        )
+    
+    def test_messages_render_lazily(self):
+        """Test that messages are only built when they are read."""
+        contract = Contract({"rules": [{"word_count_min": 5}]})
+        
+        violation = contract.validate("two words").violations[0]
+        
+        assert violation._message is None
+        assert str(violation) == "Word count (2) below minimum (5)"
+        assert violation._message == "Word count (2) below minimum (5)"
+    
+    def test_schema_violations_carry_path(self):
+        """Test that JSON schema failures record the path of the failing value."""
+        contract = Contract({
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "items": {"type": "array", "items": {"type": "string"}}
+                },
+            }
+        })
+        
+        violation = contract.validate({"items": ["a", 5]}).violations[0]
+        
+        assert violation.code == "schema"
+        assert violation.rule_type == "schema"
+        assert violation.rule_index is None
+        assert violation.path == ("items", 1)
+        assert violation.params["keyword"] == "type"
+    
+    def test_result_round_trips_through_pickle(self):
+        """Test that results and violations pickle for worker processes."""
+        contract = Contract({"rules": [{"keyword_must_include": "quality"}]})
+        result = contract.validate("nothing here")
+        
+        restored = pickle.loads(pickle.dumps(result))
+        
+        assert restored.is_valid is False
+        assert restored.violations == result.violations
+        assert restored.errors == result.errors
+    
+    def test_errors_can_be_changed_in_place(self):
+        """Test that errors is a real list kept in step with violations."""
+        result = ValidationResult(False, ["a"])
+        
+        result.errors.append("b")
+        result.errors += ["c"]
+        
+        assert result.errors == ["a", "b", "c"]
+        assert [v.message for v in result.violations] == ["a", "b", "c"]
+        assert result.errors is result.errors
+    
+    def test_structured_violations_survive_error_edits(self):
+        """Test that editing errors keeps the violations behind unchanged messages."""
+        contract = Contract({"rules": [{"keyword_must_include": "quality"}]})
+        result = contract.validate("nothing here")
+        original = result.violations[0]
+        
+        result.errors.append("Reviewer rejected the tone")
+        
+        assert result.violations[0] is original
+        assert result.violations[1].code == "custom"
+        
+        result.violations.pop()
+        assert result.errors == [original.message]
+    
+    def test_results_accept_new_attributes(self):
+        """Test that callers can annotate results, and the notes are pickled."""
+        result = ValidationResult(True, [])
+        
+        result.source_file = "output.json"
+        
+        assert pickle.loads(pickle.dumps(result)).source_file == "output.json"
+    
+    def test_strict_error_exposes_violations(self):
+        """Test that the strict-mode exception carries the violations."""
+        contract = Contract({
+            "strict": True, "rules": [{"keyword_must_include": "quality"}]
+        })
+        
+        with pytest.raises(ValidationError) as exc_info:
+            contract.validate("nothing here")
+        
+        assert [v.code for v in exc_info.value.violations] == ["keyword_missing"]
+        assert exc_info.value.errors == [exc_info.value.violations[0].message]
+    
+    def test_violation_to_dict(self):
+        """Test the JSON-serializable form of a violation."""
+        violation = Violation(
+            "placeholder_text", ("TODO",), (4, 8),
+            rule_index=2, rule_type="no_placeholder_text"
+        )
+        
+        assert violation.to_dict() == {
+            "code": "placeholder_text",
+            "message": "Contains placeholder text: 'TODO'",
+            "rule_index": 2,
+            "rule_type": "no_placeholder_text",
+            "path": [],
+            "span": [4, 8],
+        }
 
 
 class TestValidateOutput:
@@ -284,4 +426,833 @@ class TestValidateOutput:
             assert result.is_valid is False
             assert len(result.errors) > 0
         finally:
-            Path(schema_path).unlink() 
\ No newline at end of file
+            Path(schema_path).unlink()
+
+
+class TestContract:
+    """Test compiled Contract objects."""
+    
+    def _write_schema(self, schema: Dict[str, Any]) -> str:
+        import yaml
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump(schema, f)
+            return f.name
+    
+    def test_compile_and_validate(self):
+        """Test compiling a schema once and validating several outputs."""
+        schema_path = self._write_schema({
+            "schema": {
+                "type": "object",
+                "properties": {"name": {"type": "string"}},
+                "required": ["name"]
+            },
+            "rules": [{"keyword_must_include": "quality"}]
+        })
+        
+        try:
+            contract = Contract.compile(schema_path)
+            
+            result = contract.validate({"name": "Quality widget"})
+            assert result.is_valid is True
+            
+            result = contract.validate('{"title": "Cheap widget"}')
+            assert result.is_valid is False
+            assert len(result.errors) == 2
+        finally:
+            Path(schema_path).unlink()
+    
+    def test_contract_matches_validate_output(self):
+        """Test that a compiled contract reports the same errors as validate_output."""
+        schema_path = self._write_schema({
+            "rules": [
+                {"keyword_must_not_include": ["cheap", "defective"]},
+                {"word_count_min": 5}
+            ]
+        })
+        
+        try:
+            contract = Contract.compile(schema_path)
+            output = "A cheap product"
+            assert contract.validate(output).errors == validate_output(output, schema_path).errors
+        finally:
+            Path(schema_path).unlink()
+    
+    def test_contract_does_not_reread_schema(self):
+        """Test that a compiled contract keeps working after the file is gone."""
+        schema_path = self._write_schema({"rules": [{"keyword_must_include": "quality"}]})
+        
+        contract = Contract.compile(schema_path)
+        Path(schema_path).unlink()
+        
+        assert contract.validate("quality content").is_valid is True
+        assert contract.validate("other content").is_valid is False
+    
+    def test_contract_is_isolated_from_source_dict(self):
+        """Test that mutating the source dict does not affect the contract."""
+        schema = {"rules": [{"keyword_must_include": "quality"}]}
+        contract = Contract(schema)
+        
+        schema["rules"].append({"keyword_must_include": "premium"})
+        contract.schema["rules"].append({"keyword_must_include": "premium"})
+        
+        assert contract.validate("quality content").is_valid is True
+    
+    def test_contract_strict_mode(self):
+        """Test that strict contracts raise on failure."""
+        contract = Contract({"strict": True, "rules": [{"keyword_must_include": "quality"}]})
+        
+        assert contract.strict is True
+        with pytest.raises(ValidationError) as exc_info:
+            contract.validate("other content")
+        assert len(exc_info.value.errors) == 1
+    
+    def test_compile_missing_file(self):
+        """Test compiling a nonexistent schema file."""
+        with pytest.raises(SchemaError):
+            Contract.compile("nonexistent.yaml")
+    
+    def test_contract_requires_dict(self):
+        """Test that non-dictionary schemas are rejected."""
+        with pytest.raises(SchemaError):
+            Contract(["not", "a", "dict"])
+    
+    def test_json_schema_compiled_once(self):
+        """Test that the JSON schema validator is built at compile time only."""
+        contract = Contract({
+            "schema": {
+                "type": "object",
+                "properties": {"age": {"type": "integer"}},
+                "required": ["age"]
+            }
+        })
+        
+        with patch(
+            "llm_contracts.core.validator.validator_for",
+            side_effect=AssertionError("validator rebuilt")
+        ):
+            assert contract.validate({"age": 3}).is_valid is True
+            result = contract.validate({"age": "3"})
+        
+        assert result.errors == ["Schema validation failed: '3' is not of type 'integer'"]
+    
+    def test_invalid_json_schema_reported_per_validation(self):
+        """Test that an invalid JSON schema is reported on each validation."""
+        contract = Contract({"schema": {"type": "str"}})
+        
+        for _ in range(2):
+            result = contract.validate("text")
+            assert result.is_valid is False
+            assert result.errors[0].startswith("Unexpected validation error:")
+    
+    def test_from_schema_expands_bundles(self):
+        """Test compiling YAML text whose includes come from memory."""
+        contract = Contract.from_schema(
+            "rules:\n  - include: common.yaml\n",
+            bundles={"common.yaml": {"rules": [{"keyword_must_include": "quality"}]}},
+            all_errors=True
+        )
+        
+        assert contract.source is None
+        assert contract.all_errors is True
+        assert contract.validate("high quality").is_valid is True
+        assert contract.validate("low grade").is_valid is False
+    
+    def test_validate_output_in_memory_schema(self):
+        """Test validating against a schema dictionary directly."""
+        schema = {
+            "schema": {"type": "object", "required": ["name"]},
+            "rules": [{"keyword_must_include": "quality"}]
+        }
+        
+        assert validate_output({"name": "quality"}, schema).is_valid is True
+        assert validate_output({"title": "quality"}, schema).is_valid is False
+        assert contracts.validate({"name": "quality"}, schema).is_valid is True
+    
+    def test_strings_are_always_paths(self):
+        """Test that YAML text isn't guessed from a string's contents."""
+        text = "{schema: {type: object}}"
+        
+        with pytest.raises(ValidationError, match="not found"):
+            validate_output({}, text)
+        assert Contract.from_schema(text).validate({}).is_valid is True
+    
+    def test_in_memory_schema_errors(self):
+        """Test that unusable in-memory schemas are reported as setup errors."""
+        with pytest.raises(ValidationError, match="Validation setup failed"):
+            validate_output("text", {"rules": [{"include": "common.yaml"}]})
+        with pytest.raises(ValidationError, match="Validation setup failed"):
+            validate_output("text", {"rules": ["not a rule"]})
+
+
+class TestErrorReportingModes:
+    """Test all-errors and fail-fast validation modes."""
+    
+    SCHEMA = {
+        "schema": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "age": {"type": "integer"},
+                "tags": {"type": "array", "items": {"type": "string"}}
+            },
+            "required": ["name", "age"]
+        },
+        "rules": [
+            {"keyword_must_include": "quality"},
+            {"word_count_min": 3}
+        ]
+    }
+    
+    OUTPUT = {"name": 5, "age": "old", "tags": ["ok", 7]}
+    
+    def test_default_reports_one_schema_error(self):
+        """Test that the default mode keeps a single schema error."""
+        result = Contract(self.SCHEMA).validate(self.OUTPUT)
+        
+        schema_errors = [e for e in result.errors if e.startswith("Schema validation failed")]
+        assert len(schema_errors) == 1
+        assert len(result.errors) == 3
+    
+    def test_all_errors_reports_every_violation_with_path(self):
+        """Test that all_errors reports each violation with a JSON pointer."""
+        result = Contract(self.SCHEMA).validate(self.OUTPUT, all_errors=True)
+        
+        schema_errors = [e for e in result.errors if e.startswith("Schema validation failed")]
+        assert "Schema validation failed at /name: 5 is not of type 'string'" in schema_errors
+        assert "Schema validation failed at /age: 'old' is not of type 'integer'" in schema_errors
+        assert "Schema validation failed at /tags/1: 7 is not of type 'string'" in schema_errors
+        assert len(schema_errors) == 3
+    
+    def test_fail_fast_stops_at_first_error(self):
+        """Test that fail_fast skips everything after the first error."""
+        result = Contract(self.SCHEMA).validate(self.OUTPUT, fail_fast=True)
+        
+        assert result.is_valid is False
+        assert len(result.errors) == 1
+        assert result.errors[0].startswith("Schema validation failed")
+    
+    def test_fail_fast_rules(self):
+        """Test that fail_fast stops at the first failing rule."""
+        result = Contract(self.SCHEMA).validate(
+            {"name": "x", "age": 1}, fail_fast=True
+        )
+        
+        assert result.errors == [
+            "Missing required keyword: 'quality'. Please include this term in your content."
+        ]
+    
+    def test_contract_defaults_and_per_call_override(self):
+        """Test that per-contract defaults can be overridden per call."""
+        contract = Contract(self.SCHEMA, all_errors=True)
+        
+        assert contract.all_errors is True
+        assert len(contract.validate(self.OUTPUT).errors) == 5
+        assert len(contract.validate(self.OUTPUT, all_errors=False).errors) == 3
+        assert len(contract.with_options(fail_fast=True).validate(self.OUTPUT).errors) == 1
+    
+    def test_modes_from_schema_file(self):
+        """Test that schema files can enable the modes and callers can select them."""
+        import yaml
+        schema = dict(self.SCHEMA, fail_fast=True)
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump(schema, f)
+            schema_path = f.name
+        
+        try:
+            assert len(validate_output(self.OUTPUT, schema_path).errors) == 1
+            assert len(validate_output(self.OUTPUT, schema_path, fail_fast=False).errors) == 3
+            assert Contract.compile(schema_path).fail_fast is True
+            assert Contract.compile(schema_path, fail_fast=False).fail_fast is False
+        finally:
+            Path(schema_path).unlink()
+
+
+class TestValidateMany:
+    """Test batch validation against one contract."""
+    
+    def _write_schema(self, schema: Dict[str, Any]) -> str:
+        import yaml
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump(schema, f)
+            return f.name
+    
+    def test_results_in_order(self):
+        """Test that results come back in input order."""
+        schema_path = self._write_schema({"rules": [{"keyword_must_include": "quality"}]})
+        
+        try:
+            outputs = ["quality", "cheap", '{"text": "Quality"}', {"text": "nope"}]
+            results = list(contracts.validate_many(outputs, schema_path))
+            
+            assert [r.is_valid for r in results] == [True, False, True, False]
+        finally:
+            Path(schema_path).unlink()
+    
+    def test_schema_loaded_once(self):
+        """Test that the schema is loaded once for the whole batch."""
+        schema_path = self._write_schema({"rules": [{"word_count_min": 2}]})
+        clear_schema_cache()
+        
+        try:
+            results = list(contracts.validate_many(["one two"] * 50, schema_path))
+            
+            assert all(results)
+            assert schema_cache_info().misses == 1
+            assert schema_cache_info().hits == 0
+        finally:
+            Path(schema_path).unlink()
+    
+    def test_lazy_generator(self):
+        """Test that outputs are consumed lazily."""
+        contract = Contract({"rules": [{"keyword_must_include": "quality"}]})
+        consumed = []
+        
+        def outputs():
+            for text in ["quality", "cheap", "quality"]:
+                consumed.append(text)
+                yield text
+        
+        results = contracts.validate_many(outputs(), contract)
+        assert consumed == []
+        
+        assert next(results).is_valid is True
+        assert consumed == ["quality"]
+    
+    def test_missing_schema_fails_eagerly(self):
+        """Test that schema errors surface before any output is validated."""
+        with pytest.raises(ValidationError):
+            contracts.validate_many(["x"], "nonexistent.yaml")
+    
+    def test_strict_contract_raises(self):
+        """Test that strict contracts raise on the first failing output."""
+        contract = Contract({"strict": True, "rules": [{"keyword_must_include": "quality"}]})
+        results = contract.validate_many(["quality", "cheap"])
+        
+        assert next(results).is_valid is True
+        with pytest.raises(ValidationError):
+            next(results)
+
+
+class TestParallelValidation:
+    """Test batch validation in a worker pool."""
+    
+    SCHEMA = {
+        "schema": {"type": "object", "required": ["text"]},
+        "rules": [{"keyword_must_include": "quality"}, {"word_count_max": 5}]
+    }
+    
+    def _outputs(self):
+        return [
+            {"text": "quality"},
+            {"text": "cheap"},
+            {"other": 1},
+            {"text": "quality " * 10},
+        ] * 25
+    
+    @pytest.mark.parametrize("executor", ["process", "thread"])
+    def test_matches_sequential(self, executor):
+        """Test that parallel results equal sequential results, in order."""
+        contract = Contract(self.SCHEMA)
+        expected = list(contract.validate_many(self._outputs()))
+        
+        results = list(contract.validate_many(
+            self._outputs(), workers=2, executor=executor, chunksize=7
+        ))
+        
+        assert [r.is_valid for r in results] == [r.is_valid for r in expected]
+        assert [r.errors for r in results] == [r.errors for r in expected]
+    
+    def test_contracts_validate_many_workers(self):
+        """Test that the module-level API forwards pool options."""
+        contract = Contract(self.SCHEMA)
+        results = list(contracts.validate_many(
+            self._outputs(), contract, workers=2, executor="thread", fail_fast=True
+        ))
+        
+        assert len(results) == 100
+        assert all(len(r.errors) <= 1 for r in results)
+    
+    def test_contract_pickles(self):
+        """Test that a compiled contract survives a pickle round-trip."""
+        import pickle
+        
+        contract = Contract(self.SCHEMA, source="inline", all_errors=True)
+        restored = pickle.loads(pickle.dumps(contract))
+        
+        assert restored.source == "inline"
+        assert restored.all_errors is True
+        assert restored.schema == contract.schema
+        assert restored.validate({"text": "cheap"}).errors == \
+            contract.validate({"text": "cheap"}).errors
+    
+    def test_invalid_arguments_fail_eagerly(self):
+        """Test that bad pool arguments raise before any output is read."""
+        contract = Contract(self.SCHEMA)
+        
+        with pytest.raises(ValueError):
+            contract.validate_many([], workers=2, executor="fork")
+        with pytest.raises(ValueError):
+            contract.validate_many([], workers=0)
+        with pytest.raises(ValueError):
+            contract.validate_many([], workers=2, chunksize=0)
+    
+    def test_strict_raises_in_caller(self):
+        """Test that strict mode raises with the failing output's errors."""
+        contract = Contract({"strict": True, "rules": [{"keyword_must_include": "quality"}]})
+        results = contract.validate_many(
+            ["quality", "cheap"], workers=2, executor="thread", chunksize=1
+        )
+        
+        assert next(results).is_valid is True
+        with pytest.raises(ValidationError) as exc_info:
+            next(results)
+        assert exc_info.value.errors
+
+
+class TestValidateJSONL:
+    """Test validating the records of a JSON Lines file."""
+    
+    def _write_jsonl(self, tmp_path: Path, lines) -> Path:
+        path = tmp_path / "outputs.jsonl"
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return path
+    
+    def test_records_validated_in_order(self, tmp_path):
+        """Test that each non-blank line is one result, in file order."""
+        contract = Contract({"rules": [{"keyword_must_include": "quality"}]})
+        path = self._write_jsonl(tmp_path, [
+            '"quality text"', '', '{"text": "cheap"}', '{"text": "Quality"}'
+        ])
+        
+        results = list(contracts.validate_jsonl(path, contract))
+        
+        assert [r.is_valid for r in results] == [True, False, True]
+    
+    def test_field_extraction(self, tmp_path):
+        """Test that the output is read from a nested field of each record."""
+        contract = Contract({
+            "schema": {"type": "object", "required": ["name"]}
+        })
+        path = self._write_jsonl(tmp_path, [
+            '{"id": 1, "choices": [{"output": {"name": "A"}}]}',
+            '{"id": 2, "choices": [{"output": {}}]}',
+        ])
+        
+        results = list(contracts.validate_jsonl(path, contract, field="choices.0.output"))
+        
+        assert [r.is_valid for r in results] == [True, False]
+        assert results[1].violations[0].code == "schema"
+    
+    def test_bad_records_fail_without_stopping(self, tmp_path):
+        """Test that invalid JSON and missing fields are reported per line."""
+        contract = Contract({"rules": [{"word_count_min": 1}]})
+        path = self._write_jsonl(tmp_path, [
+            'not json', '{"other": "x"}', '{"output": "fine"}'
+        ])
+        
+        results = list(contracts.validate_jsonl(path, contract, field="output"))
+        
+        assert [r.violations[0].code for r in results[:2]] == [
+            "invalid_record", "record_field_missing"
+        ]
+        assert results[0].errors[0].startswith("Line 1 is not valid JSON")
+        assert results[1].errors == ["Line 2 has no field 'output'"]
+        assert results[2].is_valid is True
+    
+    def test_empty_file_and_unterminated_last_line(self, tmp_path):
+        """Test files the memory map can't hold and a final line without newline."""
+        contract = Contract({"rules": [{"word_count_min": 1}]})
+        empty = tmp_path / "empty.jsonl"
+        empty.write_bytes(b"")
+        unterminated = tmp_path / "unterminated.jsonl"
+        unterminated.write_bytes(b'"one"\r\n"two"')
+        
+        assert list(contracts.validate_jsonl(empty, contract)) == []
+        assert [r.is_valid for r in contracts.validate_jsonl(unterminated, contract)] == [
+            True, True
+        ]
+    
+    def test_pages_released_while_reading(self, tmp_path):
+        """Test that releasing mapped pages behind the scan loses no lines."""
+        contract = Contract({"rules": [{"keyword_must_include": "quality"}]})
+        path = self._write_jsonl(
+            tmp_path, [json.dumps("quality " * (i % 700)) for i in range(200)]
+        )
+        
+        with patch("llm_contracts.utils.mapped_lines.RELEASE_INTERVAL", 4096):
+            results = list(contracts.validate_jsonl(path, contract))
+        
+        assert [r.is_valid for r in results] == [i % 700 > 0 for i in range(200)]
+    
+    def test_invalid_utf8_fails_one_record(self, tmp_path):
+        """Test that bytes that aren't UTF-8 fail only their own line."""
+        contract = Contract({"rules": [{"word_count_min": 1}]})
+        path = tmp_path / "outputs.jsonl"
+        path.write_bytes(b'"caf\xe9"\n"caf\xc3\xa9"\n')
+        
+        results = list(contracts.validate_jsonl(path, contract))
+        
+        assert results[0].violations[0].code == "invalid_record"
+        assert results[1].is_valid is True
+    
+    def test_parallel_matches_serial(self, tmp_path):
+        """Test that worker pools give the same results in the same order."""
+        contract = Contract({"rules": [{"keyword_must_not_include": "cheap"}]})
+        path = self._write_jsonl(
+            tmp_path, [json.dumps("cheap" if i % 3 else "fine") for i in range(50)]
+        )
+        
+        serial = [r.errors for r in contracts.validate_jsonl(path, contract)]
+        parallel = [
+            r.errors for r in contracts.validate_jsonl(
+                path, contract, workers=2, executor="thread", chunksize=4
+            )
+        ]
+        
+        assert parallel == serial
+    
+    def test_strict_contract_raises(self, tmp_path):
+        """Test that strict contracts raise on the first failing record."""
+        contract = Contract({"strict": True, "rules": [{"keyword_must_include": "quality"}]})
+        path = self._write_jsonl(tmp_path, ['"quality"', '"cheap"'])
+        results = validate_jsonl(path, contract)
+        
+        assert next(results).is_valid is True
+        with pytest.raises(ValidationError):
+            next(results)
+
+
+class TestAsyncValidation:
+    """Test the asyncio API."""
+    
+    class RecordingExecutor(ThreadPoolExecutor):
+        """Thread pool that counts submitted calls."""
+        
+        def __init__(self):
+            super().__init__(max_workers=1)
+            self.calls = 0
+        
+        def submit(self, *args, **kwargs):
+            self.calls += 1
+            return super().submit(*args, **kwargs)
+    
+    def _write_schema(self, schema: Dict[str, Any]) -> str:
+        import yaml
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump(schema, f)
+            return f.name
+    
+    def test_avalidate_path(self):
+        """Test async validation against a schema file loaded off-loop."""
+        schema_path = self._write_schema({"rules": [{"keyword_must_include": "quality"}]})
+        
+        try:
+            with self.RecordingExecutor() as executor:
+                result = asyncio.run(contracts.avalidate(
+                    "poor", schema_path, executor=executor
+                ))
+                assert executor.calls == 1  # schema loading only
+            
+            assert result.is_valid is False
+            assert result.errors == validate_output("poor", schema_path).errors
+        finally:
+            Path(schema_path).unlink()
+    
+    def test_small_outputs_validated_inline(self):
+        """Test that a compiled contract and small output never leave the loop."""
+        contract = Contract({"rules": [{"keyword_must_include": "quality"}]})
+        
+        with self.RecordingExecutor() as executor:
+            result = asyncio.run(contracts.avalidate(
+                "quality", contract, executor=executor
+            ))
+            assert executor.calls == 0
+        assert result.is_valid is True
+    
+    def test_large_outputs_offloaded(self):
+        """Test that outputs over the threshold are validated in the executor."""
+        contract = Contract({"rules": [{"keyword_must_include": "quality"}]})
+        
+        async def run(executor):
+            text = await contracts.avalidate(
+                "quality " * 20, contract, offload_threshold=100, executor=executor
+            )
+            parsed = await contracts.avalidate(
+                {"items": ["quality " * 20]}, contract,
+                offload_threshold=100, executor=executor
+            )
+            small = await contracts.avalidate(
+                {"items": ["quality"]}, contract, offload_threshold=100, executor=executor
+            )
+            return text, parsed, small
+        
+        with self.RecordingExecutor() as executor:
+            results = asyncio.run(run(executor))
+            assert executor.calls == 2
+        assert all(result.is_valid for result in results)
+    
+    def test_strict_raises(self):
+        """Test that strict contracts raise from offloaded validation."""
+        contract = Contract({"strict": True, "rules": [{"keyword_must_include": "quality"}]})
+        
+        with pytest.raises(ValidationError):
+            asyncio.run(contracts.avalidate("poor", contract, offload_threshold=0))
+    
+    def test_missing_schema(self):
+        """Test that schema setup errors surface as ValidationError."""
+        with pytest.raises(ValidationError):
+            asyncio.run(contracts.avalidate("x", "nonexistent.yaml"))
+    
+    def test_avalidate_many(self):
+        """Test async batch validation over sync and async iterables."""
+        contract = Contract({"rules": [{"keyword_must_include": "quality"}]})
+        outputs = ["quality", "cheap", {"text": "Quality"}]
+        
+        async def agen():
+            for output in outputs:
+                yield output
+        
+        async def collect(source):
+            return [r.is_valid async for r in contracts.avalidate_many(source, contract)]
+        
+        assert asyncio.run(collect(outputs)) == [True, False, True]
+        assert asyncio.run(collect(agen())) == [True, False, True]
+
+
+class TestStreamValidation:
+    """Test incremental validation of streamed output."""
+    
+    def _feed_all(self, stream, text, size=3):
+        errors = []
+        for i in range(0, len(text), size):
+            errors = stream.feed(text[i:i + size])
+        return errors
+    
+    def test_prohibited_keyword_across_chunks(self):
+        """Test that a keyword split across chunks is caught before the end."""
+        contract = Contract({"rules": [{"keyword_must_not_include": ["cheap", "defective"]}]})
+        stream = contract.stream()
+        
+        assert stream.feed("This is a ch") == []
+        errors = stream.feed("EAP product and")
+        
+        assert errors == ["Prohibited keyword found: 'cheap'. Please remove or rephrase this content."]
+        assert stream.failed is True
+    
+    def test_placeholder_and_word_count(self):
+        """Test placeholder and word count limits fail early."""
+        contract = Contract({"rules": [
+            {"no_placeholder_text": r"\[.*?\]"},
+            {"word_count_max": 5},
+        ]})
+        
+        stream = contract.stream()
+        assert stream.feed("Dear [NAME], ") == ["Contains placeholder text: '\\[.*?\\]'"]
+        
+        stream = contract.stream()
+        errors = self._feed_all(stream, "one two three four five six seven")
+        assert any("above maximum (5)" in error for error in errors)
+    
+    def test_violations_match_batch_validation(self):
+        """Test that stream failures are the same violations a batch run reports."""
+        contract = Contract({"rules": [
+            {"word_count_max": 3},
+            {"no_placeholder_text": r"\[.*?\]"},
+            {"keyword_must_not_include": ["cheap"]},
+        ]})
+        text = "Dear [NAME], a cheap offer for you"
+        
+        stream = contract.stream()
+        stream.feed(text)
+        streamed = {v.rule_index: v for v in stream.violations}
+        batch = {v.rule_index: v for v in contract.validate(text, all_errors=True).violations}
+        
+        assert sorted(streamed) == [0, 1, 2]
+        assert stream.errors == [v.message for v in stream.violations]
+        for index in (1, 2):
+            assert streamed[index].code == batch[index].code
+            assert streamed[index].args == batch[index].args
+            assert streamed[index].rule_type == batch[index].rule_type
+            assert streamed[index].message == batch[index].message
+        assert streamed[1].span == batch[1].span
+        assert streamed[0].code == "word_count_above_so_far"
+        assert streamed[0].message == "Word count (at least 7) above maximum (3)"
+    
+    @pytest.mark.parametrize("parser", [None, object()])
+    def test_patterns_wait_for_finish_without_regex_parser(self, parser):
+        """Test that patterns are left to finish() if the regex parser is unusable."""
+        contract = Contract({"rules": [
+            {"no_placeholder_text": r"\[NAME\]"},
+            {"section_must_start_with": "^summary:"},
+            {"keyword_must_not_include": ["cheap"]},
+        ]})
+        
+        with patch("llm_contracts.core.streaming._sre_parser", parser):
+            stream = contract.stream()
+            errors = stream.feed("Dear [NAME], a cheap offer")
+            result = stream.finish()
+        
+        assert errors == [
+            "Prohibited keyword found: 'cheap'. Please remove or rephrase this content."
+        ]
+        assert len(result.errors) == 3
+    
+    def test_section_must_start_with(self):
+        """Test that the opening is checked once enough text has arrived."""
+        contract = Contract({"rules": [{"section_must_start_with": "^summary:"}]})
+        
+        stream = contract.stream()
+        assert stream.feed("  Sum") == []
+        assert stream.feed("mary: all good") == []
+        
+        stream = contract.stream()
+        assert stream.feed("Intro") == []
+        assert stream.feed("duction and more") == ["Content must start with pattern: '^summary:'"]
+    
+    def test_no_false_positives_at_chunk_end(self):
+        """Test that matches depending on the next character wait for it."""
+        contract = Contract({"rules": [{"no_placeholder_text": r"\bTODO\b"}]})
+        stream = contract.stream()
+        
+        assert stream.feed("see TODO") == []
+        assert stream.feed("S here") == []
+        assert stream.finish().is_valid is True
+    
+    def test_json_output_left_to_finish(self):
+        """Test that text rules aren't applied early to JSON output."""
+        contract = Contract({"rules": [{"keyword_must_not_include": "cheap"}]})
+        stream = contract.stream()
+        
+        assert self._feed_all(stream, '{"title": "cheap", "text": "fine"}') == []
+        assert stream.finish().is_valid is True
+    
+    def test_finish_matches_validate(self):
+        """Test that finish() gives the same result as validating the whole text."""
+        contract = Contract({"rules": [
+            {"keyword_must_include": "quality"},
+            {"keyword_must_not_include": ["cheap"]},
+            {"word_count_max": 4},
+        ]})
+        text = "a cheap and nasty product with no redeeming features"
+        
+        stream = contract.stream()
+        self._feed_all(stream, text)
+        
+        assert stream.finish().errors == contract.validate(text).errors
+        with pytest.raises(ValueError):
+            stream.feed("more")
+    
+    def test_strict_raises_on_feed(self):
+        """Test that strict contracts raise as soon as the output must fail."""
+        contract = Contract({"strict": True, "rules": [{"keyword_must_not_include": "cheap"}]})
+        stream = contract.stream()
+        
+        stream.feed("a fine ")
+        with pytest.raises(ValidationError):
+            stream.feed("but cheap product")
+
+
+class TestStreamJSONValidation:
+    """Test early JSON schema checks on streamed JSON output."""
+    
+    SCHEMA = {
+        "type": "object",
+        "properties": {
+            "sentiment": {"enum": ["positive", "negative"]},
+            "items": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {"id": {"type": "integer"}},
+                    "additionalProperties": False,
+                },
+            },
+        },
+        "required": ["sentiment"],
+    }
+    
+    def _feed_until_error(self, stream, text, size=4):
+        for i in range(0, len(text), size):
+            if stream.feed(text[i:i + size]):
+                return i + size
+        return None
+    
+    def test_wrong_type_reported_when_field_closes(self):
+        """Test that a bad field is reported long before the document ends."""
+        contract = Contract({"schema": self.SCHEMA})
+        items = [{"id": i} for i in range(100)]
+        items[3] = {"id": "3"}
+        text = json.dumps({"items": items, "sentiment": "positive"})
+        
+        stream = contract.stream()
+        stopped_at = self._feed_until_error(stream, text)
+        
+        assert stopped_at is not None and stopped_at < len(text) // 4
+        assert stream.errors == [
+            "Schema validation failed at /items/3/id: '3' is not of type 'integer'"
+        ]
+        assert contract.validate(text).is_valid is False
+    
+    def test_additional_property_reported_at_key(self):
+        """Test that a disallowed key is reported before its value arrives."""
+        contract = Contract({"schema": self.SCHEMA})
+        stream = contract.stream()
+        
+        assert stream.feed('{"items": [{"id": 1, "extra"') != []
+        assert "'extra' was unexpected" in stream.errors[0]
+    
+    def test_enum_mismatch(self):
+        """Test enum violations on scalar values."""
+        contract = Contract({"schema": self.SCHEMA})
+        stream = contract.stream()
+        
+        stream.feed('{"sentiment": "meh", ')
+        assert stream.errors == [
+            "Schema validation failed at /sentiment: 'meh' is not one of ['positive', 'negative']"
+        ]
+    
+    def test_valid_document(self):
+        """Test that a valid document streams without errors."""
+        contract = Contract({"schema": self.SCHEMA})
+        text = json.dumps({"sentiment": "negative", "items": [{"id": 1}, {"id": 2}]})
+        
+        stream = contract.stream()
+        assert self._feed_until_error(stream, text, size=1) is None
+        assert stream.finish().is_valid is True
+    
+    def test_conditional_subschemas_left_to_finish(self):
+        """Test that anyOf branches aren't applied to values early."""
+        contract = Contract({"schema": {
+            "type": "object",
+            "anyOf": [
+                {"properties": {"a": {"type": "string"}}},
+                {"properties": {"a": {"type": "integer"}}},
+            ],
+        }})
+        
+        stream = contract.stream()
+        assert self._feed_until_error(stream, '{"a": 1, "b": 2}') is None
+        assert stream.finish().is_valid is True
+    
+    def test_not_json(self):
+        """Test that text and broken JSON fail early against an object schema."""
+        contract = Contract({"schema": {"type": "object"}})
+        
+        stream = contract.stream()
+        assert stream.feed("Sorry, I can't") == [
+            "Schema validation failed: output is not JSON and is not of type 'object'"
+        ]
+        
+        stream = contract.stream()
+        assert stream.feed('{"a": 1,, ') == [
+            "Schema validation failed: invalid JSON at offset 8; output is not of type 'object'"
+        ]
+        assert stream.finish().is_valid is False
+    
+    def test_string_root_schema_not_checked_early(self):
+        """Test that schemas accepting strings wait for the full output."""
+        contract = Contract({"schema": {"type": ["object", "string"]}})
+        stream = contract.stream()
+        
+        assert stream.feed("{not json") == []
+        assert stream.finish().is_valid is True